@@ -0,0 +1,2 @@
+-- GET /api/accounts/me/
+-- 0 statements
@@ -0,0 +1,12 @@
+-- GET /api/accounts/list
+-- 2 statements
+
+-- [1]
+SELECT COUNT(*) AS "__count" FROM "users";
+-- plan:
+--   SCAN users USING COVERING INDEX sqlite_autoindex_users_1
+
+-- [2]
+SELECT "users"."password", "users"."last_login", "users"."is_superuser", "users"."id", "users"."created_at", "users"."updated_at", "users"."email", "users"."first_name", "users"."last_name", "users"."is_active", "users"."is_staff" FROM "users" LIMIT 2;
+-- plan:
+--   SCAN users
@@ -0,0 +1,27 @@
+"""Query snapshots for the accounts endpoints, recorded against the seeded catalog."""
+from __future__ import annotations
+
+import pytest
+from rest_framework.test import APIClient
+
+from cars.tests.helpers import SeededCatalog
+
+
+@pytest.mark.django_db
+class TestAccountQuerySnapshots:
+    """Each endpoint's SQL and plans should match its reviewed snapshot."""
+
+    @pytest.mark.parametrize(
+        "name, path",
+        [("current-user", "/api/accounts/me/"), ("user-list", "/api/accounts/list")],
+    )
+    def test_endpoint_queries(
+        self, api_client: APIClient, seeded_catalog: SeededCatalog, query_snapshot, name: str, path: str
+    ):
+        """Requests should run exactly the snapshotted statements with the snapshotted plans."""
+        api_client.force_authenticate(seeded_catalog.seller)
+
+        with query_snapshot(name, f"GET {path}"):
+            response = api_client.get(path)
+
+        assert response.status_code == 200
@@ -1,10 +1,54 @@
 from django.contrib import admin
+from django.core.exceptions import ValidationError
+from django.forms.models import BaseInlineFormSet
 
-from .models import Brand, Car, CarImage, Inquiry
+from .bulk import bulk_update_cars
+from .exports import inquiry_csv_response
+from .models import (
+    Brand,
+    Car,
+    CarCounter,
+    CarImage,
+    Inquiry,
+    ListingEvent,
+    OutboxCheckpoint,
+    OutboxDeadLetter,
+    SavedSearch,
+    SearchAlert,
+)
+
+
+class CarImageFormSet(BaseInlineFormSet):
+    """Allows moving the primary flag from one image to another in a single save."""
+
+    def clean(self) -> None:
+        super().clean()
+        primary = [
+            form
+            for form in self.forms
+            if form.cleaned_data.get("is_primary") and not self._should_delete_form(form)
+        ]
+        if len(primary) > 1:
+            raise ValidationError("Only one image can be primary.")
+
+    def save(self, commit: bool = True):
+        # car_image_one_primary is checked row by row, so clear the outgoing
+        # primary before the forms are saved in order.
+        incoming = [
+            form.instance.pk
+            for form in self.forms
+            if "is_primary" in form.changed_data and form.cleaned_data.get("is_primary")
+        ]
+        if commit and incoming and self.instance.pk:
+            CarImage.objects.filter(car=self.instance, is_primary=True).exclude(pk__in=incoming).update(
+                is_primary=False
+            )
+        return super().save(commit)
 
 
 class CarImageInline(admin.TabularInline):
     model = CarImage
+    formset = CarImageFormSet
     extra = 1
     fields = ["image_url", "alt_text", "is_primary", "sort_order"]
 
@@ -23,10 +67,33 @@ class CarAdmin(admin.ModelAdmin):
     search_fields = ["model", "brand__name", "description"]
     ordering = ["-created_at"]
     inlines = [CarImageInline]
+    raw_id_fields = ["seller"]
     fieldsets = [
-        (None, {"fields": ["brand", "model", "year", "price"]}),
+        (None, {"fields": ["brand", "model", "year", "price", "seller"]}),
         ("Details", {"fields": ["description", "status", "is_featured"]}),
+        ("Location", {"fields": ["country", "region", "latitude", "longitude"]}),
     ]
+    actions = ["activate_cars", "archive_cars", "feature_cars", "unfeature_cars"]
+
+    def run_bulk_action(self, request, queryset, action: str) -> None:
+        changed = bulk_update_cars(queryset.values_list("pk", flat=True), action)
+        self.message_user(request, f"{changed} car(s) updated.")
+
+    @admin.action(description="Activate selected cars")
+    def activate_cars(self, request, queryset):
+        self.run_bulk_action(request, queryset, "activate")
+
+    @admin.action(description="Archive selected cars")
+    def archive_cars(self, request, queryset):
+        self.run_bulk_action(request, queryset, "archive")
+
+    @admin.action(description="Feature selected cars")
+    def feature_cars(self, request, queryset):
+        self.run_bulk_action(request, queryset, "feature")
+
+    @admin.action(description="Unfeature selected cars")
+    def unfeature_cars(self, request, queryset):
+        self.run_bulk_action(request, queryset, "unfeature")
 
 
 @admin.register(CarImage)
@@ -39,13 +106,77 @@ class CarImageAdmin(admin.ModelAdmin):
 
 @admin.register(Inquiry)
 class InquiryAdmin(admin.ModelAdmin):
-    list_display = ["collector_name", "collector_email", "car", "created_at"]
+    list_display = ["collector_name", "collector_email", "car", "read_at", "created_at"]
     list_filter = ["created_at", "car__brand"]
     search_fields = ["collector_name", "collector_email", "car__model", "car__brand__name", "message"]
     ordering = ["-created_at"]
-    readonly_fields = ["created_at", "updated_at"]
+    readonly_fields = ["read_at", "created_at", "updated_at"]
     fieldsets = [
         ("Contact Information", {"fields": ["collector_name", "collector_email", "collector_phone"]}),
         ("Inquiry Details", {"fields": ["car", "message"]}),
-        ("Timestamps", {"fields": ["created_at", "updated_at"]}),
+        ("Timestamps", {"fields": ["read_at", "created_at", "updated_at"]}),
     ]
+    actions = ["export_csv"]
+
+    @admin.action(description="Export selected inquiries to CSV")
+    def export_csv(self, request, queryset):
+        # "Select all" hands over the whole filtered changelist (date and brand filters included)
+        return inquiry_csv_response(queryset)
+
+
+@admin.register(SavedSearch)
+class SavedSearchAdmin(admin.ModelAdmin):
+    list_display = ["__str__", "user", "brand", "year_min", "year_max", "max_price", "is_active", "created_at"]
+    list_filter = ["is_active", "brand"]
+    search_fields = ["name", "user__email"]
+    raw_id_fields = ["user"]
+
+
+@admin.register(SearchAlert)
+class SearchAlertAdmin(admin.ModelAdmin):
+    list_display = ["saved_search", "car", "created_at", "sent_at", "attempts"]
+    list_filter = ["sent_at"]
+    raw_id_fields = ["saved_search", "car"]
+    readonly_fields = ["created_at", "sent_at", "attempts", "last_error"]
+
+
+@admin.register(ListingEvent)
+class ListingEventAdmin(admin.ModelAdmin):
+    list_display = ["id", "topic", "action", "object_id", "car_id", "created_at"]
+    list_filter = ["topic", "action"]
+    search_fields = ["=object_id", "=car_id"]
+    readonly_fields = ["topic", "action", "object_id", "car_id", "data", "created_at"]
+
+
+@admin.register(OutboxCheckpoint)
+class OutboxCheckpointAdmin(admin.ModelAdmin):
+    list_display = ["name", "last_txid", "last_event_id", "failures", "updated_at"]
+    readonly_fields = ["last_error"]
+
+
+@admin.register(OutboxDeadLetter)
+class OutboxDeadLetterAdmin(admin.ModelAdmin):
+    list_display = ["id", "handler", "event_id", "topic", "action", "object_id", "attempts", "created_at"]
+    list_filter = ["handler", "topic"]
+    search_fields = ["=object_id", "=car_id"]
+    readonly_fields = [
+        "handler",
+        "event_id",
+        "txid",
+        "topic",
+        "action",
+        "object_id",
+        "car_id",
+        "data",
+        "error",
+        "attempts",
+        "created_at",
+    ]
+
+
+@admin.register(CarCounter)
+class CarCounterAdmin(admin.ModelAdmin):
+    list_display = ["car", "views", "inquiries", "folded_at"]
+    ordering = ["-views"]
+    raw_id_fields = ["car"]
+    readonly_fields = ["views", "inquiries", "folded_at"]
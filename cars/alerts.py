@@ -0,0 +1,242 @@
+"""
+Saved-search alerts.
+
+When a car goes active it is matched against saved searches through an
+in-process inverted index instead of running every search. Postings are
+keyed by (brand or any, decade or any) and sorted by price ceiling, so a
+car only visits searches for its brand and decade whose ceiling is at or
+above its price. The index loads once per process and then pulls
+changed searches by `updated_at` before each match. Deleted searches
+(including cascades from user deletes) have no row left to pull, so
+every RECONCILE_INTERVAL the index drops ids no longer active in the
+table, and a match drops any candidate the table no longer confirms.
+
+Activations reach `match_activated_cars` through the listing event
+outbox (`handle_listing_events`), off the request path. Matches are
+written to the SearchAlert outbox, which the `send_search_alerts`
+worker drains with `deliver_alerts`.
+"""
+from __future__ import annotations
+
+import bisect
+import logging
+import threading
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Iterable, NamedTuple
+
+from django.core.mail import send_mail
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Car, ListingEvent, SavedSearch, SearchAlert
+
+logger = logging.getLogger(__name__)
+
+ANY = None
+DECADE = 10
+MAX_DECADES = 5  # Wider year ranges are posted under "any year"
+SYNC_OVERLAP = timedelta(seconds=5)  # Re-read recent rows to cover commit lag
+RECONCILE_INTERVAL = timedelta(minutes=10)
+MAX_ATTEMPTS = 5
+CHUNK_SIZE = 5000
+
+
+class Posting(NamedTuple):
+    sort_key: tuple[int, Decimal]  # Highest price ceiling (or none) first
+    search_id: uuid.UUID
+    year_min: int | None
+    year_max: int | None
+    max_price: Decimal | None
+
+
+class SavedSearchIndex:
+    """Inverted index from (brand, decade) to the saved searches that could match."""
+
+    def __init__(self) -> None:
+        self._postings: dict[tuple, list[Posting]] = defaultdict(list)
+        self._keys: dict[uuid.UUID, list[tuple]] = {}
+        self.synced_at: datetime | None = None
+        self.reconciled_at: datetime | None = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def sync(self) -> None:
+        """
+        Load every active search on first use, then only the ones changed
+        since the last sync, dropping deleted ones every RECONCILE_INTERVAL.
+        """
+        with self._lock:
+            started = timezone.now()
+            if self.synced_at is None:
+                rows = SavedSearch.objects.filter(is_active=True)
+                self.reconciled_at = started
+            else:
+                rows = SavedSearch.objects.filter(updated_at__gte=self.synced_at - SYNC_OVERLAP)
+            for search_id, brand_id, year_min, year_max, max_price, is_active in rows.values_list(
+                "id", "brand_id", "year_min", "year_max", "max_price", "is_active"
+            ).iterator(chunk_size=CHUNK_SIZE):
+                self._discard(search_id)
+                if is_active:
+                    self._add(search_id, brand_id, year_min, year_max, max_price)
+            self.synced_at = started
+            if started - self.reconciled_at >= RECONCILE_INTERVAL:
+                active = SavedSearch.objects.filter(is_active=True).values_list("id", flat=True)
+                live = set(active.iterator(chunk_size=CHUNK_SIZE))
+                for search_id in self._keys.keys() - live:
+                    self._discard(search_id)
+                self.reconciled_at = started
+
+    def discard(self, search_ids: Iterable[uuid.UUID]) -> None:
+        """Drop searches known to be gone, without waiting for the next reconcile."""
+        with self._lock:
+            for search_id in search_ids:
+                self._discard(search_id)
+
+    def candidates(self, brand_id: uuid.UUID, year: int, price: Decimal) -> list[uuid.UUID]:
+        """Ids of searches matching a car with these attributes."""
+        decade = year // DECADE
+        matched = []
+        for key in ((brand_id, decade), (brand_id, ANY), (ANY, decade), (ANY, ANY)):
+            for posting in self._postings.get(key, ()):
+                if posting.max_price is not None and posting.max_price < price:
+                    break  # Sorted by ceiling, so every later posting is lower
+                if (posting.year_min is None or year >= posting.year_min) and (
+                    posting.year_max is None or year <= posting.year_max
+                ):
+                    matched.append(posting.search_id)
+        return matched
+
+    def _add(self, search_id, brand_id, year_min, year_max, max_price) -> None:
+        posting = Posting(
+            (0, Decimal(0)) if max_price is None else (1, -max_price),
+            search_id,
+            year_min,
+            year_max,
+            max_price,
+        )
+        keys = [(brand_id, decade) for decade in _decades(year_min, year_max)]
+        for key in keys:
+            bisect.insort(self._postings[key], posting)
+        self._keys[search_id] = keys
+
+    def _discard(self, search_id) -> None:
+        for key in self._keys.pop(search_id, ()):
+            postings = self._postings[key]
+            postings[:] = [posting for posting in postings if posting.search_id != search_id]
+            if not postings:
+                del self._postings[key]
+
+
+def _decades(year_min: int | None, year_max: int | None) -> list[int | None]:
+    if year_min is None or year_max is None:
+        return [ANY]  # Open-ended; the exact bound is checked on match
+    first, last = year_min // DECADE, year_max // DECADE
+    if last < first:
+        return []  # Empty range never matches
+    if last - first >= MAX_DECADES:
+        return [ANY]
+    return list(range(first, last + 1))
+
+
+_index = SavedSearchIndex()
+
+
+def get_index() -> SavedSearchIndex:
+    return _index
+
+
+def match_activated_cars(car_ids: Iterable[uuid.UUID]) -> int:
+    """
+    Queue alerts for saved searches matching newly activated cars.
+    Returns the number of matches; a search is never alerted twice for a car.
+    """
+    cars = list(
+        Car.objects.filter(pk__in=list(car_ids), status=Car.Status.ACTIVE).values_list(
+            "id", "brand_id", "year", "price", "seller_id"
+        )
+    )
+    if not cars:
+        return 0
+    index = get_index()
+    index.sync()
+    pairs = [(search_id, car) for car in cars for search_id in index.candidates(car[1], car[2], car[3])]
+    if not pairs:
+        return 0
+
+    # Deletes only leave the index on reconcile; confirm against the table.
+    owners = {}
+    search_ids = list({search_id for search_id, _ in pairs})
+    for start in range(0, len(search_ids), CHUNK_SIZE):
+        owners.update(
+            SavedSearch.objects.filter(pk__in=search_ids[start : start + CHUNK_SIZE], is_active=True).values_list(
+                "pk", "user_id"
+            )
+        )
+    index.discard(search_id for search_id in search_ids if search_id not in owners)
+    now = timezone.now()
+    alerts = [
+        SearchAlert(saved_search_id=search_id, car_id=car[0], created_at=now)
+        for search_id, car in pairs
+        if search_id in owners and owners[search_id] != car[4]  # Sellers don't get alerts for their own cars
+    ]
+    SearchAlert.objects.bulk_create(alerts, batch_size=1000, ignore_conflicts=True)
+    return len(alerts)
+
+
+def handle_listing_events(events: list[ListingEvent]) -> None:
+    """Outbox handler: match cars whose events mark them as newly activated."""
+    car_ids = list(dict.fromkeys(event.car_id for event in events if event.data.get("activated")))
+    if car_ids:
+        match_activated_cars(car_ids)
+
+
+def deliver_alerts(batch_size: int = 200) -> int:
+    """
+    Send one batch of pending alerts, one email per collector.
+    Returns the number of alerts handled (sent or failed).
+    """
+    with transaction.atomic():
+        # skip_locked lets several workers drain in parallel. Ignored on SQLite.
+        alerts = list(
+            SearchAlert.objects.filter(sent_at__isnull=True, attempts__lt=MAX_ATTEMPTS)
+            .select_for_update(skip_locked=True, of=("self",))
+            .select_related("saved_search__user", "car__brand")
+            .order_by("created_at")[:batch_size]
+        )
+        by_user = defaultdict(list)
+        for alert in alerts:
+            by_user[alert.saved_search.user].append(alert)
+
+        now = timezone.now()
+        for user, user_alerts in by_user.items():
+            ids = [alert.pk for alert in user_alerts]
+            try:
+                send_alert_email(user, user_alerts)
+            except Exception as exc:  # Any delivery failure: retry on a later run
+                logger.warning("Search alert delivery to %s failed: %s", user.email, exc)
+                for alert in user_alerts:
+                    alert.attempts += 1
+                    alert.last_error = str(exc)[:1000]
+                SearchAlert.objects.bulk_update(user_alerts, ["attempts", "last_error"])
+            else:
+                SearchAlert.objects.filter(pk__in=ids).update(sent_at=now)
+    return len(alerts)
+
+
+def send_alert_email(user, alerts: list[SearchAlert]) -> None:
+    lines = [
+        f"- {alert.car} ({alert.car.price}) matches \"{alert.saved_search}\""
+        for alert in alerts
+    ]
+    count = len(alerts)
+    send_mail(
+        subject=f"{count} new listing{'s' if count != 1 else ''} match your saved searches",
+        message="\n".join(lines),
+        from_email=None,
+        recipient_list=[user.email],
+    )
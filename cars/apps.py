@@ -4,3 +4,18 @@ from django.apps import AppConfig
 class CarsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "cars"
+
+    def ready(self) -> None:
+        from shared import metrics
+
+        from . import counters, outbox, signals  # noqa: F401
+        from .alerts import handle_listing_events
+        from .cache import car_detail_cache
+        from .feeds import HOME_FEED_TOPICS, home_feed_cache, refresh_home_feed
+
+        metrics.register("car_detail_cache", car_detail_cache.stats)
+        metrics.register("home_feed_cache", home_feed_cache.stats)
+        metrics.register("outbox", outbox.stats)
+        metrics.register("counters", counters.stats)
+        outbox.register("saved_search_alerts", handle_listing_events, topics=["car"])
+        outbox.register("home_feed", refresh_home_feed, topics=HOME_FEED_TOPICS)
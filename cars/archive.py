@@ -0,0 +1,204 @@
+"""
+Data retention: move stale listings and inquiries out of the hot tables.
+
+Cars that are archived (or sold long ago) move to `cars_archive` together
+with their images, price history, inquiries, view and inquiry counts and
+the saved-search alerts already sent for them; aged inquiries move to
+`inquiries_archive`. Work happens in short per-batch transactions so no
+lock is held for longer than one batch. Everything archived can be put
+back with `restore_car` / `restore_inquiries`.
+"""
+from __future__ import annotations
+
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Iterable
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q, QuerySet
+
+from .models import (
+    ArchivedCar,
+    ArchivedInquiry,
+    Car,
+    CarCounter,
+    CarCounterShard,
+    CarImage,
+    CarPriceHistory,
+    Inquiry,
+    SavedSearch,
+    SearchAlert,
+)
+
+TIMESTAMP_FIELDS = ["created_at", "updated_at"]
+COUNTER_FIELDS = ("views", "inquiries")
+
+
+def stale_cars(sold_before: datetime) -> QuerySet[Car]:
+    """Archived cars, plus sold cars untouched since `sold_before`."""
+    return Car.objects.filter(
+        Q(status=Car.Status.ARCHIVED) | Q(status=Car.Status.SOLD, updated_at__lt=sold_before)
+    )
+
+
+def aged_inquiries(created_before: datetime) -> QuerySet[Inquiry]:
+    return Inquiry.objects.filter(created_at__lt=created_before)
+
+
+def archive_cars(
+    sold_before: datetime,
+    batch_size: int = 500,
+    max_batches: int | None = None,
+    pause: float = 0.0,
+) -> int:
+    """Archive stale cars in batches. Returns the number of cars archived."""
+    return _run_batches(stale_cars(sold_before), _archive_car_batch, batch_size, max_batches, pause)
+
+
+def archive_inquiries(
+    created_before: datetime,
+    batch_size: int = 500,
+    max_batches: int | None = None,
+    pause: float = 0.0,
+) -> int:
+    """Archive inquiries older than `created_before`. Returns the number archived."""
+    return _run_batches(aged_inquiries(created_before), _archive_inquiry_batch, batch_size, max_batches, pause)
+
+
+def _run_batches(queryset: QuerySet, archive_batch, batch_size: int, max_batches: int | None, pause: float) -> int:
+    total = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        with transaction.atomic():
+            # skip_locked lets a concurrent writer keep its rows; they are
+            # picked up on the next run. Ignored on SQLite.
+            ids = list(
+                queryset.select_for_update(skip_locked=True).order_by().values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            archive_batch(ids)
+        total += len(ids)
+        batches += 1
+        if pause:
+            time.sleep(pause)
+    return total
+
+
+def _archive_car_batch(ids: list[uuid.UUID]) -> None:
+    images = _group_by_car(CarImage.objects.filter(car_id__in=ids).values())
+    history = _group_by_car(
+        CarPriceHistory.objects.filter(car_id__in=ids).values("car_id", "old_price", "price", "changed_at")
+    )
+    counters = _counter_totals(ids)
+    # Kept so a restored car isn't announced again to searches already alerted about it.
+    alerts = _group_by_car(
+        SearchAlert.objects.filter(car_id__in=ids).values(
+            "car_id", "saved_search_id", "created_at", "sent_at", "attempts", "last_error"
+        )
+    )
+    ArchivedCar.objects.bulk_create(
+        ArchivedCar(
+            id=car["id"],
+            brand_id=car["brand_id"],
+            status=car["status"],
+            payload={
+                "car": car,
+                "images": images.get(car["id"], []),
+                "price_history": history.get(car["id"], []),
+                "counter": counters.get(car["id"], dict.fromkeys(COUNTER_FIELDS, 0)),
+                "search_alerts": alerts.get(car["id"], []),
+            },
+        )
+        for car in Car.objects.filter(pk__in=ids).values()
+    )
+    _archive_inquiry_batch(list(Inquiry.objects.filter(car_id__in=ids).values_list("id", flat=True)))
+    # Cascades to images, price history, counters and alerts, which are now in the payload.
+    Car.objects.filter(pk__in=ids).delete()
+
+
+def _counter_totals(ids: list[uuid.UUID]) -> dict[uuid.UUID, dict[str, int]]:
+    """Folded counts plus unfolded shards per car, with the shards locked until the batch commits."""
+    totals: dict[uuid.UUID, dict[str, int]] = defaultdict(lambda: dict.fromkeys(COUNTER_FIELDS, 0))
+    for car_id, *values in CarCounter.objects.filter(car_id__in=ids).values_list("car_id", *COUNTER_FIELDS):
+        totals[car_id].update(zip(COUNTER_FIELDS, values))
+    shards = CarCounterShard.objects.select_for_update().filter(car_id__in=ids)
+    for car_id, *values in shards.values_list("car_id", *COUNTER_FIELDS):
+        for field, value in zip(COUNTER_FIELDS, values):
+            totals[car_id][field] += value
+    return totals
+
+
+def _archive_inquiry_batch(ids: list[uuid.UUID]) -> None:
+    ArchivedInquiry.objects.bulk_create(
+        ArchivedInquiry(id=row["id"], car_id=row["car_id"], created_at=row["created_at"], payload=row)
+        for row in Inquiry.objects.filter(pk__in=ids).values()
+    )
+    Inquiry.objects.filter(pk__in=ids).delete()
+
+
+def _group_by_car(rows: Iterable[dict[str, Any]]) -> dict[uuid.UUID, list[dict[str, Any]]]:
+    grouped: dict[uuid.UUID, list[dict[str, Any]]] = defaultdict(list)
+    for row in rows:
+        grouped[row.pop("car_id")].append(row)
+    return grouped
+
+
+@transaction.atomic
+def restore_car(car_id: uuid.UUID | str) -> Car:
+    """
+    Move an archived car, its images, price history, counts, search alerts
+    and archived inquiries back into the hot tables. Alerts for saved
+    searches deleted meanwhile are dropped.
+
+    Raises ArchivedCar.DoesNotExist if the car isn't archived.
+    """
+    archived = ArchivedCar.objects.select_for_update().get(pk=car_id)
+    payload = archived.payload
+
+    car_data = dict(payload["car"])
+    User = get_user_model()
+    if car_data.get("seller_id") and not User.objects.filter(pk=car_data["seller_id"]).exists():
+        car_data["seller_id"] = None
+    car = Car(**car_data)
+    _bulk_restore(Car, [car])
+    _bulk_restore(CarImage, [CarImage(car_id=car.pk, **row) for row in payload["images"]])
+    CarPriceHistory.objects.bulk_create(CarPriceHistory(car_id=car.pk, **row) for row in payload["price_history"])
+    # Payloads archived before counts and alerts were kept have neither.
+    counter = payload.get("counter")
+    if counter and any(counter.values()):
+        CarCounter.objects.create(car_id=car.pk, **counter)
+    alerts = payload.get("search_alerts", [])
+    searches = set(
+        SavedSearch.objects.filter(pk__in=[row["saved_search_id"] for row in alerts]).values_list("pk", flat=True)
+    )
+    SearchAlert.objects.bulk_create(
+        SearchAlert(car_id=car.pk, **row) for row in alerts if uuid.UUID(str(row["saved_search_id"])) in searches
+    )
+    restore_inquiries(ArchivedInquiry.objects.filter(car_id=car.pk))
+    archived.delete()
+    return car
+
+
+@transaction.atomic
+def restore_inquiries(archived: QuerySet[ArchivedInquiry]) -> int:
+    """Restore archived inquiries whose car is in the hot table. Returns the number restored."""
+    rows = list(archived.filter(car_id__in=Car.objects.values("pk")).select_for_update())
+    _bulk_restore(Inquiry, [Inquiry(**row.payload) for row in rows])
+    ArchivedInquiry.objects.filter(pk__in=[row.pk for row in rows]).delete()
+    return len(rows)
+
+
+def _bulk_restore(model, objs: list) -> None:
+    """bulk_create, then put back the original timestamps that auto_now(_add) overwrote."""
+    if not objs:
+        return
+    timestamps = [{name: getattr(obj, name) for name in TIMESTAMP_FIELDS} for obj in objs]
+    model.objects.bulk_create(objs)
+    for obj, values in zip(objs, timestamps):
+        for name, value in values.items():
+            setattr(obj, name, value)
+    model.objects.bulk_update(objs, TIMESTAMP_FIELDS)
@@ -0,0 +1,69 @@
+"""
+Bulk status and featured-flag changes.
+
+Each batch is a single `UPDATE ... WHERE id IN (...)`, so no per-row
+save() or signals run. The batch's listing events are bulk-inserted in
+the same transaction (newly activated cars reach saved-search matching
+through them), and once it commits the caches fan out once: the
+histograms are dropped and the detail entries of the cars that changed
+are marked stale. The home feed is rebuilt from the outbox.
+"""
+from __future__ import annotations
+
+import uuid
+from functools import partial
+from typing import Any, Iterable
+
+from django.db import transaction
+from django.utils import timezone
+
+from . import outbox
+from .cache import car_detail_cache
+from .histograms import invalidate_histograms
+from .models import Car, ListingEvent
+
+BATCH_SIZE = 1000
+
+ACTIONS: dict[str, dict[str, Any]] = {
+    "activate": {"status": Car.Status.ACTIVE},
+    "archive": {"status": Car.Status.ARCHIVED},
+    "feature": {"is_featured": True},
+    "unfeature": {"is_featured": False},
+}
+
+
+def bulk_update_cars(car_ids: Iterable[uuid.UUID], action: str, batch_size: int = BATCH_SIZE) -> int:
+    """Apply one of ACTIONS to the given cars. Returns the number of cars that changed."""
+    values = ACTIONS[action]
+    ids = list(car_ids)
+    changed = 0
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start : start + batch_size]
+        with transaction.atomic():
+            # Rows already in the target state are left alone (and keep their updated_at). The rest
+            # are locked, so `changing` is exactly what the UPDATE changes and all that fans out.
+            pending = Car.objects.select_for_update().filter(pk__in=batch).exclude(**values)
+            changing = list(pending.values_list("pk", flat=True))
+            count = Car.objects.filter(pk__in=changing).update(**values, updated_at=timezone.now())
+            if count:
+                outbox.record_many(
+                    [
+                        ListingEvent(
+                            topic=ListingEvent.Topic.CAR,
+                            action=ListingEvent.Action.SAVED,
+                            object_id=car_id,
+                            car_id=car_id,
+                            data={"created": False, "activated": action == "activate", "fields": sorted(values)},
+                        )
+                        for car_id in changing
+                    ]
+                )
+                transaction.on_commit(partial(fan_out, changing))
+        changed += count
+    return changed
+
+
+def fan_out(car_ids: list[uuid.UUID]) -> None:
+    """Cache invalidation for the cars one committed batch changed; the home feed follows the outbox."""
+    invalidate_histograms()
+    car_detail_cache.invalidate_many(car_ids)
@@ -0,0 +1,275 @@
+"""
+Two-tier cache for rendered API payloads.
+
+Tier 1 is a small per-process LRU with a short TTL; tier 2 is the shared
+Django cache. On a miss only one request per key rebuilds the payload:
+threads in a process wait on a per-key lock, and processes race for a
+lock key in the shared cache while the losers poll for the result. The
+lock holds a random owner token, so a builder whose lock expired never
+releases someone else's. Invalidation marks entries stale instead of
+deleting them, so one request revalidates while everyone else keeps
+getting the stale copy.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from django.core.cache import cache
+
+
+class CacheBusy(Exception):
+    """Another process is still building the entry and there is no stale copy to serve."""
+
+
+class TieredCache:
+    """
+    Per-process LRU in front of the shared cache, with single-flight
+    rebuilds and stale-while-revalidate.
+
+    `build(key)` returns the payload bytes, or None when the object no
+    longer exists (the caller should 404). None is cached for `missing_for`
+    seconds so requests for missing ids don't rebuild every time. `get`
+    raises CacheBusy when it waited out another builder that still holds
+    the lock.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        build: Callable[[Any], bytes | None],
+        lru_size: int = 1024,
+        lru_ttl: float = 5.0,
+        fresh_for: float = 300.0,
+        missing_for: float = 30.0,
+        timeout: float = 24 * 60 * 60,
+        lock_timeout: float = 10.0,
+        wait_timeout: float = 2.0,
+        poll_interval: float = 0.025,
+    ) -> None:
+        self.prefix = prefix
+        self.build = build
+        self.lru_size = lru_size
+        self.lru_ttl = lru_ttl
+        self.fresh_for = fresh_for
+        self.missing_for = missing_for
+        self.timeout = timeout
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._lru: OrderedDict[Any, tuple[float, bytes]] = OrderedDict()
+        self._lru_lock = threading.Lock()
+        # key -> [lock, threads holding or waiting]; dropped when nobody needs it
+        self._key_locks: dict[Any, list] = {}
+        self._key_locks_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "lru_hits": 0,
+            "shared_hits": 0,
+            "stale_served": 0,
+            "coalesced_waits": 0,
+            "rebuilds": 0,
+            "busy": 0,
+        }
+
+    def get(self, key: Any) -> bytes | None:
+        self._count("requests")
+        body = self._lru_get(key)
+        if body is not None:
+            self._count("lru_hits")
+            return body
+
+        with self._key_lock(key):
+            # Another thread in this process may have just filled it.
+            body = self._lru_get(key)
+            if body is not None:
+                self._count("coalesced_waits")
+                return body
+
+            data_key, dirty_key, lock_key = self._keys(key)
+            values = cache.get_many([data_key, dirty_key])
+            entry = values.get(data_key)
+            dirty = values.get(dirty_key)
+
+            if entry is not None:
+                built_at, body = entry
+                fresh_for = self.fresh_for if body is not None else self.missing_for
+                if dirty is None and time.time() - built_at < fresh_for:
+                    self._count("shared_hits")
+                    if body is not None:
+                        self._lru_set(key, body)
+                    return body
+                token = self._acquire(lock_key)
+                if token is None:
+                    # Someone else is revalidating; serve what we have.
+                    self._count("stale_served")
+                    return body
+                return self._rebuild(key, dirty, token)
+
+            token = self._acquire(lock_key)
+            if token is not None:
+                return self._rebuild(key, dirty, token)
+            return self._wait_for(key)
+
+    def refresh(self, key: Any) -> None:
+        """
+        Rebuild and store a key now, for writers that update it out of band.
+        If a rebuild is already running it may have read older data, so the
+        key is left stale for the next read to revalidate instead.
+        """
+        self.invalidate(key)
+        data_key, dirty_key, lock_key = self._keys(key)
+        token = self._acquire(lock_key)
+        if token is not None:
+            self._rebuild(key, cache.get(dirty_key), token)
+
+    def invalidate(self, key: Any) -> None:
+        """Mark a key stale. The next read revalidates; others keep serving the old copy meanwhile."""
+        self._lru_pop(key)
+        _, dirty_key, _ = self._keys(key)
+        cache.set(dirty_key, time.time(), timeout=self.timeout)
+
+    def invalidate_many(self, keys) -> None:
+        dirty = {}
+        for key in keys:
+            self._lru_pop(key)
+            dirty[self._keys(key)[1]] = time.time()
+        if dirty:
+            cache.set_many(dirty, timeout=self.timeout)
+
+    def clear_local(self) -> None:
+        """Drop the per-process tier (used by tests)."""
+        with self._lru_lock:
+            self._lru.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._stats_lock:
+            stats: dict[str, Any] = dict(self._stats)
+        hits = stats["lru_hits"] + stats["shared_hits"] + stats["stale_served"] + stats["coalesced_waits"]
+        stats["hit_ratio"] = round(hits / stats["requests"], 4) if stats["requests"] else None
+        stats["lru_entries"] = len(self._lru)
+        return stats
+
+    def _rebuild(self, key: Any, dirty: float | None, token: str) -> bytes | None:
+        data_key, dirty_key, lock_key = self._keys(key)
+        self._count("rebuilds")
+        try:
+            body = self.build(key)
+            if body is None:
+                cache.set(data_key, (time.time(), None), timeout=self.missing_for)
+            else:
+                cache.set(data_key, (time.time(), body), timeout=self.timeout)
+            # An invalidation that landed mid-build keeps its stale marker, and
+            # what we built stays out of the local tier, so it is rebuilt again.
+            current = cache.get(dirty_key)
+            if current == dirty and body is not None:
+                self._lru_set(key, body)
+            else:
+                self._lru_pop(key)
+            if dirty is not None and current == dirty:
+                cache.delete(dirty_key)
+            return body
+        finally:
+            self._release(lock_key, token)
+
+    def _acquire(self, lock_key: str) -> str | None:
+        """Take the shared build lock; returns the owner token, or None if it is held."""
+        token = uuid.uuid4().hex
+        return token if cache.add(lock_key, token, timeout=self.lock_timeout) else None
+
+    def _release(self, lock_key: str, token: str) -> None:
+        # Only drop our own lock: if it expired mid-build, another process may
+        # hold it now. The shared cache has no compare-and-delete, so a lock
+        # expiring between the get and the delete can still slip through.
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+
+    def _wait_for(self, key: Any) -> bytes | None:
+        """Poll the shared cache while another process builds the entry."""
+        data_key, dirty_key, lock_key = self._keys(key)
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            time.sleep(self.poll_interval)
+            entry = cache.get(data_key)
+            if entry is not None:
+                self._count("coalesced_waits")
+                if entry[1] is not None:
+                    self._lru_set(key, entry[1])
+                return entry[1]
+            if cache.get(lock_key) is None:
+                break  # The builder died or its lock expired
+        # Build only under our own lock, so waiters never pile onto one build.
+        token = self._acquire(lock_key)
+        if token is None:
+            self._count("busy")
+            raise CacheBusy(key)
+        return self._rebuild(key, cache.get(dirty_key), token)
+
+    @contextmanager
+    def _key_lock(self, key: Any) -> Iterator[None]:
+        """Serialize threads on one key only, so a slow build never holds up other keys."""
+        with self._key_locks_lock:
+            entry = self._key_locks.get(key)
+            if entry is None:
+                entry = self._key_locks[key] = [threading.Lock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._key_locks_lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._key_locks[key]
+
+    def _keys(self, key: Any) -> tuple[str, str, str]:
+        return f"{self.prefix}:{key}", f"{self.prefix}:dirty:{key}", f"{self.prefix}:lock:{key}"
+
+    def _lru_get(self, key: Any) -> bytes | None:
+        with self._lru_lock:
+            entry = self._lru.get(key)
+            if entry is None:
+                return None
+            stored_at, body = entry
+            if time.monotonic() - stored_at > self.lru_ttl:
+                del self._lru[key]
+                return None
+            self._lru.move_to_end(key)
+            return body
+
+    def _lru_set(self, key: Any, body: bytes) -> None:
+        with self._lru_lock:
+            self._lru[key] = (time.monotonic(), body)
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+
+    def _lru_pop(self, key: Any) -> None:
+        with self._lru_lock:
+            self._lru.pop(key, None)
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._stats[name] += 1
+
+
+def build_car_detail(car_id: Any) -> bytes | None:
+    """Render CarDetailSerializer output for an active car, or None if it isn't active."""
+    from rest_framework.renderers import JSONRenderer
+
+    from .models import Car
+    from .read_models import car_detail_rows
+    from .serializers import CarDetailSerializer
+
+    rows = car_detail_rows(Car.objects.filter(status=Car.Status.ACTIVE, pk=car_id))
+    if not rows:
+        return None
+    return JSONRenderer().render(CarDetailSerializer(rows[0]).data)
+
+
+car_detail_cache = TieredCache("car_detail", build_car_detail)
@@ -0,0 +1,107 @@
+"""
+Sharded per-car view and inquiry counters.
+
+Each car has up to COUNTER_SHARDS CarCounterShard rows, and an increment
+adds to one at random, so concurrent increments for one popular car
+rarely wait on the same row lock. The `fold_counters` worker
+periodically adds the shard counts into the car's CarCounter and zeroes
+them. Published counts (the car detail payload) come from CarCounter,
+so they lag by at most one fold interval. `counts(exact=True)` adds the
+unfolded shards for callers that need the live figure.
+"""
+from __future__ import annotations
+
+import logging
+import random
+import uuid
+from collections import defaultdict
+from typing import Any
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q, Sum
+from django.utils import timezone
+
+from .cache import car_detail_cache
+from .models import CarCounter, CarCounterShard
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("views", "inquiries")
+FOLD_BATCH_SIZE = 500
+
+
+def increment(car_id: uuid.UUID, field: str, amount: int = 1) -> None:
+    """Add to a random shard of the car's counter, creating the shard on first use."""
+    shard = random.randrange(settings.COUNTER_SHARDS)
+    shards = CarCounterShard.objects.filter(car_id=car_id, shard=shard)
+    if shards.update(**{field: F(field) + amount}):
+        return
+    try:
+        with transaction.atomic():
+            CarCounterShard.objects.bulk_create([CarCounterShard(car_id=car_id, shard=shard)], ignore_conflicts=True)
+            shards.update(**{field: F(field) + amount})
+    except IntegrityError:  # The car was deleted meanwhile; nothing left to count
+        logger.info("Dropped %s increment for deleted car %s", field, car_id)
+
+
+def fold(batch_size: int = FOLD_BATCH_SIZE) -> int:
+    """
+    Move pending shard counts for up to batch_size cars into their
+    CarCounter totals. Returns the number of cars folded (0 when caught up).
+    """
+    pending = Q(views__gt=0) | Q(inquiries__gt=0)
+    car_ids = list(
+        CarCounterShard.objects.filter(pending).order_by().values_list("car_id", flat=True).distinct()[:batch_size]
+    )
+    if not car_ids:
+        return 0
+
+    totals: dict[uuid.UUID, dict[str, int]] = defaultdict(lambda: dict.fromkeys(FIELDS, 0))
+    with transaction.atomic():
+        # Increments to these shards wait for the fold to commit, so none
+        # can land between the read and the reset
+        shards = CarCounterShard.objects.select_for_update().filter(pending, car_id__in=car_ids)
+        shard_ids = []
+        for shard_id, car_id, views, inquiries in shards.values_list("id", "car_id", "views", "inquiries"):
+            shard_ids.append(shard_id)
+            totals[car_id]["views"] += views
+            totals[car_id]["inquiries"] += inquiries
+        CarCounterShard.objects.filter(pk__in=shard_ids).update(views=0, inquiries=0)
+
+        CarCounter.objects.bulk_create([CarCounter(car_id=car_id) for car_id in totals], ignore_conflicts=True)
+        now = timezone.now()
+        for car_id, added in totals.items():
+            CarCounter.objects.filter(car_id=car_id).update(
+                views=F("views") + added["views"], inquiries=F("inquiries") + added["inquiries"], folded_at=now
+            )
+        folded = list(totals)
+        transaction.on_commit(lambda: car_detail_cache.invalidate_many(folded))
+    return len(folded)
+
+
+def fold_all(batch_size: int = FOLD_BATCH_SIZE) -> int:
+    """Fold until no shard has a pending count. Returns the number of cars folded."""
+    total = 0
+    while folded := fold(batch_size):
+        total += folded
+    return total
+
+
+def counts(car_id: uuid.UUID, exact: bool = False) -> dict[str, int]:
+    """The car's folded totals, plus the unfolded shard counts if exact."""
+    result = dict.fromkeys(FIELDS, 0)
+    counter = CarCounter.objects.filter(car_id=car_id).values(*FIELDS).first()
+    if counter:
+        result.update(counter)
+    if exact:
+        pending = CarCounterShard.objects.filter(car_id=car_id).aggregate(**{field: Sum(field) for field in FIELDS})
+        for field in FIELDS:
+            result[field] += pending[field] or 0
+    return result
+
+
+def stats() -> dict[str, Any]:
+    """Unfolded work, for the metrics endpoint."""
+    pending = CarCounterShard.objects.filter(Q(views__gt=0) | Q(inquiries__gt=0))
+    return {"shards": settings.COUNTER_SHARDS, "pending_cars": pending.values("car_id").distinct().count()}
@@ -0,0 +1,52 @@
+"""
+Precomputed API payloads served straight from the cache.
+
+The home feed snapshot lives in a TieredCache, so a read is a local hit or
+one shared-cache round trip. Writes don't touch it: the `home_feed` outbox
+handler rebuilds and stores it after each batch of catalog events, so no
+reader has to build it after an edit. Only a cold cache is built by a
+reader, one per key at a time (see cars.cache).
+"""
+from __future__ import annotations
+
+from .cache import TieredCache
+from .models import Car, ListingEvent
+from .read_models import brand_rows, car_list_rows
+
+HOME_FEED_CACHE_KEY = "cars_home_feed"
+HOME_FEED_TIMEOUT = 60 * 60  # Safety net; the outbox handler normally refreshes it first
+HOME_FEATURED_LIMIT = 12
+HOME_NEWEST_LIMIT = 8
+HOME_FEED_TOPICS = [ListingEvent.Topic.CAR, ListingEvent.Topic.CAR_IMAGE, ListingEvent.Topic.BRAND]
+
+
+def build_home_feed() -> bytes:
+    """Render the homepage snapshot (featured cars, newest arrivals, brands) to JSON bytes."""
+    # Imported here so cars.signals (loaded at app ready) doesn't pull DRF
+    # into every worker's boot path.
+    from rest_framework.renderers import JSONRenderer
+
+    from .serializers import BrandSerializer, CarListSerializer
+
+    active = Car.objects.filter(status=Car.Status.ACTIVE)
+    featured = car_list_rows(active.filter(is_featured=True)[:HOME_FEATURED_LIMIT])
+    newest = car_list_rows(active.order_by("-created_at")[:HOME_NEWEST_LIMIT])
+    payload = {
+        "featured": CarListSerializer(featured, many=True).data,
+        "newest": CarListSerializer(newest, many=True).data,
+        "brands": BrandSerializer(brand_rows(), many=True).data,
+    }
+    return JSONRenderer().render(payload)
+
+
+home_feed_cache = TieredCache(HOME_FEED_CACHE_KEY, lambda key: build_home_feed(), fresh_for=HOME_FEED_TIMEOUT)
+
+
+def get_home_feed() -> bytes:
+    """Return the cached homepage snapshot."""
+    return home_feed_cache.get("home")
+
+
+def refresh_home_feed(events: list[ListingEvent]) -> None:
+    """Outbox handler: rebuild and store the homepage snapshot once per batch of catalog events."""
+    home_feed_cache.refresh("home")
@@ -0,0 +1,80 @@
+"""
+Gallery ordering and the primary image.
+
+`reorder_gallery` rewrites a car's whole image order, and optionally its
+primary image, in one transaction. The new order is a single
+`UPDATE ... SET sort_order = CASE id ...` over the car's images, so no
+per-image save() or signals run. The images' listing events are
+bulk-inserted alongside it, as in cars.bulk, and once the transaction
+commits the car's detail payload is invalidated. The home feed is rebuilt
+from the outbox.
+
+At most one image per car is primary (the car_image_one_primary
+constraint). That unique index is checked row by row, so when the primary
+moves, the outgoing image is cleared in its own UPDATE first.
+"""
+from __future__ import annotations
+
+import uuid
+from functools import partial
+
+from django.db import transaction
+from django.db.models import BooleanField, Case, PositiveIntegerField, Value, When
+from django.utils import timezone
+
+from . import outbox
+from .cache import car_detail_cache
+from .models import Car, CarImage, ListingEvent
+
+
+def reorder_gallery(car: Car, image_ids: list[uuid.UUID], primary_id: uuid.UUID | None = None) -> None:
+    """
+    Put the car's images in the given order (sort_order 0, 1, ...) and, if
+    primary_id is given, make that image the only primary one. image_ids
+    must list every image of the car exactly once; raises ValueError otherwise.
+    """
+    with transaction.atomic():
+        images = CarImage.objects.select_for_update().filter(car=car).order_by()
+        current = dict(images.values_list("pk", "is_primary"))
+        if len(image_ids) != len(current) or set(image_ids) != set(current):
+            raise ValueError("List every image of the car exactly once.")
+        if primary_id is not None and primary_id not in current:
+            raise ValueError("The primary image must be one of the car's images.")
+
+        now = timezone.now()
+        changes = {
+            "sort_order": Case(
+                *(When(pk=pk, then=Value(position)) for position, pk in enumerate(image_ids)),
+                output_field=PositiveIntegerField(),
+            ),
+            "updated_at": now,
+        }
+        fields = ["sort_order"]
+        if primary_id is not None:
+            outgoing = [pk for pk, is_primary in current.items() if is_primary and pk != primary_id]
+            if outgoing:
+                CarImage.objects.filter(pk__in=outgoing).update(is_primary=False)
+            changes["is_primary"] = Case(
+                When(pk=primary_id, then=Value(True)), default=Value(False), output_field=BooleanField()
+            )
+            fields.append("is_primary")
+        CarImage.objects.filter(car=car).update(**changes)
+
+        outbox.record_many(
+            [
+                ListingEvent(
+                    topic=ListingEvent.Topic.CAR_IMAGE,
+                    action=ListingEvent.Action.SAVED,
+                    object_id=pk,
+                    car_id=car.pk,
+                    data={"created": False, "fields": fields},
+                )
+                for pk in image_ids
+            ]
+        )
+        transaction.on_commit(partial(fan_out, car.pk))
+
+
+def fan_out(car_id: uuid.UUID) -> None:
+    """Cache invalidation for one committed reorder; the home feed follows the outbox."""
+    car_detail_cache.invalidate(car_id)
@@ -0,0 +1,158 @@
+"""
+Geohash helpers for radius search without PostGIS.
+
+Every located car stores a geohash of its coordinates. Nearby cars share
+a geohash prefix, and all geohashes with a given prefix form one
+contiguous range of strings. A radius query is answered by covering the
+circle's bounding box with a few grid cells, scanning the matching index
+ranges, and computing exact distances in SQL over those candidates only.
+"""
+from __future__ import annotations
+
+import math
+
+from django.db.models import ExpressionWrapper, F, FloatField, Q, QuerySet
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+PRECISION = 9  # About 5 m x 5 m cells
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = math.pi * EARTH_RADIUS_KM / 180
+MAX_COVER_CELLS = 16
+
+
+def encode(latitude: float, longitude: float, precision: int = PRECISION) -> str:
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    chars = []
+    bits = 0
+    value = 0
+    even = True
+    while len(chars) < precision:
+        if even:
+            mid = (lng_lo + lng_hi) / 2
+            if longitude >= mid:
+                value = value * 2 + 1
+                lng_lo = mid
+            else:
+                value *= 2
+                lng_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if latitude >= mid:
+                value = value * 2 + 1
+                lat_lo = mid
+            else:
+                value *= 2
+                lat_hi = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(BASE32[value])
+            bits = 0
+            value = 0
+    return "".join(chars)
+
+
+def cell_size(precision: int) -> tuple[float, float]:
+    """(height, width) of a geohash cell in degrees."""
+    lng_bits = math.ceil(precision * 5 / 2)
+    lat_bits = precision * 5 // 2
+    return 180 / 2**lat_bits, 360 / 2**lng_bits
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> tuple[float, float, float, float]:
+    """(south, north, west, east) in degrees. west > east means the box crosses the antimeridian."""
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    south, north = latitude - dlat, latitude + dlat
+    if south <= -90 or north >= 90:
+        return max(south, -90.0), min(north, 90.0), -180.0, 180.0
+    dlng = dlat / math.cos(math.radians(max(abs(south), abs(north))))
+    if dlng >= 180:
+        return south, north, -180.0, 180.0
+    west, east = longitude - dlng, longitude + dlng
+    if west < -180:
+        west += 360
+    if east > 180:
+        east -= 360
+    return south, north, west, east
+
+
+def cover(latitude: float, longitude: float, radius_km: float) -> list[tuple[str, str]]:
+    """
+    Geohash ranges [low, high) that together contain every point within
+    `radius_km`, using the finest precision that needs at most
+    MAX_COVER_CELLS cells. Adjacent ranges are merged.
+    """
+    south, north, west, east = bounding_box(latitude, longitude, radius_km)
+    for precision in range(PRECISION, 0, -1):
+        height, width = cell_size(precision)
+        rows = range(math.floor((south + 90) / height), math.floor((min(north, 90 - height / 2) + 90) / height) + 1)
+        columns_per_row = round(360 / width)
+        first = math.floor((west + 180) / width)
+        last = math.floor((min(east, 180 - width / 2) + 180) / width)
+        if last < first:
+            last += columns_per_row  # Wraps around the antimeridian
+        columns = [column % columns_per_row for column in range(first, last + 1)]
+        if len(rows) * len(columns) <= MAX_COVER_CELLS:
+            break
+    prefixes = sorted(
+        {
+            encode(-90 + (row + 0.5) * height, -180 + (column + 0.5) * width, precision)
+            for row in rows
+            for column in columns
+        }
+    )
+    ranges: list[tuple[str, str]] = []
+    for prefix in prefixes:
+        low, high = prefix, successor(prefix)
+        if ranges and ranges[-1][1] == low:
+            ranges[-1] = (ranges[-1][0], high)
+        else:
+            ranges.append((low, high))
+    return ranges
+
+
+def successor(prefix: str) -> str:
+    """Smallest geohash string greater than every string starting with `prefix`."""
+    chars = list(prefix)
+    while chars:
+        position = BASE32.index(chars[-1])
+        if position + 1 < len(BASE32):
+            chars[-1] = BASE32[position + 1]
+            return "".join(chars)
+        chars.pop()
+    return "~"  # Past every geohash
+
+
+def within_radius(queryset: QuerySet, latitude: float, longitude: float, radius_km: float) -> QuerySet:
+    """
+    Filter to rows within `radius_km` of the point, annotated with
+    `distance_km` and ordered nearest first.
+
+    The geohash ranges hit the index; the bounding box trims the cells'
+    overhang; only the remaining candidates get the haversine distance.
+    """
+    ranges = Q()
+    for low, high in cover(latitude, longitude, radius_km):
+        ranges |= Q(geohash__gte=low, geohash__lt=high)
+
+    south, north, west, east = bounding_box(latitude, longitude, radius_km)
+    box = Q(latitude__gte=south, latitude__lte=north)
+    if west <= east:
+        box &= Q(longitude__gte=west, longitude__lte=east)
+    else:
+        box &= Q(longitude__gte=west) | Q(longitude__lte=east)
+
+    lat1, lng1 = math.radians(latitude), math.radians(longitude)
+    lat2, lng2 = Radians(F("latitude")), Radians(F("longitude"))
+    haversine = Power(Sin((lat2 - lat1) / 2), 2) + math.cos(lat1) * Cos(lat2) * Power(Sin((lng2 - lng1) / 2), 2)
+    distance = 2 * EARTH_RADIUS_KM * ASin(Sqrt(haversine))
+
+    return (
+        queryset.filter(ranges, box)
+        .annotate(distance_km=ExpressionWrapper(distance, output_field=FloatField()))
+        .filter(distance_km__lte=radius_km)
+        .order_by("distance_km", "-created_at")
+    )
+
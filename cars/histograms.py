@@ -0,0 +1,86 @@
+"""
+Price and year histograms over the active catalog.
+
+Buckets are counted in the database: one aggregate finds the range, and
+one GROUP BY over `FLOOR((value - min) / width)` counts the cars per
+bucket, which is what PostgreSQL's width_bucket() does. Results are cached
+per (field, bins, filters). Every cached histogram carries the catalog
+version, and any car write bumps it, so stale entries are never read again.
+"""
+from __future__ import annotations
+
+import math
+import time
+from decimal import Decimal
+from typing import Any
+
+from django.core.cache import cache
+from django.db.models import Count, FloatField, IntegerField, Max, Min, QuerySet, Value
+from django.db.models.functions import Cast, Floor, Least
+
+FIELDS = ("price", "year")
+DEFAULT_BINS = 20
+MAX_BINS = 100
+HISTOGRAM_VERSION_KEY = "cars_histogram_version"
+HISTOGRAM_TIMEOUT = 60 * 60  # Safety net; a version bump normally retires entries first
+
+
+def _edge(field: str, value: float) -> Any:
+    if field == "price":
+        return str(Decimal(value).quantize(Decimal("0.01")))
+    return int(value)
+
+
+def build_histogram(queryset: QuerySet, field: str, bins: int) -> dict[str, Any]:
+    """
+    Count the queryset's cars in `bins` equal-width buckets of `field`. Years
+    use whole-year buckets, so there may be fewer than `bins` of them.
+    """
+    bounds = queryset.aggregate(low=Min(field), high=Max(field), total=Count("id"))
+    low, high, total = bounds["low"], bounds["high"], bounds["total"]
+    if not total:
+        return {"field": field, "count": 0, "min": None, "max": None, "buckets": []}
+
+    low, high = float(low), float(high)
+    if field == "year":
+        width = float(math.ceil((high - low + 1) / bins))
+        bins = math.ceil((high - low + 1) / width)
+    elif high == low:
+        # Every car has the same price: one bucket [low, high] holds them all.
+        width, bins = 1.0, 1
+    else:
+        width = (high - low) / bins
+
+    # The top value lands exactly on the last upper edge; keep it in the last bucket.
+    position = Floor((Cast(field, FloatField()) - Value(low)) / Value(width))
+    bucket = Cast(Least(position, Value(float(bins - 1))), IntegerField())
+    counts = dict(
+        queryset.order_by()
+        .annotate(bucket=bucket)
+        .values("bucket")
+        .annotate(count=Count("id"))
+        .values_list("bucket", "count")
+    )
+    buckets = []
+    for index in range(bins):
+        lower = low + index * width
+        upper = lower + width - 1 if field == "year" else (high if index == bins - 1 else lower + width)
+        buckets.append({"lower": _edge(field, lower), "upper": _edge(field, upper), "count": counts.get(index, 0)})
+    return {"field": field, "count": total, "min": _edge(field, low), "max": _edge(field, high), "buckets": buckets}
+
+
+def get_histogram(queryset: QuerySet, field: str, bins: int, filters: dict[str, Any]) -> dict[str, Any]:
+    """Cached build_histogram; `filters` must identify what the queryset was filtered by."""
+    version = cache.get_or_set(HISTOGRAM_VERSION_KEY, 0, timeout=None)
+    parts = [f"{name}={filters[name]}" for name in sorted(filters)]
+    key = ":".join(["cars_histogram", str(version), field, str(bins), *parts])
+    histogram = cache.get(key)
+    if histogram is None:
+        histogram = build_histogram(queryset, field, bins)
+        cache.set(key, histogram, timeout=HISTOGRAM_TIMEOUT)
+    return histogram
+
+
+def invalidate_histograms() -> None:
+    """Retire every cached histogram; the next request for each rebuilds it."""
+    cache.set(HISTOGRAM_VERSION_KEY, time.time_ns(), timeout=None)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from cars.archive import aged_inquiries, archive_cars, archive_inquiries, stale_cars
+
+
+class Command(BaseCommand):
+    help = (
+        "Move archived/long-sold cars (with their images, price history and "
+        "inquiries) and aged inquiries into the archive tables. Meant to run nightly."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--sold-days", type=int, default=90, help="Archive sold cars untouched for this many days.")
+        parser.add_argument("--inquiry-days", type=int, default=365, help="Archive inquiries older than this many days.")
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--max-batches", type=int, help="Stop after this many batches per table.")
+        parser.add_argument("--pause", type=float, default=0.0, help="Seconds to sleep between batches.")
+        parser.add_argument("--dry-run", action="store_true", help="Only report how many rows would move.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        now = timezone.now()
+        sold_before = now - timedelta(days=options["sold_days"])
+        inquiries_before = now - timedelta(days=options["inquiry_days"])
+
+        if options["dry_run"]:
+            self.stdout.write(f"Cars to archive: {stale_cars(sold_before).count()}")
+            self.stdout.write(f"Aged inquiries to archive: {aged_inquiries(inquiries_before).count()}")
+            return
+
+        batching = {
+            "batch_size": options["batch_size"],
+            "max_batches": options["max_batches"],
+            "pause": options["pause"],
+        }
+        cars = archive_cars(sold_before, **batching)
+        inquiries = archive_inquiries(inquiries_before, **batching)
+        self.stdout.write(self.style.SUCCESS(f"Archived {cars} cars and {inquiries} aged inquiries."))
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import statistics
+import time
+from decimal import Decimal
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import Client
+
+from cars.models import Brand, Car, CarImage
+
+
+class Command(BaseCommand):
+    help = (
+        "Time CarListView and CarDetailView through the full request stack "
+        "(middleware included) against temporary seeded data. Run once per "
+        "APP_PROFILE to compare per-request overhead."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--requests", type=int, default=500, help="Timed requests per endpoint (default: 500).")
+        parser.add_argument("--cars", type=int, default=100, help="Active cars to seed (default: 100).")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        self.stdout.write(f"APP_PROFILE={settings.APP_PROFILE}, {len(settings.MIDDLEWARE)} middleware")
+
+        # Seed inside a transaction that is always rolled back.
+        with transaction.atomic():
+            car = self.seed(options["cars"])
+            client = Client()
+            endpoints = [
+                ("CarListView", "/api/cars/"),
+                ("CarDetailView", f"/api/cars/{car.id}/"),
+                # Served from the cache with no queries: isolates stack overhead.
+                ("HomeFeedView", "/api/cars/home/"),
+            ]
+            for label, url in endpoints:
+                timings = self.time_requests(client, url, options["requests"])
+                self.stdout.write(
+                    f"{label:<14} mean {statistics.mean(timings):.3f} ms, "
+                    f"p50 {statistics.median(timings):.3f} ms, "
+                    f"p95 {statistics.quantiles(timings, n=20)[-1]:.3f} ms"
+                )
+            transaction.set_rollback(True)
+
+    def seed(self, count: int) -> Car:
+        brand = Brand.objects.create(name=f"Benchmark {time.time_ns()}")
+        cars = Car.objects.bulk_create(
+            Car(brand=brand, model=f"Model {i}", year=1950 + i % 50, price=Decimal(100000 + i), status=Car.Status.ACTIVE)
+            for i in range(count)
+        )
+        CarImage.objects.bulk_create(
+            CarImage(car=car, image_url=f"https://example.com/{car.id}.jpg", is_primary=True) for car in cars
+        )
+        return cars[0]
+
+    def time_requests(self, client: Client, url: str, count: int) -> list[float]:
+        """Per-request wall-clock milliseconds after a short warm-up."""
+        for _ in range(10):
+            client.get(url)
+        timings = []
+        for _ in range(count):
+            started = time.perf_counter()
+            response = client.get(url, HTTP_ACCEPT="application/json")
+            timings.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                raise CommandError(f"GET {url} returned {response.status_code}")
+        return timings
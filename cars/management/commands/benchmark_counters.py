@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import threading
+import time
+from decimal import Decimal
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connection, connections
+from django.test import override_settings
+
+from cars import counters
+from cars.models import Brand, Car, CarCounter, CarCounterShard
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure concurrent view-count increments on one car with a single "
+        "counter row versus sharded rows, using threads against the configured "
+        "database. Seeds a temporary car and deletes it afterwards."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--threads", type=int, default=8, help="Concurrent writers (default: 8).")
+        parser.add_argument("--increments", type=int, default=500, help="Increments per thread (default: 500).")
+        parser.add_argument("--shards", type=int, default=8, help="Shards for the sharded run (default: 8).")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # Writers run on their own connections, so the data must be committed.
+        brand = Brand.objects.create(name=f"Benchmark {time.time_ns()}")
+        car = Car.objects.create(brand=brand, model="Counter", year=1960, price=Decimal(1), status=Car.Status.ACTIVE)
+        try:
+            self.stdout.write(
+                f"{connection.vendor}: {options['threads']} threads x {options['increments']} increments on one car"
+            )
+            for label, shards in (("single row", 1), (f"{options['shards']} shards", options["shards"])):
+                with override_settings(COUNTER_SHARDS=shards):
+                    elapsed, errors = self.run(car.pk, options["threads"], options["increments"])
+                counters.fold_all()
+                done = counters.counts(car.pk)["views"]
+                CarCounter.objects.filter(car=car).delete()
+                CarCounterShard.objects.filter(car=car).delete()
+                self.stdout.write(
+                    f"{label:<12} {done / elapsed:>9.0f} increments/s, {done} counted, {errors} lock errors"
+                )
+        finally:
+            car.delete()
+            brand.delete()
+
+    def run(self, car_id, threads: int, increments: int) -> tuple[float, int]:
+        """(seconds, failed increments) for `threads` writers hitting one car."""
+        errors = [0] * threads
+        start = threading.Barrier(threads + 1)
+
+        def writer(index: int) -> None:
+            try:
+                start.wait()
+                for _ in range(increments):
+                    try:
+                        counters.increment(car_id, "views")
+                    except DatabaseError:  # e.g. SQLite's "database is locked"
+                        errors[index] += 1
+            finally:
+                connections.close_all()
+
+        workers = [threading.Thread(target=writer, args=(index,)) for index in range(threads)]
+        for worker in workers:
+            worker.start()
+        start.wait()
+        started = time.perf_counter()
+        for worker in workers:
+            worker.join()
+        return time.perf_counter() - started, sum(errors)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+from decimal import Decimal
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+
+from cars.models import Brand, Car, CarImage
+from cars.read_models import car_detail_rows, car_list_rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the memory held and allocated when loading cars as model "
+        "instances versus cars.read_models rows, measured with tracemalloc "
+        "against temporary seeded data and reported per 1000 cars."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--cars", type=int, default=1000, help="Active cars to seed (default: 1000).")
+        parser.add_argument("--images", type=int, default=3, help="Images per car (default: 3).")
+        parser.add_argument(
+            "--description-size", type=int, default=2000, help="Characters of description per car (default: 2000)."
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        count = options["cars"]
+        # Seed inside a transaction that is always rolled back.
+        with transaction.atomic(), override_settings(DEBUG=False):
+            self.seed(count, options["images"], options["description_size"])
+            active = Car.objects.filter(status=Car.Status.ACTIVE).order_by("created_at")
+            # Each instance loader reads what its row loader reads: lists skip the
+            # description, details add it and the folded counters.
+            list_instances = active.select_related("brand").prefetch_related("images").defer("description")
+            detail_instances = active.select_related("brand", "counter").prefetch_related("images")
+            loaders: list[tuple[str, Callable[[], Any]]] = [
+                ("list: model instances", lambda: list(list_instances.all())),
+                ("list: CarListRow", lambda: car_list_rows(active)),
+                ("detail: model instances", lambda: list(detail_instances.all())),
+                ("detail: CarDetailRow", lambda: car_detail_rows(active)),
+            ]
+            scale = 1000 / count
+            self.stdout.write(f"{count} cars, {options['images']} images each; figures per 1000 cars")
+            for label, load in loaders:
+                retained, peak, blocks, elapsed = self.measure(load)
+                self.stdout.write(
+                    f"{label:<24} retained {retained * scale / 1024:>8.0f} KiB, "
+                    f"peak {peak * scale / 1024:>8.0f} KiB, "
+                    f"{blocks * scale:>8.0f} live blocks, "
+                    f"{elapsed * scale:>7.1f} ms"
+                )
+            transaction.set_rollback(True)
+
+    def seed(self, count: int, images: int, description_size: int) -> None:
+        brands = Brand.objects.bulk_create(Brand(name=f"Benchmark {time.time_ns()} {i}") for i in range(10))
+        cars = Car.objects.bulk_create(
+            Car(
+                brand=brands[i % len(brands)],
+                model=f"Model {i}",
+                year=1950 + i % 50,
+                price=Decimal(100000 + i),
+                description="x" * description_size,
+                status=Car.Status.ACTIVE,
+            )
+            for i in range(count)
+        )
+        CarImage.objects.bulk_create(
+            CarImage(car=car, image_url=f"https://example.com/{car.id}/{n}.jpg", is_primary=n == 0, sort_order=n)
+            for car in cars
+            for n in range(images)
+        )
+
+    def measure(self, load: Callable[[], Any]) -> tuple[int, int, int, float]:
+        """(retained bytes, peak bytes, live blocks, ms) for one call. Timed separately, untraced."""
+        started = time.perf_counter()
+        load()
+        elapsed = (time.perf_counter() - started) * 1000
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = load()
+            retained, peak = tracemalloc.get_traced_memory()
+            blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+        finally:
+            tracemalloc.stop()
+        del result
+        return retained, peak, blocks, elapsed
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import random
+import time
+from decimal import Decimal
+from typing import Any
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from accounts.models import User
+from cars.alerts import SavedSearchIndex, match_activated_cars
+from cars.models import Brand, Car, SavedSearch, SearchAlert
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure saved-search matching against temporary seeded data: index "
+        "build time, per-car match time with the inverted index versus "
+        "checking every search, and end-to-end throughput into the outbox."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--searches", type=int, default=100_000, help="Saved searches to seed (default: 100000).")
+        parser.add_argument("--cars", type=int, default=200, help="Cars to activate (default: 200).")
+        parser.add_argument("--brands", type=int, default=100)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        rng = random.Random(options["seed"])
+        # Seed inside a transaction that is always rolled back.
+        with transaction.atomic():
+            brands, cars = self.seed(rng, options["searches"], options["cars"], options["brands"])
+
+            started = time.perf_counter()
+            index = SavedSearchIndex()
+            index.sync()
+            self.stdout.write(f"Index build: {len(index)} searches in {time.perf_counter() - started:.2f} s")
+
+            rows = [(car.brand_id, car.year, car.price) for car in cars]
+            started = time.perf_counter()
+            indexed = sum(len(index.candidates(*row)) for row in rows)
+            indexed_us = (time.perf_counter() - started) / len(rows) * 1e6
+
+            searches = list(SavedSearch.objects.all())
+            started = time.perf_counter()
+            naive = sum(1 for car in cars for search in searches if search.matches(car))
+            naive_us = (time.perf_counter() - started) / len(rows) * 1e6
+            if naive != indexed:
+                self.stderr.write(f"Mismatch: index found {indexed} matches, full scan {naive}")
+            self.stdout.write(
+                f"Matching: {indexed / len(rows):.1f} matches/car; index {indexed_us:.0f} us/car, "
+                f"full scan {naive_us:.0f} us/car"
+            )
+
+            started = time.perf_counter()
+            matched = match_activated_cars([car.pk for car in cars])
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f"End to end: {len(cars)} cars, {matched} alerts written ({SearchAlert.objects.count()} rows) "
+                f"in {elapsed:.2f} s ({len(cars) / elapsed:.0f} cars/s)"
+            )
+            transaction.set_rollback(True)
+
+    def seed(self, rng: random.Random, searches: int, cars: int, brand_count: int) -> tuple[list[Brand], list[Car]]:
+        stamp = time.time_ns()
+        brands = Brand.objects.bulk_create(Brand(name=f"Benchmark {stamp} {i}") for i in range(brand_count))
+        users = User.objects.bulk_create(User(email=f"bench-{stamp}-{i}@example.com") for i in range(1000))
+
+        batch = []
+        for i in range(searches):
+            year_min = None if rng.random() < 0.2 else rng.randint(1930, 2000)
+            batch.append(
+                SavedSearch(
+                    user=rng.choice(users),
+                    brand=None if rng.random() < 0.05 else rng.choice(brands),
+                    year_min=year_min,
+                    year_max=None if year_min is None else year_min + rng.choice([5, 10, 20, 40]),
+                    max_price=None if rng.random() < 0.2 else Decimal(rng.randrange(20_000, 2_000_000, 1000)),
+                )
+            )
+            if len(batch) == 5000:
+                SavedSearch.objects.bulk_create(batch)
+                batch = []
+        SavedSearch.objects.bulk_create(batch)
+
+        return brands, Car.objects.bulk_create(
+            Car(
+                brand=rng.choice(brands),
+                model=f"Model {i}",
+                year=rng.randint(1930, 2010),
+                price=Decimal(rng.randrange(10_000, 3_000_000, 500)),
+                status=Car.Status.ACTIVE,
+            )
+            for i in range(cars)
+        )
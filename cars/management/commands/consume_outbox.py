@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from cars.outbox import consume_all, prune
+
+
+class Command(BaseCommand):
+    help = "Deliver listing events from the outbox to the registered handlers."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--interval", type=float, default=1.0, help="Seconds to wait when caught up.")
+        parser.add_argument("--once", action="store_true", help="Deliver what is pending, then exit.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        total = 0
+        while True:
+            delivered = consume_all(options["batch_size"])
+            total += delivered
+            if not delivered:
+                prune()
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+        self.stdout.write(self.style.SUCCESS(f"Delivered {total} events."))
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from cars.counters import FOLD_BATCH_SIZE, fold_all
+
+
+class Command(BaseCommand):
+    help = (
+        "Fold sharded view and inquiry counts into the per-car totals. The "
+        "interval bounds how far published counts lag behind."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--batch-size", type=int, default=FOLD_BATCH_SIZE, help="Cars per fold transaction.")
+        parser.add_argument("--interval", type=float, default=60.0, help="Seconds between folds.")
+        parser.add_argument("--once", action="store_true", help="Fold what is pending, then exit.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        total = 0
+        while True:
+            total += fold_all(options["batch_size"])
+            if options["once"]:
+                break
+            time.sleep(options["interval"])
+        self.stdout.write(self.style.SUCCESS(f"Folded counts for {total} car(s)."))
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from cars.seo import SeoGenerator
+
+
+class Command(BaseCommand):
+    help = "Write the sitemap and product feed shards for active cars, rewriting only shards that changed."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--full", action="store_true", help="Rebuild and re-balance every shard.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        summary = SeoGenerator().generate(full=options["full"])
+        kind = "Full rebuild" if summary["full"] else "Incremental run"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{kind}: rewrote {summary['rewritten']} of {summary['shards']} shard(s), {summary['urls']} URLs."
+            )
+        )
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from cars.reports import GROUPINGS, PERIODS, price_indices
+
+
+class Command(BaseCommand):
+    help = "Compute brand- or decade-level price indices from the price history."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--by", choices=sorted(GROUPINGS), default="brand")
+        parser.add_argument("--period", choices=PERIODS, default="month")
+        parser.add_argument("--since", help="Only include price points from this ISO datetime onward.")
+        parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        since = None
+        if options["since"]:
+            try:
+                since = datetime.fromisoformat(options["since"])
+            except ValueError as exc:
+                raise CommandError(f"Invalid --since value: {options['since']}") from exc
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since)
+
+        rows = price_indices(by=options["by"], period=options["period"], since=since)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(rows, default=str, indent=2))
+            return
+
+        self.stdout.write(f"{options['by']:<24} {'period':<12} {'avg price':>16} {'cars':>8} {'index':>8}")
+        for row in rows:
+            index = "" if row["index"] is None else f"{row['index']:.2f}"
+            self.stdout.write(
+                f"{str(row['group']):<24} {row['period']:<12} {row['average_price']:>16} {row['cars']:>8} {index:>8}"
+            )
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cars.archive import restore_car, restore_inquiries
+from cars.models import ArchivedCar, ArchivedInquiry
+
+
+class Command(BaseCommand):
+    help = "Move archived cars or inquiries back into the hot tables."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--car", action="append", default=[], help="Archived car ID (repeatable).")
+        parser.add_argument("--inquiry", action="append", default=[], help="Archived inquiry ID (repeatable).")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not options["car"] and not options["inquiry"]:
+            raise CommandError("Pass at least one --car or --inquiry.")
+
+        for car_id in options["car"]:
+            try:
+                car = restore_car(car_id)
+            except ArchivedCar.DoesNotExist as exc:
+                raise CommandError(f"No archived car with ID {car_id}") from exc
+            self.stdout.write(f"Restored car {car.pk}")
+
+        if options["inquiry"]:
+            restored = restore_inquiries(ArchivedInquiry.objects.filter(pk__in=options["inquiry"]))
+            self.stdout.write(f"Restored {restored} of {len(options['inquiry'])} inquiries")
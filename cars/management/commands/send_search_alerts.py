@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from cars.alerts import deliver_alerts
+
+
+class Command(BaseCommand):
+    help = "Drain the saved-search alert outbox, emailing each collector their new matches."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--batch-size", type=int, default=200)
+        parser.add_argument("--interval", type=float, default=5.0, help="Seconds to wait when the outbox is empty.")
+        parser.add_argument("--once", action="store_true", help="Drain what is pending, then exit.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        total = 0
+        while True:
+            handled = deliver_alerts(options["batch_size"])
+            total += handled
+            if handled < options["batch_size"]:
+                if options["once"]:
+                    break
+                time.sleep(options["interval"])
+        self.stdout.write(self.style.SUCCESS(f"Handled {total} alerts."))
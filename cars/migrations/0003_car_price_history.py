@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-18 23:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+def seed_current_prices(apps, schema_editor):
+    """Record each existing car's current price as its first history point."""
+    Car = apps.get_model("cars", "Car")
+    CarPriceHistory = apps.get_model("cars", "CarPriceHistory")
+    batch = []
+    for car_id, price, created_at in Car.objects.values_list("id", "price", "created_at").iterator():
+        batch.append(CarPriceHistory(car_id=car_id, price=price, changed_at=created_at))
+        if len(batch) >= 1000:
+            CarPriceHistory.objects.bulk_create(batch)
+            batch = []
+    CarPriceHistory.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0002_inquiry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CarPriceHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('old_price', models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True)),
+                ('price', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('car', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='price_history', to='cars.car')),
+            ],
+            options={
+                'verbose_name_plural': 'Car price history',
+                'db_table': 'car_price_history',
+                'ordering': ['-changed_at'],
+                'indexes': [models.Index(fields=['car', 'changed_at'], name='price_history_car_changed_idx')],
+            },
+        ),
+        migrations.RunPython(seed_current_prices, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 4.2.30 on 2026-10-18 23:53
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def create_message_trigram_index(apps, schema_editor):
+    """Trigram index so message icontains searches don't scan the table (PostgreSQL only)."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS inquiry_message_trgm_idx "
+        "ON inquiries USING gin (message gin_trgm_ops)"
+    )
+
+
+def drop_message_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS inquiry_message_trgm_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('cars', '0003_car_price_history'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='car',
+            name='seller',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='listings', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='inquiry',
+            name='read_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='inquiry',
+            index=models.Index(fields=['car', '-created_at'], name='inquiry_car_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inquiry',
+            index=models.Index(fields=['-created_at'], name='inquiry_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inquiry',
+            index=models.Index(condition=models.Q(('read_at__isnull', True)), fields=['car', '-created_at'], name='inquiry_car_unread_idx'),
+        ),
+        # Drop the standalone car_id index only after the composite ones exist.
+        migrations.AlterField(
+            model_name='inquiry',
+            name='car',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='inquiries', to='cars.car'),
+        ),
+        migrations.RunPython(create_message_trigram_index, drop_message_trigram_index),
+    ]
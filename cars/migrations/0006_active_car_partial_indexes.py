@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-18 23:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0005_archive_tables'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['-created_at'], name='car_active_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['brand', '-created_at'], name='car_active_brand_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(condition=models.Q(('is_featured', True), ('status', 'active')), fields=['-created_at'], name='car_active_featured_idx'),
+        ),
+    ]
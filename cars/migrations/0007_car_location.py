@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:01
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0006_active_car_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='car',
+            name='country',
+            field=models.CharField(blank=True, default='', help_text='ISO 3166-1 alpha-2 code', max_length=2),
+        ),
+        migrations.AddField(
+            model_name='car',
+            name='geohash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=12),
+        ),
+        migrations.AddField(
+            model_name='car',
+            name='latitude',
+            field=models.FloatField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(-90), django.core.validators.MaxValueValidator(90)]),
+        ),
+        migrations.AddField(
+            model_name='car',
+            name='longitude',
+            field=models.FloatField(blank=True, null=True, validators=[django.core.validators.MinValueValidator(-180), django.core.validators.MaxValueValidator(180)]),
+        ),
+        migrations.AddField(
+            model_name='car',
+            name='region',
+            field=models.CharField(blank=True, default='', help_text='ISO 3166-2 code, e.g. US-CA', max_length=6),
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=models.Index(fields=['geohash'], name='car_geohash_idx'),
+        ),
+    ]
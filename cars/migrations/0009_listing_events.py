@@ -0,0 +1,42 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:41
+
+import django.core.serializers.json
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0008_saved_search_alerts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ListingEvent',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('topic', models.CharField(choices=[('car', 'Car'), ('car_image', 'Car image'), ('brand', 'Brand')], max_length=20)),
+                ('action', models.CharField(choices=[('saved', 'Saved'), ('deleted', 'Deleted')], max_length=10)),
+                ('object_id', models.UUIDField()),
+                ('car_id', models.UUIDField(blank=True, help_text='Car the change affects, if any', null=True)),
+                ('data', models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'listing_events',
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='OutboxCheckpoint',
+            fields=[
+                ('name', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('last_event_id', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'outbox_checkpoints',
+            },
+        ),
+    ]
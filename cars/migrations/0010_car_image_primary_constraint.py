@@ -0,0 +1,42 @@
+# Generated by Django 4.2.30 on 2026-10-19 00:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def clear_extra_primaries(apps, schema_editor):
+    """Keep only the first primary image of each car (by gallery order) before the constraint goes on."""
+    CarImage = apps.get_model("cars", "CarImage")
+    primaries = CarImage.objects.filter(is_primary=True).order_by("car_id", "sort_order", "created_at")
+    seen = set()
+    extra = []
+    for image_id, car_id in primaries.values_list("id", "car_id").iterator():
+        if car_id in seen:
+            extra.append(image_id)
+        seen.add(car_id)
+    for start in range(0, len(extra), 1000):
+        CarImage.objects.filter(pk__in=extra[start : start + 1000]).update(is_primary=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0009_listing_events'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_extra_primaries, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='carimage',
+            name='car',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='images', to='cars.car'),
+        ),
+        migrations.AddIndex(
+            model_name='carimage',
+            index=models.Index(fields=['car', 'sort_order', 'created_at'], name='car_image_gallery_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='carimage',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_primary', True)), fields=('car',), name='car_image_one_primary', violation_error_message='A car can only have one primary image.'),
+        ),
+    ]
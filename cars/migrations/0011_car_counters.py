@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:01
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0010_car_image_primary_constraint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CarCounter',
+            fields=[
+                ('car', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='counter', serialize=False, to='cars.car')),
+                ('views', models.PositiveBigIntegerField(default=0)),
+                ('inquiries', models.PositiveBigIntegerField(default=0)),
+                ('folded_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'car_counters',
+            },
+        ),
+        migrations.CreateModel(
+            name='CarCounterShard',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('shard', models.PositiveSmallIntegerField()),
+                ('views', models.PositiveBigIntegerField(default=0)),
+                ('inquiries', models.PositiveBigIntegerField(default=0)),
+                ('car', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='counter_shards', to='cars.car')),
+            ],
+            options={
+                'db_table': 'car_counter_shards',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='carcountershard',
+            constraint=models.UniqueConstraint(fields=('car', 'shard'), name='car_counter_shard_unique'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0011_car_counters'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='listingevent',
+            options={'ordering': ['txid', 'id']},
+        ),
+        migrations.AddField(
+            model_name='listingevent',
+            name='txid',
+            field=models.BigIntegerField(default=0, editable=False, help_text="Writing transaction's id on PostgreSQL; 0 elsewhere"),
+        ),
+        migrations.AddField(
+            model_name='outboxcheckpoint',
+            name='last_txid',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='listingevent',
+            index=models.Index(fields=['txid', 'id'], name='listing_event_delivery_idx'),
+        ),
+    ]
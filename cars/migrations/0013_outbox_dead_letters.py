@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:24
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0012_listing_event_txid'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxDeadLetter',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('handler', models.CharField(max_length=100)),
+                ('event_id', models.BigIntegerField()),
+                ('txid', models.BigIntegerField(default=0)),
+                ('topic', models.CharField(choices=[('car', 'Car'), ('car_image', 'Car image'), ('brand', 'Brand')], max_length=20)),
+                ('action', models.CharField(choices=[('saved', 'Saved'), ('deleted', 'Deleted')], max_length=10)),
+                ('object_id', models.UUIDField()),
+                ('car_id', models.UUIDField(blank=True, null=True)),
+                ('data', models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('error', models.TextField()),
+                ('attempts', models.PositiveIntegerField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'outbox_dead_letters',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='outboxcheckpoint',
+            name='failures',
+            field=models.PositiveIntegerField(default=0, help_text='Consecutive failed deliveries'),
+        ),
+        migrations.AddField(
+            model_name='outboxcheckpoint',
+            name='isolate',
+            field=models.PositiveIntegerField(default=0, help_text='Events left to deliver one at a time after a failed batch'),
+        ),
+        migrations.AddField(
+            model_name='outboxcheckpoint',
+            name='last_error',
+            field=models.TextField(blank=True),
+        ),
+    ]
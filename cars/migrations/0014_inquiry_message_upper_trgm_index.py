@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-19 01:50
+
+from django.db import migrations
+
+
+def index_upper_message(apps, schema_editor):
+    """
+    Rebuild the message trigram index on UPPER(message::text), the expression
+    Django's icontains compiles to on PostgreSQL, so searches can use it
+    (PostgreSQL only).
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS inquiry_message_trgm_idx")
+    schema_editor.execute(
+        "CREATE INDEX inquiry_message_trgm_idx "
+        "ON inquiries USING gin ((UPPER(message::text)) gin_trgm_ops)"
+    )
+
+
+def index_raw_message(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS inquiry_message_trgm_idx")
+    schema_editor.execute(
+        "CREATE INDEX inquiry_message_trgm_idx "
+        "ON inquiries USING gin (message gin_trgm_ops)"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cars', '0013_outbox_dead_letters'),
+    ]
+
+    operations = [
+        migrations.RunPython(index_upper_message, index_raw_message),
+    ]
@@ -1,11 +1,31 @@
 from __future__ import annotations
 
-from django.db import models
+from typing import Any
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.validators import MaxValueValidator, MinValueValidator
+from django.db import models, transaction
+from django.utils import timezone
 
 from shared.models import BaseModel
 
+from . import geo
+
 
-class Brand(BaseModel):
+class AtomicSaveMixin:
+    """
+    Run save() in a transaction so the post_save receivers that write
+    ListingEvents commit or roll back together with the row. Inside an
+    existing transaction this adds no savepoint.
+    """
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        with transaction.atomic(using=kwargs.get("using"), savepoint=False):
+            super().save(*args, **kwargs)
+
+
+class Brand(AtomicSaveMixin, BaseModel):
     """
     Car brand/make (e.g., Ferrari, Porsche, Mercedes-Benz).
     """
@@ -14,6 +34,9 @@ class Brand(BaseModel):
     logo_url = models.URLField(blank=True, default="")
     description = models.TextField(blank=True, default="")
 
+    # Fields copied into every car detail payload
+    PAYLOAD_FIELDS = ("name", "logo_url", "description")
+
     class Meta:
         db_table = "brands"
         ordering = ["name"]
@@ -21,8 +44,24 @@ class Brand(BaseModel):
     def __str__(self) -> str:
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded payload fields so saves can tell whether car
+        # details need invalidating. None marks a deferred field as unknown.
+        instance._loaded_payload = tuple(instance.__dict__.get(name) for name in cls.PAYLOAD_FIELDS)
+        return instance
+
+    def payload_changed(self, update_fields=None) -> bool:
+        """Whether the last save may have changed what car detail payloads show."""
+        if update_fields is not None and not set(update_fields) & set(self.PAYLOAD_FIELDS):
+            return False
+        loaded = getattr(self, "_loaded_payload", None)
+        current = tuple(self.__dict__.get(name) for name in self.PAYLOAD_FIELDS)
+        return loaded is None or None in loaded or loaded != current
 
-class Car(BaseModel):
+
+class Car(AtomicSaveMixin, BaseModel):
     """
     Vintage car listing with details.
     """
@@ -38,6 +77,13 @@ class Car(BaseModel):
         on_delete=models.CASCADE,
         related_name="cars",
     )
+    seller = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="listings",
+    )
     model = models.CharField(max_length=200)
     year = models.PositiveIntegerField()
     price = models.DecimalField(max_digits=12, decimal_places=2)
@@ -48,16 +94,79 @@ class Car(BaseModel):
         choices=Status.choices,
         default=Status.DRAFT,
     )
+    latitude = models.FloatField(
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-90), MaxValueValidator(90)],
+    )
+    longitude = models.FloatField(
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-180), MaxValueValidator(180)],
+    )
+    country = models.CharField(max_length=2, blank=True, default="", help_text="ISO 3166-1 alpha-2 code")
+    region = models.CharField(max_length=6, blank=True, default="", help_text="ISO 3166-2 code, e.g. US-CA")
+    # Derived from latitude/longitude on save; backs radius search (cars.geo)
+    geohash = models.CharField(max_length=12, blank=True, default="", editable=False)
 
     class Meta:
         db_table = "cars"
         ordering = ["-created_at"]
+        # Public views only read ACTIVE cars. Partial indexes keep the
+        # active set physically separate from drafts/sold/archived rows in
+        # index storage; status changes move a row in or out automatically.
+        indexes = [
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(status="active"),
+                name="car_active_created_idx",
+            ),
+            models.Index(
+                fields=["brand", "-created_at"],
+                condition=models.Q(status="active"),
+                name="car_active_brand_idx",
+            ),
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(status="active", is_featured=True),
+                name="car_active_featured_idx",
+            ),
+            # Not partial: radius search ORs several geohash ranges, and
+            # SQLite only uses an index per OR branch if the index has no
+            # condition the branch itself can't satisfy.
+            models.Index(
+                fields=["geohash"],
+                name="car_geohash_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.year} {self.brand.name} {self.model}"
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        self.geohash = self.compute_geohash()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"latitude", "longitude"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "geohash"}
+        super().save(*args, **kwargs)
 
-class CarImage(BaseModel):
+    def compute_geohash(self) -> str:
+        """Geohash for the current coordinates. bulk_create skips save(), so callers set it themselves."""
+        if self.latitude is None or self.longitude is None:
+            return ""
+        return geo.encode(self.latitude, self.longitude)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the loaded price and status so saves can detect changes
+        # without re-reading the row.
+        instance._loaded_price = instance.__dict__.get("price")
+        instance._loaded_status = instance.__dict__.get("status")
+        return instance
+
+
+class CarImage(AtomicSaveMixin, BaseModel):
     """
     Images for a car listing. Supports multiple photos per car.
     """
@@ -66,6 +175,7 @@ class CarImage(BaseModel):
         Car,
         on_delete=models.CASCADE,
         related_name="images",
+        db_index=False,  # Covered by car_image_gallery_idx
     )
     image_url = models.URLField()
     alt_text = models.CharField(max_length=255, blank=True, default="")
@@ -75,6 +185,18 @@ class CarImage(BaseModel):
     class Meta:
         db_table = "car_images"
         ordering = ["sort_order", "created_at"]
+        constraints = [
+            # Also the index behind primary image lookups (read_models.primary_image_url)
+            models.UniqueConstraint(
+                fields=["car"],
+                condition=models.Q(is_primary=True),
+                name="car_image_one_primary",
+                violation_error_message="A car can only have one primary image.",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["car", "sort_order", "created_at"], name="car_image_gallery_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"Image for {self.car}"
@@ -89,16 +211,324 @@ class Inquiry(BaseModel):
         Car,
         on_delete=models.CASCADE,
         related_name="inquiries",
+        db_index=False,  # Covered by the (car, created_at) indexes
     )
     collector_name = models.CharField(max_length=200)
     collector_email = models.EmailField()
     collector_phone = models.CharField(max_length=50, blank=True, default="")
     message = models.TextField()
+    read_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = "inquiries"
         ordering = ["-created_at"]
         verbose_name_plural = "Inquiries"
+        # Message search uses a pg_trgm GIN index created in migration 0004
+        # (PostgreSQL only), which serves icontains/ILIKE lookups.
+        indexes = [
+            models.Index(fields=["car", "-created_at"], name="inquiry_car_created_idx"),
+            models.Index(fields=["-created_at"], name="inquiry_created_idx"),
+            models.Index(
+                fields=["car", "-created_at"],
+                condition=models.Q(read_at__isnull=True),
+                name="inquiry_car_unread_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Inquiry from {self.collector_name} for {self.car}"
+
+    @property
+    def is_read(self) -> bool:
+        return self.read_at is not None
+
+
+class CarPriceHistory(models.Model):
+    """
+    Append-only record of a car's price over time.
+
+    Written on every price change. Kept compact (integer key, no
+    updated_at) since rows are never modified and can run into millions.
+    """
+
+    car = models.ForeignKey(
+        Car,
+        on_delete=models.CASCADE,
+        related_name="price_history",
+        db_index=False,  # Covered by the (car, changed_at) index
+    )
+    old_price = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    price = models.DecimalField(max_digits=12, decimal_places=2)
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "car_price_history"
+        ordering = ["-changed_at"]
+        verbose_name_plural = "Car price history"
+        indexes = [
+            models.Index(fields=["car", "changed_at"], name="price_history_car_changed_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.car_id}: {self.price} at {self.changed_at:%Y-%m-%d}"
+
+
+class ArchivedCar(models.Model):
+    """
+    Cold storage for cars removed from the hot tables by `archive_stale`.
+
+    Keeps the original id plus a JSON payload of the car row, its images,
+    price history, counts and search alerts so `restore_archive` can put it
+    back unchanged.
+    """
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    brand_id = models.UUIDField()
+    status = models.CharField(max_length=20)
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    archived_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        db_table = "cars_archive"
+        ordering = ["-archived_at"]
+
+    def __str__(self) -> str:
+        return f"Archived car {self.id}"
+
+
+class ArchivedInquiry(models.Model):
+    """
+    Cold storage for aged inquiries and inquiries on archived cars.
+    """
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    car_id = models.UUIDField(db_index=True)
+    created_at = models.DateTimeField()
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "inquiries_archive"
+        ordering = ["-created_at"]
+        verbose_name_plural = "Archived inquiries"
+
+    def __str__(self) -> str:
+        return f"Archived inquiry {self.id}"
+
+
+class SavedSearch(BaseModel):
+    """
+    A collector's saved filters. New listings that match are queued as
+    SearchAlerts (see cars.alerts).
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="saved_searches",
+    )
+    name = models.CharField(max_length=100, blank=True, default="")
+    brand = models.ForeignKey(
+        Brand,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="saved_searches",
+        help_text="Leave empty to match any brand",
+    )
+    year_min = models.PositiveIntegerField(null=True, blank=True)
+    year_max = models.PositiveIntegerField(null=True, blank=True)
+    max_price = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        db_table = "saved_searches"
+        ordering = ["-created_at"]
+        verbose_name_plural = "Saved searches"
+        indexes = [
+            # Matchers pull changes since their last sync
+            models.Index(fields=["updated_at"], name="saved_search_updated_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return self.name or f"Saved search {self.pk}"
+
+    def matches(self, car: Car) -> bool:
+        return (
+            (self.brand_id is None or self.brand_id == car.brand_id)
+            and (self.year_min is None or car.year >= self.year_min)
+            and (self.year_max is None or car.year <= self.year_max)
+            and (self.max_price is None or car.price <= self.max_price)
+        )
+
+
+class SearchAlert(models.Model):
+    """
+    Outbox of saved-search matches waiting to be sent to their owner.
+
+    Written when a matching car goes active, drained by the
+    `send_search_alerts` worker.
+    """
+
+    saved_search = models.ForeignKey(
+        SavedSearch,
+        on_delete=models.CASCADE,
+        related_name="alerts",
+        db_index=False,  # Covered by the unique (saved_search, car) constraint
+    )
+    car = models.ForeignKey(Car, on_delete=models.CASCADE, related_name="search_alerts")
+    created_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        db_table = "search_alerts"
+        ordering = ["created_at"]
+        constraints = [
+            # A car is only ever announced once per search, even if it is
+            # deactivated and activated again.
+            models.UniqueConstraint(fields=["saved_search", "car"], name="search_alert_unique"),
+        ]
+        indexes = [
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(sent_at__isnull=True),
+                name="search_alert_pending_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"Alert for {self.saved_search_id}: {self.car_id}"
+
+
+class ListingEvent(models.Model):
+    """
+    Transactional outbox of catalog writes.
+
+    Written by signal receivers (and bulk_update_cars) in the same
+    transaction as the change, then delivered in (txid, id) order to the
+    handlers registered in cars.outbox by the `consume_outbox` worker.
+    """
+
+    class Topic(models.TextChoices):
+        CAR = "car", "Car"
+        CAR_IMAGE = "car_image", "Car image"
+        BRAND = "brand", "Brand"
+
+    class Action(models.TextChoices):
+        SAVED = "saved", "Saved"
+        DELETED = "deleted", "Deleted"
+
+    id = models.BigAutoField(primary_key=True)
+    topic = models.CharField(max_length=20, choices=Topic.choices)
+    action = models.CharField(max_length=10, choices=Action.choices)
+    object_id = models.UUIDField()
+    car_id = models.UUIDField(null=True, blank=True, help_text="Car the change affects, if any")
+    data = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    txid = models.BigIntegerField(
+        default=0, editable=False, help_text="Writing transaction's id on PostgreSQL; 0 elsewhere"
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "listing_events"
+        ordering = ["txid", "id"]
+        indexes = [
+            models.Index(fields=["txid", "id"], name="listing_event_delivery_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"#{self.id} {self.topic} {self.object_id} {self.action}"
+
+
+class OutboxCheckpoint(models.Model):
+    """Last ListingEvent (txid, id) each outbox handler has processed."""
+
+    name = models.CharField(max_length=100, primary_key=True)
+    last_txid = models.BigIntegerField(default=0)
+    last_event_id = models.BigIntegerField(default=0)
+    failures = models.PositiveIntegerField(default=0, help_text="Consecutive failed deliveries")
+    isolate = models.PositiveIntegerField(
+        default=0, help_text="Events left to deliver one at a time after a failed batch"
+    )
+    last_error = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "outbox_checkpoints"
+
+    def __str__(self) -> str:
+        return f"{self.name} at #{self.last_event_id}"
+
+
+class OutboxDeadLetter(models.Model):
+    """
+    A ListingEvent a handler still failed on after OUTBOX_MAX_ATTEMPTS.
+    The handler moved past it; the copy is kept here for inspection and
+    replay, since delivered events are pruned.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    handler = models.CharField(max_length=100)
+    event_id = models.BigIntegerField()
+    txid = models.BigIntegerField(default=0)
+    topic = models.CharField(max_length=20, choices=ListingEvent.Topic.choices)
+    action = models.CharField(max_length=10, choices=ListingEvent.Action.choices)
+    object_id = models.UUIDField()
+    car_id = models.UUIDField(null=True, blank=True)
+    data = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
+    error = models.TextField()
+    attempts = models.PositiveIntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "outbox_dead_letters"
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:
+        return f"{self.handler}: #{self.event_id} {self.topic} {self.object_id} {self.action}"
+
+
+class CarCounterShard(models.Model):
+    """
+    One of COUNTER_SHARDS counter rows per car. Each view or inquiry adds
+    1 to a random shard, so concurrent writers for a popular car spread
+    over several rows instead of queueing on one. `fold_counters` moves
+    the shard counts into CarCounter and zeroes them.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    car = models.ForeignKey(
+        Car,
+        on_delete=models.CASCADE,
+        related_name="counter_shards",
+        db_index=False,  # Covered by car_counter_shard_unique
+    )
+    shard = models.PositiveSmallIntegerField()
+    views = models.PositiveBigIntegerField(default=0)
+    inquiries = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        db_table = "car_counter_shards"
+        constraints = [
+            models.UniqueConstraint(fields=["car", "shard"], name="car_counter_shard_unique"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.car_id} #{self.shard}"
+
+
+class CarCounter(models.Model):
+    """Folded view and inquiry totals for a car; behind by at most one fold interval."""
+
+    car = models.OneToOneField(Car, on_delete=models.CASCADE, primary_key=True, related_name="counter")
+    views = models.PositiveBigIntegerField(default=0)
+    inquiries = models.PositiveBigIntegerField(default=0)
+    folded_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "car_counters"
+
+    def __str__(self) -> str:
+        return f"{self.car_id}: {self.views} views, {self.inquiries} inquiries"
@@ -0,0 +1,234 @@
+"""
+Listing event outbox.
+
+Catalog writes append a ListingEvent in their own transaction (see
+cars.signals and cars.bulk), so the write stays a couple of INSERTs and
+derived data is rebuilt out of band. The `consume_outbox` worker hands
+events to each registered handler in id order and in batches, and moves
+the handler's checkpoint forward in the same transaction as the handler's
+own writes. A handler that raises is retried from its checkpoint, with
+backoff and one event at a time so a bad event is isolated; the other
+handlers carry on. An event that keeps failing is copied to
+OutboxDeadLetter, logged as an error and skipped.
+
+Ids are allocated when a transaction inserts, not when it commits, so on
+PostgreSQL a later id can become visible first. Each event therefore
+records its transaction id (`txid`), and events are delivered in
+(txid, id) order up to the oldest transaction still running: everything
+below that horizon has committed or rolled back, so no earlier event can
+appear behind the checkpoint, however long its transaction ran. SQLite
+serializes writers from their first write to commit, so ids become
+visible in order there; txid stays 0 and there is no horizon.
+"""
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import Any, Callable, Iterable, NamedTuple
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import BigIntegerField, Count, Func, Max, Q
+from django.utils import timezone
+
+from .models import ListingEvent, OutboxCheckpoint, OutboxDeadLetter
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+MAX_RETRY_DELAY = 300  # Seconds
+
+
+class Handler(NamedTuple):
+    name: str
+    func: Callable[[list[ListingEvent]], Any]
+    topics: frozenset[str] | None  # None: every topic
+
+
+_handlers: dict[str, Handler] = {}
+
+
+def register(name: str, func: Callable[[list[ListingEvent]], Any], topics: Iterable[str] | None = None) -> None:
+    """Deliver batches of events (optionally only these topics) to func. Call from AppConfig.ready()."""
+    _handlers[name] = Handler(name, func, frozenset(topics) if topics is not None else None)
+
+
+def handlers() -> list[Handler]:
+    return list(_handlers.values())
+
+
+class CurrentTransactionId(Func):
+    """The writing transaction's id (PostgreSQL 13+)."""
+
+    template = "pg_current_xact_id()::text::bigint"
+    output_field = BigIntegerField()
+
+
+def _txid() -> CurrentTransactionId | int:
+    return CurrentTransactionId() if connection.vendor == "postgresql" else 0
+
+
+def horizon() -> int | None:
+    """
+    The oldest transaction id still running on PostgreSQL: events below it
+    are final. None elsewhere, where every visible event is final.
+    """
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+        return cursor.fetchone()[0]
+
+
+def after(txid: int, event_id: int) -> Q:
+    """Events ordered after (txid, event_id)."""
+    return Q(txid__gt=txid) | Q(txid=txid, id__gt=event_id)
+
+
+def record(topic: str, action: str, object_id, car_id=None, **data: Any) -> ListingEvent:
+    return ListingEvent.objects.create(
+        topic=topic, action=action, object_id=object_id, car_id=car_id, data=data, txid=_txid()
+    )
+
+
+def record_many(events: list[ListingEvent]) -> None:
+    txid = _txid()
+    for event in events:
+        event.txid = txid
+    ListingEvent.objects.bulk_create(events, batch_size=1000)
+
+
+def pending(checkpoint: OutboxCheckpoint, limit: int, below: int | None = None) -> list[ListingEvent]:
+    """The next events after the checkpoint, in delivery order, from transactions below the horizon."""
+    events = ListingEvent.objects.filter(after(checkpoint.last_txid, checkpoint.last_event_id))
+    if below is not None:
+        events = events.filter(txid__lt=below)
+    return list(events.order_by("txid", "id")[:limit])
+
+
+def retry_delay(failures: int) -> timedelta:
+    return timedelta(seconds=min(settings.OUTBOX_RETRY_SECONDS * 2 ** (failures - 1), MAX_RETRY_DELAY))
+
+
+def consume(handler: Handler, batch_size: int = BATCH_SIZE) -> int:
+    """
+    Deliver the next batch to one handler. Returns the number of events
+    the checkpoint moved past, or 0 when caught up, backing off, or on failure.
+    """
+    try:
+        with transaction.atomic():
+            below = horizon()  # Read before this transaction takes locks and an id of its own
+            OutboxCheckpoint.objects.get_or_create(name=handler.name)
+            checkpoint = OutboxCheckpoint.objects.select_for_update().get(name=handler.name)
+            if checkpoint.failures and timezone.now() < checkpoint.updated_at + retry_delay(checkpoint.failures):
+                return 0
+            events = pending(checkpoint, 1 if checkpoint.isolate else batch_size, below)
+            if not events:
+                return 0
+            matching = [event for event in events if handler.topics is None or event.topic in handler.topics]
+            try:
+                with transaction.atomic():  # The handler's writes roll back alone; the checkpoint lock stays
+                    if matching:
+                        handler.func(matching)
+            except Exception as error:
+                return failed(handler, checkpoint, events, error)
+            advance(checkpoint, events[-1])
+            checkpoint.failures = 0
+            checkpoint.isolate = max(checkpoint.isolate - len(events), 0)
+            checkpoint.last_error = ""
+            checkpoint.save()
+            return len(events)
+    except Exception:  # Retried from the same checkpoint next round
+        logger.exception("Outbox handler %s failed", handler.name)
+        return 0
+
+
+def advance(checkpoint: OutboxCheckpoint, event: ListingEvent) -> None:
+    checkpoint.last_txid, checkpoint.last_event_id = event.txid, event.id
+
+
+def failed(handler: Handler, checkpoint: OutboxCheckpoint, events: list[ListingEvent], error: Exception) -> int:
+    """
+    Count a failed delivery and deliver one event at a time until the
+    failed batch is behind us. A single event that has now failed
+    OUTBOX_MAX_ATTEMPTS times is dead-lettered and skipped. Returns the
+    number of events the checkpoint moved past.
+    """
+    checkpoint.failures += 1
+    checkpoint.isolate = max(checkpoint.isolate, len(events))
+    checkpoint.last_error = f"{type(error).__name__}: {error}"
+    if len(events) > 1 or checkpoint.failures < settings.OUTBOX_MAX_ATTEMPTS:
+        logger.warning(
+            "Outbox handler %s failed on %d event(s) from #%d (attempt %d)",
+            handler.name,
+            len(events),
+            events[0].id,
+            checkpoint.failures,
+            exc_info=error,
+        )
+        checkpoint.save()
+        return 0
+
+    event = events[0]
+    OutboxDeadLetter.objects.create(
+        handler=handler.name,
+        event_id=event.id,
+        txid=event.txid,
+        topic=event.topic,
+        action=event.action,
+        object_id=event.object_id,
+        car_id=event.car_id,
+        data=event.data,
+        error=checkpoint.last_error,
+        attempts=checkpoint.failures,
+    )
+    logger.error(
+        "Outbox handler %s gave up on event #%d after %d attempts; dead-lettered",
+        handler.name,
+        event.id,
+        checkpoint.failures,
+        exc_info=error,
+    )
+    advance(checkpoint, event)
+    checkpoint.failures = 0
+    checkpoint.isolate -= 1
+    checkpoint.save()
+    return 1
+
+
+def consume_all(batch_size: int = BATCH_SIZE) -> int:
+    """One round over every handler. Returns the number of events delivered."""
+    return sum(consume(handler, batch_size) for handler in handlers())
+
+
+def prune() -> int:
+    """Delete events every registered handler has processed."""
+    names = [handler.name for handler in handlers()]
+    positions = list(OutboxCheckpoint.objects.filter(name__in=names).values_list("last_txid", "last_event_id"))
+    if not positions or len(positions) < len(names):
+        return 0  # A handler that never ran still needs everything
+    txid, event_id = min(positions)
+    deleted, _ = ListingEvent.objects.exclude(after(txid, event_id)).delete()
+    return deleted
+
+
+def stats() -> dict[str, Any]:
+    """
+    Per-handler checkpoint, lag (events not yet processed), consecutive
+    failures and dead letters, for the metrics endpoint. Alert on
+    failures or dead_letters above zero.
+    """
+    head = ListingEvent.objects.aggregate(head=Max("id"))["head"] or 0
+    checkpoints = OutboxCheckpoint.objects.values_list("name", "last_txid", "last_event_id", "failures")
+    positions = {name: (txid, event_id, failures) for name, txid, event_id, failures in checkpoints}
+    dead = dict(OutboxDeadLetter.objects.values("handler").annotate(count=Count("id")).values_list("handler", "count"))
+    result = {}
+    for handler in handlers():
+        txid, event_id, failures = positions.get(handler.name, (0, 0, 0))
+        result[handler.name] = {
+            "checkpoint": event_id,
+            "lag": ListingEvent.objects.filter(after(txid, event_id)).count(),
+            "failures": failures,
+            "dead_letters": dead.get(handler.name, 0),
+        }
+    return {"head": head, "handlers": result}
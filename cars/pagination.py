@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from rest_framework.pagination import CursorPagination
+
+
+class InquiryCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the inquiry inbox.
+
+    Pages seek on created_at instead of using OFFSET, so deep pages cost
+    the same as the first one.
+    """
+
+    ordering = "-created_at"
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
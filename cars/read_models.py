@@ -0,0 +1,192 @@
+"""
+Compact read model for the catalog read path.
+
+The list, detail, batch and home feed payloads are built from these
+slotted dataclasses rather than from model instances. Rows come out of
+`.values_list()` as tuples and only the fields the payload renders are
+selected, so list pages skip `description`. There is no `_state` and no
+per-instance `__dict__`, and cars of one brand share a single BrandRow.
+The serializers in cars.serializers read them like model instances.
+
+`manage.py benchmark_read_models` compares the memory use with model
+instances.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Iterable
+from uuid import UUID
+
+from django.db.models import OuterRef, QuerySet, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import Brand, CarImage
+
+
+@dataclass(slots=True)
+class BrandRow:
+    id: UUID
+    name: str
+    logo_url: str
+    description: str
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(slots=True)
+class ImageRow:
+    id: UUID
+    image_url: str
+    alt_text: str
+    is_primary: bool
+    sort_order: int
+
+
+@dataclass(slots=True)
+class CarListRow:
+    id: UUID
+    model: str
+    year: int
+    price: Decimal
+    is_featured: bool
+    status: str
+    country: str
+    region: str
+    created_at: datetime
+    brand: BrandRow
+    primary_image: str | None = None
+    distance_km: float | None = None
+
+
+@dataclass(slots=True)
+class CarDetailRow:
+    id: UUID
+    model: str
+    year: int
+    price: Decimal
+    description: str
+    is_featured: bool
+    status: str
+    latitude: float | None
+    longitude: float | None
+    country: str
+    region: str
+    created_at: datetime
+    updated_at: datetime
+    brand: BrandRow
+    view_count: int = 0
+    inquiry_count: int = 0
+    images: list[ImageRow] = field(default_factory=list)
+
+
+BRAND_FIELDS = ("id", "name", "logo_url", "description", "created_at", "updated_at")
+IMAGE_FIELDS = ("id", "image_url", "alt_text", "is_primary", "sort_order")
+LIST_FIELDS = ("id", "model", "year", "price", "is_featured", "status", "country", "region", "created_at")
+DETAIL_FIELDS = (
+    "id",
+    "model",
+    "year",
+    "price",
+    "description",
+    "is_featured",
+    "status",
+    "latitude",
+    "longitude",
+    "country",
+    "region",
+    "created_at",
+    "updated_at",
+)
+
+
+def brand_rows(queryset: QuerySet | None = None) -> list[BrandRow]:
+    queryset = Brand.objects.all() if queryset is None else queryset
+    return [BrandRow(*row) for row in queryset.values_list(*BRAND_FIELDS)]
+
+
+def _car_tuples(queryset: QuerySet, fields: tuple[str, ...], extra: tuple[str, ...] = ()) -> list[tuple]:
+    brand_fields = [f"brand__{name}" for name in BRAND_FIELDS]
+    return list(queryset.select_related(None).prefetch_related(None).values_list(*fields, *brand_fields, *extra))
+
+
+def _split(rows: list[tuple], width: int, brands: dict[UUID, BrandRow]) -> Iterable[tuple[tuple, BrandRow, tuple]]:
+    """Split joined tuples into (car fields, shared BrandRow, extra fields)."""
+    end = width + len(BRAND_FIELDS)
+    for row in rows:
+        brand = brands.get(row[width])
+        if brand is None:
+            brand = brands[row[width]] = BrandRow(*row[width:end])
+        yield row[:width], brand, row[end:]
+
+
+def primary_image_url() -> Coalesce:
+    """
+    Expression for a car's primary image URL, falling back to its first
+    image. Each is a single index probe: the car_image_one_primary unique
+    index, then car_image_gallery_idx.
+    """
+    primary = CarImage.objects.filter(car=OuterRef("pk"), is_primary=True).order_by().values("image_url")[:1]
+    first = CarImage.objects.filter(car=OuterRef("pk")).order_by(*CarImage._meta.ordering).values("image_url")[:1]
+    return Coalesce(Subquery(primary), Subquery(first))
+
+
+def car_list_rows(queryset: QuerySet) -> list[CarListRow]:
+    """
+    Rows for CarListSerializer, in queryset order, in one query joined to
+    the brand. A `distance_km` annotation (see cars.geo.within_radius) is
+    carried over.
+    """
+    extra = ("primary_image", "distance_km") if "distance_km" in queryset.query.annotations else ("primary_image",)
+    queryset = queryset.annotate(primary_image=primary_image_url())
+    brands: dict[UUID, BrandRow] = {}
+    return [
+        CarListRow(*fields, brand, *rest)
+        for fields, brand, rest in _split(_car_tuples(queryset, LIST_FIELDS, extra), len(LIST_FIELDS), brands)
+    ]
+
+
+def car_detail_rows(queryset: QuerySet) -> list[CarDetailRow]:
+    """Rows for CarDetailSerializer, in queryset order, with their images and folded counts."""
+    queryset = queryset.annotate(
+        view_count=Coalesce("counter__views", 0), inquiry_count=Coalesce("counter__inquiries", 0)
+    )
+    brands: dict[UUID, BrandRow] = {}
+    extra = ("view_count", "inquiry_count")
+    rows = [
+        CarDetailRow(*fields, brand, *rest)
+        for fields, brand, rest in _split(_car_tuples(queryset, DETAIL_FIELDS, extra), len(DETAIL_FIELDS), brands)
+    ]
+    if rows:
+        by_id = {row.id: row for row in rows}
+        images = CarImage.objects.filter(car_id__in=by_id).order_by(*CarImage._meta.ordering)
+        for car_id, *fields in images.values_list("car_id", *IMAGE_FIELDS):
+            by_id[car_id].images.append(ImageRow(*fields))
+    return rows
+
+
+class CarListPage:
+    """
+    A Car queryset that slices into CarListRow lists, so DRF's paginator
+    can count and page it like the queryset itself.
+    """
+
+    def __init__(self, queryset: QuerySet) -> None:
+        self.queryset = queryset
+
+    @property
+    def ordered(self) -> bool:
+        return self.queryset.ordered
+
+    def count(self) -> int:
+        return self.queryset.count()
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __getitem__(self, key: slice) -> list[CarListRow]:
+        return car_list_rows(self.queryset[key])
+
+    def __iter__(self):
+        return iter(car_list_rows(self.queryset))
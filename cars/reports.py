@@ -0,0 +1,82 @@
+"""Market reports computed from the car price history."""
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+
+from django.db.models import Avg, Count, ExpressionWrapper, F, IntegerField, Window
+from django.db.models.functions import RowNumber, Trunc
+
+from .models import CarPriceHistory
+
+PERIODS = ("month", "quarter", "year")
+GROUPINGS = {
+    "brand": F("car__brand__name"),
+    "decade": ExpressionWrapper(F("car__year") / 10 * 10, output_field=IntegerField()),
+}
+
+
+def price_indices(
+    by: str = "brand",
+    period: str = "month",
+    since: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Compute a price index per group (brand or decade) and period.
+
+    Each car counts once per period, at the last price it had in that
+    period, so a car that was repriced often doesn't outweigh the rest.
+    Those prices are averaged per (group, period) in a single grouped
+    query; the index is each period's average relative to the group's
+    first period (= 100).
+    """
+    if by not in GROUPINGS:
+        raise ValueError(f"Unknown grouping: {by}")
+    if period not in PERIODS:
+        raise ValueError(f"Unknown period: {period}")
+
+    queryset = CarPriceHistory.objects.all()
+    if since is not None:
+        queryset = queryset.filter(changed_at__gte=since)
+
+    # Django applies window filters after grouping, so pick each car's last
+    # row per period in a subquery and aggregate over those.
+    latest = (
+        queryset.annotate(
+            period=Trunc("changed_at", period),
+            recency=Window(
+                RowNumber(),
+                partition_by=[F("car_id"), F("period")],
+                order_by=[F("changed_at").desc(), F("id").desc()],
+            ),
+        )
+        .filter(recency=1)
+        .values("id")
+    )
+    rows = (
+        CarPriceHistory.objects.filter(id__in=latest)
+        .annotate(group=GROUPINGS[by], period=Trunc("changed_at", period))
+        .values("group", "period")
+        .annotate(average_price=Avg("price"), cars=Count("car_id"))
+        .order_by("group", "period")
+    )
+
+    results: list[dict[str, Any]] = []
+    base: Decimal | None = None
+    current_group: Any = object()
+    for row in rows:
+        average = Decimal(row["average_price"]).quantize(Decimal("0.01"))
+        if row["group"] != current_group:
+            current_group = row["group"]
+            base = average or None
+        results.append(
+            {
+                "group": row["group"],
+                "period": row["period"].date().isoformat(),
+                "average_price": average,
+                "cars": row["cars"],
+                "index": (average / base * 100).quantize(Decimal("0.01")) if base else None,
+            }
+        )
+    return results
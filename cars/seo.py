@@ -0,0 +1,292 @@
+"""
+Precomputed sitemap and product feed shards.
+
+Active cars are split into shards by (created_at, id). Each shard is
+written as `sitemap-NNNNN.xml.gz` (at most 50,000 URLs) and a matching
+Google Merchant RSS feed `products-NNNNN.xml.gz` under SEO_ROOT, and
+`sitemap.xml` indexes the sitemap shards. Rows stream from a server-side
+cursor straight into gzip, and each file is swapped in with an atomic
+rename, so crawlers never see a half-written shard.
+
+Shard ranges are stored in `state.json` with an `updated_at` watermark.
+An incremental run only rewrites shards holding cars, brands or images
+changed since the watermark, and new cars go into the last shard, which
+is open-ended. A full rebuild (`--full`) is still needed now and then to
+drop hard-deleted cars and re-balance the shards.
+"""
+from __future__ import annotations
+
+import bisect
+import gzip
+import json
+import os
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from pathlib import Path
+from typing import Any, Iterator
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.http import FileResponse, Http404
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import Car
+from .read_models import primary_image_url
+
+SITEMAP_LIMIT = 50_000
+CHUNK_SIZE = 2000
+WATERMARK_OVERLAP = timedelta(seconds=5)  # Re-read recent rows to cover commit lag
+STATE_FILE = "state.json"
+INDEX_FILE = "sitemap.xml"
+
+Key = tuple[str, str]  # (created_at ISO, car id); JSON-friendly keyset position
+
+
+@dataclass
+class Shard:
+    number: int
+    after: Key | None  # Exclusive lower bound; None for the first shard
+    upto: Key | None  # Inclusive upper bound; None for the last shard
+    count: int
+    lastmod: str | None
+
+    @property
+    def sitemap(self) -> str:
+        return f"sitemap-{self.number:05d}.xml.gz"
+
+    @property
+    def feed(self) -> str:
+        return f"products-{self.number:05d}.xml.gz"
+
+
+class ShardOverflow(Exception):
+    """A closed shard grew past SITEMAP_LIMIT; the shards need re-balancing."""
+
+
+def _key(created_at: datetime, car_id: uuid.UUID) -> Key:
+    # Fixed-width UTC timestamps and hex ids sort as strings the way the database sorts the columns
+    return (created_at.astimezone(dt_timezone.utc).isoformat(timespec="microseconds"), str(car_id))
+
+
+def _range_filter(after: Key | None, upto: Key | None) -> Q:
+    condition = Q()
+    if after is not None:
+        created_at, car_id = parse_datetime(after[0]), uuid.UUID(after[1])
+        condition &= Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=car_id)
+    if upto is not None:
+        created_at, car_id = parse_datetime(upto[0]), uuid.UUID(upto[1])
+        condition &= Q(created_at__lt=created_at) | Q(created_at=created_at, id__lte=car_id)
+    return condition
+
+
+def active_rows(after: Key | None = None, upto: Key | None = None) -> Iterator[tuple]:
+    """Active cars in the range as tuples, in key order, through a server-side cursor."""
+    return (
+        Car.objects.filter(_range_filter(after, upto), status=Car.Status.ACTIVE)
+        .annotate(brand_name=F("brand__name"), image_url=primary_image_url())
+        .order_by("created_at", "id")
+        .values_list(
+            "id", "created_at", "updated_at", "year", "model", "brand_name", "description", "price", "image_url"
+        )
+        .iterator(chunk_size=CHUNK_SIZE)
+    )
+
+
+class ShardWriter:
+    """Writes one shard's sitemap and feed to temp files, renamed into place on close."""
+
+    def __init__(self, root: Path, shard: Shard) -> None:
+        self.root = root
+        self.shard = shard
+        self.count = 0
+        self.lastmod: datetime | None = None
+        self.last_key: Key | None = None
+        self._files = {
+            name: gzip.GzipFile(root / f".{name}.tmp", "wb", mtime=0) for name in (shard.sitemap, shard.feed)
+        }
+        self._write(
+            shard.sitemap,
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n',
+        )
+        self._write(
+            shard.feed,
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<rss version="2.0" xmlns:g="http://base.google.com/ns/1.0">\n<channel>\n'
+            f"<title>Listings {shard.number}</title>\n<link>{escape(settings.SITE_URL)}</link>\n",
+        )
+
+    def _write(self, name: str, text: str) -> None:
+        self._files[name].write(text.encode())
+
+    def add(self, row: tuple) -> None:
+        car_id, created_at, updated_at, year, model, brand, description, price, image_url = row
+        link = escape(f"{settings.SITE_URL.rstrip('/')}/car/{car_id}")
+        lastmod = updated_at.date().isoformat()
+        self._write(self.shard.sitemap, f"<url><loc>{link}</loc><lastmod>{lastmod}</lastmod></url>\n")
+        item = [
+            f"<g:id>{car_id}</g:id>",
+            f"<g:title>{escape(f'{year} {brand} {model}')}</g:title>",
+            f"<g:description>{escape(description or f'{year} {brand} {model}')}</g:description>",
+            f"<g:link>{link}</g:link>",
+            f"<g:price>{price:.2f} USD</g:price>",
+            "<g:availability>in_stock</g:availability>",
+            "<g:condition>used</g:condition>",
+            f"<g:brand>{escape(brand)}</g:brand>",
+        ]
+        if image_url:
+            item.append(f"<g:image_link>{escape(image_url)}</g:image_link>")
+        self._write(self.shard.feed, "<item>" + "".join(item) + "</item>\n")
+        self.count += 1
+        self.lastmod = max(self.lastmod or updated_at, updated_at)
+        self.last_key = _key(created_at, car_id)
+
+    def close(self) -> Shard:
+        self._write(self.shard.sitemap, "</urlset>\n")
+        self._write(self.shard.feed, "</channel>\n</rss>\n")
+        for name, handle in self._files.items():
+            handle.close()
+            os.replace(self.root / f".{name}.tmp", self.root / name)
+        self.shard.count = self.count
+        self.shard.lastmod = self.lastmod.isoformat() if self.lastmod else self.shard.lastmod
+        return self.shard
+
+
+class SeoGenerator:
+    def __init__(self, root: Path | None = None) -> None:
+        self.root = Path(root or settings.SEO_ROOT)
+
+    # State
+
+    def load_state(self) -> tuple[datetime | None, list[Shard]]:
+        path = self.root / STATE_FILE
+        if not path.exists():
+            return None, []
+        state = json.loads(path.read_text())
+        shards = [
+            Shard(
+                number=entry["number"],
+                after=tuple(entry["after"]) if entry["after"] else None,
+                upto=tuple(entry["upto"]) if entry["upto"] else None,
+                count=entry["count"],
+                lastmod=entry["lastmod"],
+            )
+            for entry in state["shards"]
+        ]
+        return parse_datetime(state["watermark"]), shards
+
+    def save_state(self, watermark: datetime, shards: list[Shard]) -> None:
+        state = {"watermark": watermark.isoformat(), "shards": [asdict(shard) for shard in shards]}
+        tmp = self.root / f".{STATE_FILE}.tmp"
+        tmp.write_text(json.dumps(state, indent=1))
+        os.replace(tmp, self.root / STATE_FILE)
+
+    # Generation
+
+    def generate(self, full: bool = False) -> dict[str, Any]:
+        """Rewrite the shards that changed (or all of them). Returns a summary."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        started = timezone.now()
+        watermark, shards = (None, []) if full else self.load_state()
+        if watermark is None or not shards:
+            shards, rewritten = self._rebuild(), None
+        else:
+            try:
+                shards, rewritten = self._refresh(watermark, shards)
+            except ShardOverflow:
+                shards, rewritten = self._rebuild(), None
+        self._write_index(shards)
+        self.save_state(started - WATERMARK_OVERLAP, shards)
+        return {
+            "full": rewritten is None,
+            "shards": len(shards),
+            "rewritten": len(shards) if rewritten is None else len(rewritten),
+            "urls": sum(shard.count for shard in shards),
+        }
+
+    def _rebuild(self) -> list[Shard]:
+        shards = self._write_range(1, None, None, open_ended=True)
+        keep = {name for shard in shards for name in (shard.sitemap, shard.feed)}
+        for path in [*self.root.glob("sitemap-*.xml.gz"), *self.root.glob("products-*.xml.gz")]:
+            if path.name not in keep:
+                path.unlink()
+        return shards
+
+    def _refresh(self, watermark: datetime, shards: list[Shard]) -> tuple[list[Shard], set[int]]:
+        changed = (
+            Car.objects.filter(
+                Q(updated_at__gte=watermark) | Q(brand__updated_at__gte=watermark) | Q(images__updated_at__gte=watermark)
+            )
+            .values_list("created_at", "id")
+            .distinct()
+            .iterator(chunk_size=CHUNK_SIZE)
+        )
+        bounds = [shard.upto for shard in shards[:-1]]
+        touched = {bisect.bisect_left(bounds, _key(created_at, car_id)) for created_at, car_id in changed}
+
+        rewritten: set[int] = set()
+        for position in sorted(touched):
+            shard = shards[position]
+            last = position == len(shards) - 1
+            written = self._write_range(shard.number, shard.after, shard.upto, open_ended=last)
+            if len(written) > 1 and not last:
+                raise ShardOverflow(shard.number)
+            shards[position : position + 1] = written if last else [written[0]]
+            rewritten.update(s.number for s in written)
+        return shards, rewritten
+
+    def _write_range(self, number: int, after: Key | None, upto: Key | None, open_ended: bool) -> list[Shard]:
+        """
+        Write the active cars in (after, upto] as shards starting at `number`.
+        Open-ended ranges spill into new shards every SITEMAP_LIMIT rows.
+        """
+        shards = []
+        writer = ShardWriter(self.root, Shard(number, after, upto, 0, None))
+        for row in active_rows(after, upto):
+            if writer.count == SITEMAP_LIMIT:
+                if not open_ended:
+                    writer.close()
+                    raise ShardOverflow(number)
+                full = writer.close()
+                full.upto = writer.last_key
+                shards.append(full)
+                writer = ShardWriter(self.root, Shard(full.number + 1, writer.last_key, upto, 0, None))
+            writer.add(row)
+        shards.append(writer.close())
+        return shards
+
+    def _write_index(self, shards: list[Shard]) -> None:
+        base = f"{settings.BASE_URL.rstrip('/')}{settings.SEO_URL}"
+        entries = "".join(
+            f"<sitemap><loc>{escape(base + shard.sitemap)}</loc>"
+            + (f"<lastmod>{shard.lastmod}</lastmod>" if shard.lastmod else "")
+            + "</sitemap>\n"
+            for shard in shards
+        )
+        tmp = self.root / f".{INDEX_FILE}.tmp"
+        tmp.write_text(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            f"{entries}</sitemapindex>\n"
+        )
+        os.replace(tmp, self.root / INDEX_FILE)
+
+
+def seo_file(request, name: str) -> FileResponse:
+    """
+    GET SEO_URL<name>
+    Serve one generated file. The URL pattern only admits the index and
+    shard names, and the file is opened per request, so a rewritten shard
+    is served with its new size straight away.
+    """
+    try:
+        handle = (Path(settings.SEO_ROOT) / name).open("rb")
+    except FileNotFoundError:
+        raise Http404 from None
+    response = FileResponse(handle)
+    response["Cache-Control"] = f"max-age={settings.SEO_MAX_AGE}, public"
+    return response
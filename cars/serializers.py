@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from django.utils import timezone
 from rest_framework import serializers
 
-from .models import Brand, Car, CarImage, Inquiry
+from .bulk import ACTIONS
+from .models import Brand, Car, CarPriceHistory, Inquiry, SavedSearch
 
 
 class BrandSerializer(serializers.ModelSerializer):
@@ -21,26 +23,48 @@ class BrandSerializer(serializers.ModelSerializer):
         read_only_fields = ["id", "created_at", "updated_at"]
 
 
-class CarImageSerializer(serializers.ModelSerializer):
-    """Serializer for CarImage model."""
+class BrandStatsSerializer(BrandSerializer):
+    """Brand with active-listing stats (see views.brand_stats_queryset)."""
 
-    class Meta:
-        model = CarImage
-        fields = [
-            "id",
-            "image_url",
-            "alt_text",
-            "is_primary",
-            "sort_order",
+    active_count = serializers.IntegerField(read_only=True)
+    min_price = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+    max_price = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+    year_min = serializers.IntegerField(read_only=True)
+    year_max = serializers.IntegerField(read_only=True)
+    representative_image = serializers.URLField(read_only=True)
+
+    class Meta(BrandSerializer.Meta):
+        fields = BrandSerializer.Meta.fields + [
+            "active_count",
+            "min_price",
+            "max_price",
+            "year_min",
+            "year_max",
+            "representative_image",
         ]
-        read_only_fields = ["id"]
+
+
+class CarImageSerializer(serializers.Serializer):
+    """
+    Read-only serializer for CarImage or cars.read_models.ImageRow. Images
+    are written through the admin and cars.gallery, so this skips
+    ModelSerializer's validator introspection (which would also have to
+    read the conditional car_image_one_primary constraint).
+    """
+
+    id = serializers.UUIDField(read_only=True)
+    image_url = serializers.URLField(read_only=True)
+    alt_text = serializers.CharField(read_only=True)
+    is_primary = serializers.BooleanField(read_only=True)
+    sort_order = serializers.IntegerField(read_only=True)
 
 
 class CarListSerializer(serializers.ModelSerializer):
-    """Serializer for Car list view (minimal data)."""
+    """Serializer for Car list view (minimal data). Renders cars.read_models.CarListRow."""
 
     brand = BrandSerializer(read_only=True)
-    primary_image = serializers.SerializerMethodField()
+    primary_image = serializers.CharField(read_only=True, allow_null=True)
+    distance_km = serializers.SerializerMethodField()
 
     class Meta:
         model = Car
@@ -53,25 +77,26 @@ class CarListSerializer(serializers.ModelSerializer):
             "is_featured",
             "status",
             "primary_image",
+            "country",
+            "region",
+            "distance_km",
             "created_at",
         ]
         read_only_fields = fields
 
-    def get_primary_image(self, obj: Car) -> str | None:
-        """Get the primary image URL for the car."""
-        primary = obj.images.filter(is_primary=True).first()
-        if primary:
-            return primary.image_url
-        # Fallback to first image if no primary is set
-        first_image = obj.images.first()
-        return first_image.image_url if first_image else None
+    def get_distance_km(self, obj: Car) -> float | None:
+        """Distance from the ?near= point, when the list was searched by location."""
+        distance = getattr(obj, "distance_km", None)
+        return round(distance, 1) if distance is not None else None
 
 
 class CarDetailSerializer(serializers.ModelSerializer):
-    """Serializer for Car detail view (full data)."""
+    """Serializer for Car detail view (full data). Renders cars.read_models.CarDetailRow."""
 
     brand = BrandSerializer(read_only=True)
     images = CarImageSerializer(many=True, read_only=True)
+    view_count = serializers.IntegerField(read_only=True)
+    inquiry_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Car
@@ -85,12 +110,31 @@ class CarDetailSerializer(serializers.ModelSerializer):
             "is_featured",
             "status",
             "images",
+            "latitude",
+            "longitude",
+            "country",
+            "region",
+            "view_count",
+            "inquiry_count",
             "created_at",
             "updated_at",
         ]
         read_only_fields = fields
 
 
+class CarPriceHistorySerializer(serializers.ModelSerializer):
+    """Serializer for a car's price history entries."""
+
+    class Meta:
+        model = CarPriceHistory
+        fields = [
+            "old_price",
+            "price",
+            "changed_at",
+        ]
+        read_only_fields = fields
+
+
 class InquiryCreateSerializer(serializers.ModelSerializer):
     """Serializer for creating inquiries (contact form submissions)."""
 
@@ -123,3 +167,107 @@ class InquiryCreateSerializer(serializers.ModelSerializer):
                 "Message must be less than 5000 characters."
             )
         return value
+
+
+class InquiryInboxSerializer(serializers.ModelSerializer):
+    """Serializer for inquiries in the seller inbox."""
+
+    car_model = serializers.CharField(source="car.model", read_only=True)
+    car_year = serializers.IntegerField(source="car.year", read_only=True)
+    brand_name = serializers.CharField(source="car.brand.name", read_only=True)
+    is_read = serializers.BooleanField()
+
+    class Meta:
+        model = Inquiry
+        fields = [
+            "id",
+            "car",
+            "car_model",
+            "car_year",
+            "brand_name",
+            "collector_name",
+            "collector_email",
+            "collector_phone",
+            "message",
+            "is_read",
+            "read_at",
+            "created_at",
+        ]
+        read_only_fields = [field for field in fields if field != "is_read"]
+
+    def update(self, instance: Inquiry, validated_data: dict) -> Inquiry:
+        """Only the read state can change; keep the first read time."""
+        is_read = validated_data.get("is_read", instance.is_read)
+        if is_read and instance.read_at is None:
+            instance.read_at = timezone.now()
+        elif not is_read:
+            instance.read_at = None
+        instance.save(update_fields=["read_at", "updated_at"])
+        return instance
+
+
+class CarBatchRequestSerializer(serializers.Serializer):
+    """Validates the id list for the bulk car detail endpoint."""
+
+    MAX_IDS = 100
+
+    ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=MAX_IDS,
+    )
+
+    def validate_ids(self, value: list) -> list:
+        """Drop duplicate ids while keeping the requested order."""
+        return list(dict.fromkeys(value))
+
+
+class GalleryOrderSerializer(serializers.Serializer):
+    """Validates a gallery reorder: every image id in the new order, and optionally the new primary."""
+
+    images = serializers.ListField(child=serializers.UUIDField(), allow_empty=False)
+    primary = serializers.UUIDField(required=False)
+
+    def validate_images(self, value: list) -> list:
+        if len(set(value)) != len(value):
+            raise serializers.ValidationError("List each image once.")
+        return value
+
+
+class CarBulkActionSerializer(serializers.Serializer):
+    """Validates a staff bulk status/featured change."""
+
+    MAX_IDS = 50_000
+
+    ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=MAX_IDS,
+    )
+    action = serializers.ChoiceField(choices=sorted(ACTIONS))
+
+
+class SavedSearchSerializer(serializers.ModelSerializer):
+    """Serializer for a collector's saved searches."""
+
+    class Meta:
+        model = SavedSearch
+        fields = [
+            "id",
+            "name",
+            "brand",
+            "year_min",
+            "year_max",
+            "max_price",
+            "is_active",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = ["id", "created_at", "updated_at"]
+
+    def validate(self, attrs: dict) -> dict:
+        year_min = attrs.get("year_min", getattr(self.instance, "year_min", None))
+        year_max = attrs.get("year_max", getattr(self.instance, "year_max", None))
+        if year_min is not None and year_max is not None and year_min > year_max:
+            raise serializers.ValidationError({"year_max": "Must not be earlier than year_min."})
+        return attrs
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import outbox
+from .cache import car_detail_cache
+from .histograms import invalidate_histograms
+from .models import Brand, Car, CarImage, CarPriceHistory, ListingEvent
+
+TOPICS = {
+    Car: ListingEvent.Topic.CAR,
+    CarImage: ListingEvent.Topic.CAR_IMAGE,
+    Brand: ListingEvent.Topic.BRAND,
+}
+
+
+@receiver(post_save, sender=Car)
+def record_price_change(sender: type[Car], instance: Car, created: bool, **kwargs: Any) -> None:
+    """Append a price history row when a car is created or its price changes."""
+    if kwargs.get("raw"):
+        return
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and "price" not in update_fields:
+        return
+
+    previous = None if created else getattr(instance, "_loaded_price", None)
+    if not created and previous is None:
+        # The price wasn't loaded (deferred, or an instance built by hand), so
+        # compare against the last recorded one instead of logging a fake change.
+        previous = instance.price_history.order_by("-changed_at", "-id").values_list("price", flat=True).first()
+        if previous is None:
+            return
+    if not created and previous == instance.price:
+        return
+
+    CarPriceHistory.objects.create(car=instance, old_price=previous, price=instance.price)
+    instance._loaded_price = instance.price
+
+
+@receiver(post_save, sender=Car)
+def record_car_saved(sender: type[Car], instance: Car, created: bool, **kwargs: Any) -> None:
+    """Append an outbox event; `activated` marks a car that just went active."""
+    if kwargs.get("raw"):
+        return
+    update_fields = kwargs.get("update_fields")
+    status_saved = update_fields is None or "status" in update_fields
+    activated = (
+        status_saved
+        and instance.status == Car.Status.ACTIVE
+        and (created or getattr(instance, "_loaded_status", None) != Car.Status.ACTIVE)
+    )
+    outbox.record(
+        ListingEvent.Topic.CAR,
+        ListingEvent.Action.SAVED,
+        instance.pk,
+        car_id=instance.pk,
+        created=created,
+        activated=activated,
+        fields=sorted(update_fields) if update_fields is not None else None,
+    )
+    if status_saved:
+        instance._loaded_status = instance.status
+
+
+@receiver(post_save, sender=CarImage)
+@receiver(post_save, sender=Brand)
+def record_saved(sender: type, instance: Any, created: bool, **kwargs: Any) -> None:
+    if kwargs.get("raw"):
+        return
+    outbox.record(TOPICS[sender], ListingEvent.Action.SAVED, instance.pk, car_id=getattr(instance, "car_id", None), created=created)
+
+
+@receiver(post_delete, sender=Car)
+@receiver(post_delete, sender=CarImage)
+@receiver(post_delete, sender=Brand)
+def record_deleted(sender: type, instance: Any, **kwargs: Any) -> None:
+    car_id = instance.pk if sender is Car else getattr(instance, "car_id", None)
+    outbox.record(TOPICS[sender], ListingEvent.Action.DELETED, instance.pk, car_id=car_id)
+
+
+@receiver(post_save, sender=Car)
+@receiver(post_delete, sender=Car)
+def invalidate_car_histograms(sender: type[Car], **kwargs: Any) -> None:
+    transaction.on_commit(invalidate_histograms)
+
+
+@receiver(post_save, sender=Car)
+@receiver(post_delete, sender=Car)
+def invalidate_car_detail(sender: type[Car], instance: Car, **kwargs: Any) -> None:
+    """Mark the car's cached detail payload stale once the write commits."""
+    car_id = instance.pk  # Cleared on the instance after a delete
+    transaction.on_commit(lambda: car_detail_cache.invalidate(car_id))
+
+
+@receiver(post_save, sender=CarImage)
+@receiver(post_delete, sender=CarImage)
+def invalidate_car_detail_for_image(sender: type[CarImage], instance: CarImage, **kwargs: Any) -> None:
+    car_id = instance.car_id
+    transaction.on_commit(lambda: car_detail_cache.invalidate(car_id))
+
+
+@receiver(post_save, sender=Brand)
+def invalidate_brand_car_details(sender: type[Brand], instance: Brand, created: bool, **kwargs: Any) -> None:
+    """The brand's name, logo and description are embedded in every car detail payload."""
+    if created or kwargs.get("raw") or not instance.payload_changed(kwargs.get("update_fields")):
+        return
+    instance._loaded_payload = tuple(getattr(instance, name) for name in Brand.PAYLOAD_FIELDS)
+    car_ids = list(instance.cars.values_list("pk", flat=True))
+    transaction.on_commit(lambda: car_detail_cache.invalidate_many(car_ids))
@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Any
+from typing import Any, Callable
 
-from cars.models import Brand, Car, CarImage, Inquiry
+from cars.models import Brand, Car, CarImage, Inquiry, SavedSearch
 
 
 def create_brand(
@@ -49,6 +49,37 @@ def create_car(
     )
 
 
+def create_cars(
+    n: int,
+    brand: Brand | None = None,
+    model: str | Callable[[int], str] = lambda i: f"Car {i}",
+    year: int | Callable[[int], int] = 1962,
+    price: Decimal | str | Callable[[int], Decimal | str] = "25000000.00",
+    status: str | Callable[[int], str] = Car.Status.ACTIVE,
+    **kwargs: Any,
+) -> list[Car]:
+    """
+    Create n test cars with one bulk INSERT.
+
+    Any field may be given as a callable, called with the car's index
+    (0..n-1) to vary values across the batch. bulk_create skips save() and
+    signals: the geohash is filled in here, but caches and saved-search
+    alerts are not touched.
+    """
+    if brand is None:
+        brand = create_brand()
+    fields = {"model": model, "year": year, "price": price, "status": status, **kwargs}
+    cars = []
+    for i in range(n):
+        values = {name: value(i) if callable(value) else value for name, value in fields.items()}
+        if isinstance(values["price"], str):
+            values["price"] = Decimal(values["price"])
+        car = Car(brand=brand, **values)
+        car.geohash = car.compute_geohash()
+        cars.append(car)
+    return Car.objects.bulk_create(cars)
+
+
 def create_car_image(
     car: Car | None = None,
     image_url: str = "https://example.com/car-image.jpg",
@@ -89,3 +120,8 @@ def create_inquiry(
         message=message,
         **kwargs,
     )
+
+
+def create_saved_search(user, **kwargs: Any) -> SavedSearch:
+    """Create a saved search; with no filters it matches every car."""
+    return SavedSearch.objects.create(user=user, **kwargs)
@@ -0,0 +1,111 @@
+"""
+Car-specific test fixtures.
+
+`seeded_catalog` is a read-mostly catalog (brands, cars, images,
+inquiries, price history, saved searches) written once per test class
+through bulk inserts, like TestCase.setUpTestData: it is written inside a
+transaction that is rolled back when the class finishes, so nothing is
+committed and tests outside the class never see it. Each test's own
+transaction nests inside it, so changes a test makes on top of the catalog
+are rolled back as usual. Keep tests that use it in their own classes.
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+import pytest
+from django.db import transaction
+
+from accounts.models import User
+from accounts.tests.helpers import create_user
+from cars.models import Brand, Car, CarImage, CarPriceHistory, Inquiry, SavedSearch
+from cars.tests.factories import create_cars
+
+SEED_BRANDS = ["Alfa Romeo", "Aston Martin", "Jaguar", "Lancia"]
+SEED_CARS_PER_BRAND = 50
+SEED_SAVED_SEARCHES = 300
+_STATUSES = [Car.Status.ACTIVE] * 7 + [Car.Status.DRAFT, Car.Status.SOLD, Car.Status.ARCHIVED]
+
+
+@dataclass
+class SeededCatalog:
+    seller: User
+    collector: User
+    brands: list[Brand]
+    cars: list[Car]
+    saved_searches: list[SavedSearch] = field(default_factory=list)
+
+    @property
+    def active_cars(self) -> list[Car]:
+        return [car for car in self.cars if car.status == Car.Status.ACTIVE]
+
+
+def seed_catalog(seed: int = 0) -> SeededCatalog:
+    """Write the catalog with one INSERT per table (per brand for cars)."""
+    rng = random.Random(seed)
+    seller = create_user(email="seed-seller@example.com", first_name="Seed", last_name="Seller")
+    collector = create_user(email="seed-collector@example.com", first_name="Seed", last_name="Collector")
+    brands = Brand.objects.bulk_create([Brand(name=name) for name in SEED_BRANDS])
+
+    cars = []
+    for brand in brands:
+        cars += create_cars(
+            SEED_CARS_PER_BRAND,
+            brand=brand,
+            model=lambda i, brand=brand: f"{brand.name} {i}",
+            year=lambda i: 1950 + i,
+            price=lambda i: Decimal(rng.randrange(20_000, 2_000_000, 500)),
+            status=lambda i: _STATUSES[i % len(_STATUSES)],
+            is_featured=lambda i: i % 10 == 0,
+            latitude=lambda i: 36 + i * 0.3,
+            longitude=lambda i: 6 + i * 0.17 % 12,
+            seller=seller,
+        )
+    CarImage.objects.bulk_create(
+        CarImage(car=car, image_url=f"https://example.com/{car.pk}/{n}.jpg", is_primary=n == 0, sort_order=n)
+        for car in cars
+        for n in range(2)
+    )
+    Inquiry.objects.bulk_create(
+        Inquiry(
+            car=car,
+            collector_name=f"Collector {n}",
+            collector_email=f"collector{n}@example.com",
+            message="Is this car still available for viewing?",
+        )
+        for car in cars[:60]
+        for n in range(2)
+    )
+    CarPriceHistory.objects.bulk_create(
+        # Two price cuts of 1000 ending at the current price
+        CarPriceHistory(car=car, old_price=car.price + 1000 * (3 - n) if n else None, price=car.price + 1000 * (2 - n))
+        for car in cars[:20]
+        for n in range(3)
+    )
+
+    searches = []
+    for _ in range(SEED_SAVED_SEARCHES):
+        year_min = rng.choice([None, rng.randint(1940, 2000)])
+        searches.append(
+            SavedSearch(
+                user=collector,
+                brand=rng.choice([None, *brands]),
+                year_min=year_min,
+                year_max=rng.choice([None, (year_min or 1940) + rng.randint(-5, 70)]),
+                max_price=rng.choice([None, Decimal(rng.randrange(10_000, 500_000, 1000))]),
+            )
+        )
+    saved_searches = SavedSearch.objects.bulk_create(searches)
+    return SeededCatalog(seller, collector, brands, cars, saved_searches)
+
+
+@pytest.fixture(scope="class")
+def seeded_catalog(django_db_setup, django_db_blocker) -> SeededCatalog:
+    """The shared catalog, rolled back after the class that requested it."""
+    with django_db_blocker.unblock(), transaction.atomic():
+        catalog = seed_catalog()
+        with django_db_blocker.block():
+            yield catalog
+        transaction.set_rollback(True)
@@ -0,0 +1,7 @@
+-- GET /api/cars/brands/<id>/
+-- 1 statements
+
+-- [1]
+SELECT "brands"."id", "brands"."created_at", "brands"."updated_at", "brands"."name", "brands"."logo_url", "brands"."description" FROM "brands" WHERE "brands"."id" = '<uuid>' LIMIT 21;
+-- plan:
+--   SEARCH brands USING INDEX sqlite_autoindex_brands_1 (id=?)
@@ -0,0 +1,12 @@
+-- GET /api/cars/brands/
+-- 1 statements
+
+-- [1]
+SELECT "brands"."id", "brands"."created_at", "brands"."updated_at", "brands"."name", "brands"."logo_url", "brands"."description", COUNT("cars"."id") FILTER (WHERE "cars"."status" = 'active') AS "active_count", CAST(MIN("cars"."price") FILTER (WHERE "cars"."status" = 'active') AS NUMERIC) AS "min_price", CAST(MAX("cars"."price") FILTER (WHERE "cars"."status" = 'active') AS NUMERIC) AS "max_price", MIN("cars"."year") FILTER (WHERE "cars"."status" = 'active') AS "year_min", MAX("cars"."year") FILTER (WHERE "cars"."status" = 'active') AS "year_max", (SELECT U0."image_url" FROM "car_images" U0 INNER JOIN "cars" U1 ON (U0."car_id" = U1."id") WHERE (U1."brand_id" = ("brands"."id") AND U1."status" = 'active') ORDER BY U1."is_featured" DESC, U1."created_at" DESC, U0."is_primary" DESC, U0."sort_order" ASC LIMIT 1) AS "representative_image" FROM "brands" LEFT OUTER JOIN "cars" ON ("brands"."id" = "cars"."brand_id") GROUP BY "brands"."id", "brands"."created_at", "brands"."updated_at", "brands"."name", "brands"."logo_url", "brands"."description";
+-- plan:
+--   SCAN brands USING INDEX sqlite_autoindex_brands_1
+--   SEARCH cars USING INDEX cars_brand_id_352319d1 (brand_id=?) LEFT-JOIN
+--   CORRELATED SCALAR SUBQUERY 1
+--     SEARCH U1 USING INDEX cars_brand_id_352319d1 (brand_id=?)
+--     SEARCH U0 USING INDEX car_image_gallery_idx (car_id=?)
+--     USE TEMP B-TREE FOR ORDER BY
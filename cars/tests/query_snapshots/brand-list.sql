@@ -0,0 +1,7 @@
+-- GET /api/cars/brands/
+-- 1 statements
+
+-- [1]
+SELECT "brands"."id", "brands"."created_at", "brands"."updated_at", "brands"."name", "brands"."logo_url", "brands"."description" FROM "brands" ORDER BY "brands"."name" ASC;
+-- plan:
+--   SCAN brands USING INDEX sqlite_autoindex_brands_2
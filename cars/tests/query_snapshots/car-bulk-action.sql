@@ -0,0 +1,22 @@
+-- POST /api/cars/bulk/
+-- 5 statements
+
+-- [1]
+SAVEPOINT "<savepoint>";
+
+-- [2]
+SELECT "cars"."id" FROM "cars" WHERE ("cars"."id" IN ('<uuid>', '<uuid>', '<uuid>', '<uuid>', '<uuid>', '<uuid>', '<uuid>', '<uuid>', '<uuid>', '<uuid>') AND NOT ("cars"."is_featured")) ORDER BY "cars"."created_at" DESC;
+-- plan:
+--   SEARCH cars USING INDEX sqlite_autoindex_cars_1 (id=?)
+--   USE TEMP B-TREE FOR ORDER BY
+
+-- [3]
+UPDATE "cars" SET "is_featured" = 1, "updated_at" = '<timestamp>' WHERE "cars"."id" IN ('<uuid>', '<uuid>', '<uuid>', '<uuid>', '<uuid>', '<uuid>', '<uuid>', '<uuid>', '<uuid>');
+-- plan:
+--   SEARCH cars USING INDEX sqlite_autoindex_cars_1 (id=?)
+
+-- [4]
+INSERT INTO "listing_events" ("topic", "action", "object_id", "car_id", "data", "txid", "created_at") VALUES ('car', 'saved', '<uuid>', '<uuid>', '{"created": false, "activated": false, "fields": ["is_featured"]}', 0, '<timestamp>'), ('car', 'saved', '<uuid>', '<uuid>', '{"created": false, "activated": false, "fields": ["is_featured"]}', 0, '<timestamp>'), ('car', 'saved', '<uuid>', '<uuid>', '{"created": false, "activated": false, "fields": ["is_featured"]}', 0, '<timestamp>'), ('car', 'saved', '<uuid>', '<uuid>', '{"created": false, "activated": false, "fields": ["is_featured"]}', 0, '<timestamp>'), ('car', 'saved', '<uuid>', '<uuid>', '{"created": false, "activated": false, "fields": ["is_featured"]}', 0, '<timestamp>'), ('car', 'saved', '<uuid>', '<uuid>', '{"created": false, "activated": false, "fields": ["is_featured"]}', 0, '<timestamp>'), ('car', 'saved', '<uuid>', '<uuid>', '{"created": false, "activated": false, "fields": ["is_featured"]}', 0, '<timestamp>'), ('car', 'saved', '<uuid>', '<uuid>', '{"created": false, "activated": false, "fields": ["is_featured"]}', 0, '<timestamp>'), ('car', 'saved', '<uuid>', '<uuid>', '{"created": false, "activated": false, "fields": ["is_featured"]}', 0, '<timestamp>') RETURNING "listing_events"."id";
+
+-- [5]
+RELEASE SAVEPOINT "<savepoint>";
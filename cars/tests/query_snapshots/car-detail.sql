@@ -0,0 +1,34 @@
+-- GET /api/cars/<id>/
+-- 7 statements
+
+-- [1]
+SELECT "cars"."id", "cars"."model", "cars"."year", "cars"."price", "cars"."description", "cars"."is_featured", "cars"."status", "cars"."latitude", "cars"."longitude", "cars"."country", "cars"."region", "cars"."created_at", "cars"."updated_at", "cars"."brand_id", "brands"."name", "brands"."logo_url", "brands"."description", "brands"."created_at", "brands"."updated_at", COALESCE("car_counters"."views", 0) AS "view_count", COALESCE("car_counters"."inquiries", 0) AS "inquiry_count" FROM "cars" LEFT OUTER JOIN "car_counters" ON ("cars"."id" = "car_counters"."car_id") INNER JOIN "brands" ON ("cars"."brand_id" = "brands"."id") WHERE ("cars"."id" = '<uuid>' AND "cars"."status" = 'active') ORDER BY "cars"."created_at" DESC;
+-- plan:
+--   SEARCH cars USING INDEX sqlite_autoindex_cars_1 (id=?)
+--   SEARCH car_counters USING INDEX sqlite_autoindex_car_counters_1 (car_id=?) LEFT-JOIN
+--   SEARCH brands USING INDEX sqlite_autoindex_brands_1 (id=?)
+--   USE TEMP B-TREE FOR ORDER BY
+
+-- [2]
+SELECT "car_images"."car_id", "car_images"."id", "car_images"."image_url", "car_images"."alt_text", "car_images"."is_primary", "car_images"."sort_order" FROM "car_images" WHERE "car_images"."car_id" IN ('<uuid>') ORDER BY "car_images"."sort_order" ASC, "car_images"."created_at" ASC;
+-- plan:
+--   SEARCH car_images USING INDEX car_image_gallery_idx (car_id=?)
+
+-- [3]
+UPDATE "car_counter_shards" SET "views" = ("car_counter_shards"."views" + 1) WHERE ("car_counter_shards"."car_id" = '<uuid>' AND "car_counter_shards"."shard" = 0);
+-- plan:
+--   SEARCH car_counter_shards USING INDEX sqlite_autoindex_car_counter_shards_1 (car_id=? AND shard=?)
+
+-- [4]
+SAVEPOINT "<savepoint>";
+
+-- [5]
+INSERT OR IGNORE INTO "car_counter_shards" ("car_id", "shard", "views", "inquiries") VALUES ('<uuid>', 0, 0, 0);
+
+-- [6]
+UPDATE "car_counter_shards" SET "views" = ("car_counter_shards"."views" + 1) WHERE ("car_counter_shards"."car_id" = '<uuid>' AND "car_counter_shards"."shard" = 0);
+-- plan:
+--   SEARCH car_counter_shards USING INDEX sqlite_autoindex_car_counter_shards_1 (car_id=? AND shard=?)
+
+-- [7]
+RELEASE SAVEPOINT "<savepoint>";
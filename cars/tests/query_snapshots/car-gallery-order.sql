@@ -0,0 +1,31 @@
+-- POST /api/cars/<id>/images/order/
+-- 7 statements
+
+-- [1]
+SELECT "cars"."id", "cars"."created_at", "cars"."updated_at", "cars"."brand_id", "cars"."seller_id", "cars"."model", "cars"."year", "cars"."price", "cars"."description", "cars"."is_featured", "cars"."status", "cars"."latitude", "cars"."longitude", "cars"."country", "cars"."region", "cars"."geohash" FROM "cars" WHERE ("cars"."seller_id" = '<uuid>' AND "cars"."id" = '<uuid>') LIMIT 21;
+-- plan:
+--   SEARCH cars USING INDEX sqlite_autoindex_cars_1 (id=?)
+
+-- [2]
+SAVEPOINT "<savepoint>";
+
+-- [3]
+SELECT "car_images"."id", "car_images"."is_primary" FROM "car_images" WHERE "car_images"."car_id" = '<uuid>';
+-- plan:
+--   SEARCH car_images USING INDEX car_image_gallery_idx (car_id=?)
+
+-- [4]
+UPDATE "car_images" SET "sort_order" = CASE WHEN ("car_images"."id" = '<uuid>') THEN 0 WHEN ("car_images"."id" = '<uuid>') THEN 1 ELSE NULL END, "updated_at" = '<timestamp>' WHERE "car_images"."car_id" = '<uuid>';
+-- plan:
+--   SEARCH car_images USING INDEX car_image_gallery_idx (car_id=?)
+
+-- [5]
+INSERT INTO "listing_events" ("topic", "action", "object_id", "car_id", "data", "txid", "created_at") VALUES ('car_image', 'saved', '<uuid>', '<uuid>', '{"created": false, "fields": ["sort_order"]}', 0, '<timestamp>'), ('car_image', 'saved', '<uuid>', '<uuid>', '{"created": false, "fields": ["sort_order"]}', 0, '<timestamp>') RETURNING "listing_events"."id";
+
+-- [6]
+RELEASE SAVEPOINT "<savepoint>";
+
+-- [7]
+SELECT "car_images"."id", "car_images"."created_at", "car_images"."updated_at", "car_images"."car_id", "car_images"."image_url", "car_images"."alt_text", "car_images"."is_primary", "car_images"."sort_order" FROM "car_images" WHERE "car_images"."car_id" = '<uuid>' ORDER BY "car_images"."sort_order" ASC, "car_images"."created_at" ASC;
+-- plan:
+--   SEARCH car_images USING INDEX car_image_gallery_idx (car_id=?)
@@ -0,0 +1,13 @@
+-- GET /api/cars/stats/histogram/
+-- 2 statements
+
+-- [1]
+SELECT CAST(MIN("cars"."price") AS NUMERIC) AS "low", CAST(MAX("cars"."price") AS NUMERIC) AS "high", COUNT("cars"."id") AS "total" FROM "cars" WHERE ("cars"."brand_id" = '<uuid>' AND "cars"."status" = 'active');
+-- plan:
+--   SEARCH cars USING INDEX car_active_brand_idx (brand_id=?)
+
+-- [2]
+SELECT CAST(MIN(FLOOR(((CAST("cars"."price" AS real) - 102500.0) / 179800.0)), 9.0) AS integer) AS "bucket", COUNT("cars"."id") AS "count" FROM "cars" WHERE ("cars"."brand_id" = '<uuid>' AND "cars"."status" = 'active') GROUP BY 1;
+-- plan:
+--   SEARCH cars USING INDEX car_active_brand_idx (brand_id=?)
+--   USE TEMP B-TREE FOR GROUP BY
@@ -0,0 +1,34 @@
+-- GET /api/cars/
+-- 2 statements
+
+-- [1]
+SELECT COUNT(*) AS "__count" FROM "cars" WHERE ("cars"."status" = 'active' AND (("cars"."geohash" >= 'spy' AND "cars"."geohash" < 'sq') OR ("cars"."geohash" >= 'srb' AND "cars"."geohash" < 'src') OR ("cars"."geohash" >= 'u0n' AND "cars"."geohash" < 'u0q') OR ("cars"."geohash" >= 'u20' AND "cars"."geohash" < 'u21')) AND "cars"."latitude" >= 4.41006796362754585052e+01 AND "cars"."latitude" <= 4.58993203637245414947e+01 AND "cars"."longitude" >= 9.80772694484739 AND "cars"."longitude" <= 1.23922730551526090177e+01 AND (12742.0176 * ASIN(SQRT((POWER(SIN(((RADIANS("cars"."latitude") - 7.85398163397448278999e-01) / 2)), 2) + ((7.07106781186547572737e-01 * COS(RADIANS("cars"."latitude"))) * POWER(SIN(((RADIANS("cars"."longitude") - 1.93731546971370571785e-01) / 2)), 2)))))) <= 100.0);
+-- plan:
+--   MULTI-INDEX OR
+--     INDEX 1
+--       SEARCH cars USING INDEX car_geohash_idx (geohash>? AND geohash<?)
+--     INDEX 2
+--       SEARCH cars USING INDEX car_geohash_idx (geohash>? AND geohash<?)
+--     INDEX 3
+--       SEARCH cars USING INDEX car_geohash_idx (geohash>? AND geohash<?)
+--     INDEX 4
+--       SEARCH cars USING INDEX car_geohash_idx (geohash>? AND geohash<?)
+
+-- [2]
+SELECT "cars"."id", "cars"."model", "cars"."year", "cars"."price", "cars"."is_featured", "cars"."status", "cars"."country", "cars"."region", "cars"."created_at", "cars"."brand_id", "brands"."name", "brands"."logo_url", "brands"."description", "brands"."created_at", "brands"."updated_at", (12742.0176 * ASIN(SQRT((POWER(SIN(((RADIANS("cars"."latitude") - 7.85398163397448278999e-01) / 2)), 2) + ((7.07106781186547572737e-01 * COS(RADIANS("cars"."latitude"))) * POWER(SIN(((RADIANS("cars"."longitude") - 1.93731546971370571785e-01) / 2)), 2)))))) AS "distance_km", COALESCE((SELECT U0."image_url" FROM "car_images" U0 WHERE (U0."car_id" = ("cars"."id") AND U0."is_primary") LIMIT 1), (SELECT U0."image_url" FROM "car_images" U0 WHERE U0."car_id" = ("cars"."id") ORDER BY U0."sort_order" ASC, U0."created_at" ASC LIMIT 1)) AS "primary_image" FROM "cars" INNER JOIN "brands" ON ("cars"."brand_id" = "brands"."id") WHERE ("cars"."status" = 'active' AND (("cars"."geohash" >= 'spy' AND "cars"."geohash" < 'sq') OR ("cars"."geohash" >= 'srb' AND "cars"."geohash" < 'src') OR ("cars"."geohash" >= 'u0n' AND "cars"."geohash" < 'u0q') OR ("cars"."geohash" >= 'u20' AND "cars"."geohash" < 'u21')) AND "cars"."latitude" >= 4.41006796362754585052e+01 AND "cars"."latitude" <= 4.58993203637245414947e+01 AND "cars"."longitude" >= 9.80772694484739 AND "cars"."longitude" <= 1.23922730551526090177e+01 AND (12742.0176 * ASIN(SQRT((POWER(SIN(((RADIANS("cars"."latitude") - 7.85398163397448278999e-01) / 2)), 2) + ((7.07106781186547572737e-01 * COS(RADIANS("cars"."latitude"))) * POWER(SIN(((RADIANS("cars"."longitude") - 1.93731546971370571785e-01) / 2)), 2)))))) <= 100.0) ORDER BY 16 ASC, "cars"."created_at" DESC LIMIT 12;
+-- plan:
+--   MULTI-INDEX OR
+--     INDEX 1
+--       SEARCH cars USING INDEX car_geohash_idx (geohash>? AND geohash<?)
+--     INDEX 2
+--       SEARCH cars USING INDEX car_geohash_idx (geohash>? AND geohash<?)
+--     INDEX 3
+--       SEARCH cars USING INDEX car_geohash_idx (geohash>? AND geohash<?)
+--     INDEX 4
+--       SEARCH cars USING INDEX car_geohash_idx (geohash>? AND geohash<?)
+--   SEARCH brands USING INDEX sqlite_autoindex_brands_1 (id=?)
+--   CORRELATED SCALAR SUBQUERY 1
+--     SEARCH U0 USING INDEX car_image_one_primary (car_id=?)
+--   CORRELATED SCALAR SUBQUERY 2
+--     SEARCH U0 USING INDEX car_image_gallery_idx (car_id=?)
+--   USE TEMP B-TREE FOR ORDER BY
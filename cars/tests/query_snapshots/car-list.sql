@@ -0,0 +1,17 @@
+-- GET /api/cars/
+-- 2 statements
+
+-- [1]
+SELECT COUNT(*) AS "__count" FROM "cars" WHERE "cars"."status" = 'active';
+-- plan:
+--   SCAN cars USING INDEX car_active_created_idx
+
+-- [2]
+SELECT "cars"."id", "cars"."model", "cars"."year", "cars"."price", "cars"."is_featured", "cars"."status", "cars"."country", "cars"."region", "cars"."created_at", "cars"."brand_id", "brands"."name", "brands"."logo_url", "brands"."description", "brands"."created_at", "brands"."updated_at", COALESCE((SELECT U0."image_url" FROM "car_images" U0 WHERE (U0."car_id" = ("cars"."id") AND U0."is_primary") LIMIT 1), (SELECT U0."image_url" FROM "car_images" U0 WHERE U0."car_id" = ("cars"."id") ORDER BY U0."sort_order" ASC, U0."created_at" ASC LIMIT 1)) AS "primary_image" FROM "cars" INNER JOIN "brands" ON ("cars"."brand_id" = "brands"."id") WHERE "cars"."status" = 'active' ORDER BY "cars"."created_at" DESC LIMIT 20;
+-- plan:
+--   SCAN cars USING INDEX car_active_created_idx
+--   SEARCH brands USING INDEX sqlite_autoindex_brands_1 (id=?)
+--   CORRELATED SCALAR SUBQUERY 1
+--     SEARCH U0 USING INDEX car_image_one_primary (car_id=?)
+--   CORRELATED SCALAR SUBQUERY 2
+--     SEARCH U0 USING INDEX car_image_gallery_idx (car_id=?)
@@ -0,0 +1,17 @@
+-- GET /api/cars/<id>/price-history/
+-- 3 statements
+
+-- [1]
+SELECT "cars"."id", "cars"."created_at", "cars"."updated_at", "cars"."brand_id", "cars"."seller_id", "cars"."model", "cars"."year", "cars"."price", "cars"."description", "cars"."is_featured", "cars"."status", "cars"."latitude", "cars"."longitude", "cars"."country", "cars"."region", "cars"."geohash" FROM "cars" WHERE ("cars"."status" = 'active' AND "cars"."id" = '<uuid>') LIMIT 21;
+-- plan:
+--   SEARCH cars USING INDEX sqlite_autoindex_cars_1 (id=?)
+
+-- [2]
+SELECT COUNT(*) AS "__count" FROM "car_price_history" WHERE "car_price_history"."car_id" = '<uuid>';
+-- plan:
+--   SEARCH car_price_history USING COVERING INDEX price_history_car_changed_idx (car_id=?)
+
+-- [3]
+SELECT "car_price_history"."id", "car_price_history"."car_id", "car_price_history"."old_price", "car_price_history"."price", "car_price_history"."changed_at" FROM "car_price_history" WHERE "car_price_history"."car_id" = '<uuid>' ORDER BY "car_price_history"."changed_at" DESC LIMIT 3;
+-- plan:
+--   SEARCH car_price_history USING INDEX price_history_car_changed_idx (car_id=?)
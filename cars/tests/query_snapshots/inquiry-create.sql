@@ -0,0 +1,29 @@
+-- POST /api/cars/inquiries/
+-- 7 statements
+
+-- [1]
+SELECT "cars"."id", "cars"."created_at", "cars"."updated_at", "cars"."brand_id", "cars"."seller_id", "cars"."model", "cars"."year", "cars"."price", "cars"."description", "cars"."is_featured", "cars"."status", "cars"."latitude", "cars"."longitude", "cars"."country", "cars"."region", "cars"."geohash" FROM "cars" WHERE "cars"."id" = '<uuid>' LIMIT 21;
+-- plan:
+--   SEARCH cars USING INDEX sqlite_autoindex_cars_1 (id=?)
+
+-- [2]
+INSERT INTO "inquiries" ("id", "created_at", "updated_at", "car_id", "collector_name", "collector_email", "collector_phone", "message", "read_at") VALUES ('<uuid>', '<timestamp>', '<timestamp>', '<uuid>', 'Jane Doe', 'jane@example.com', '', 'I would like to arrange a viewing of this car.', NULL);
+
+-- [3]
+UPDATE "car_counter_shards" SET "inquiries" = ("car_counter_shards"."inquiries" + 1) WHERE ("car_counter_shards"."car_id" = '<uuid>' AND "car_counter_shards"."shard" = 0);
+-- plan:
+--   SEARCH car_counter_shards USING INDEX sqlite_autoindex_car_counter_shards_1 (car_id=? AND shard=?)
+
+-- [4]
+SAVEPOINT "<savepoint>";
+
+-- [5]
+INSERT OR IGNORE INTO "car_counter_shards" ("car_id", "shard", "views", "inquiries") VALUES ('<uuid>', 0, 0, 0);
+
+-- [6]
+UPDATE "car_counter_shards" SET "inquiries" = ("car_counter_shards"."inquiries" + 1) WHERE ("car_counter_shards"."car_id" = '<uuid>' AND "car_counter_shards"."shard" = 0);
+-- plan:
+--   SEARCH car_counter_shards USING INDEX sqlite_autoindex_car_counter_shards_1 (car_id=? AND shard=?)
+
+-- [7]
+RELEASE SAVEPOINT "<savepoint>";
@@ -0,0 +1,9 @@
+-- GET /api/cars/inquiries/<id>/
+-- 1 statements
+
+-- [1]
+SELECT "inquiries"."id", "inquiries"."created_at", "inquiries"."updated_at", "inquiries"."car_id", "inquiries"."collector_name", "inquiries"."collector_email", "inquiries"."collector_phone", "inquiries"."message", "inquiries"."read_at", "cars"."id", "cars"."created_at", "cars"."updated_at", "cars"."brand_id", "cars"."seller_id", "cars"."model", "cars"."year", "cars"."price", "cars"."description", "cars"."is_featured", "cars"."status", "cars"."latitude", "cars"."longitude", "cars"."country", "cars"."region", "cars"."geohash", "brands"."id", "brands"."created_at", "brands"."updated_at", "brands"."name", "brands"."logo_url", "brands"."description" FROM "inquiries" INNER JOIN "cars" ON ("inquiries"."car_id" = "cars"."id") INNER JOIN "brands" ON ("cars"."brand_id" = "brands"."id") WHERE ("cars"."seller_id" = '<uuid>' AND "inquiries"."id" = '<uuid>') LIMIT 21;
+-- plan:
+--   SEARCH inquiries USING INDEX sqlite_autoindex_inquiries_1 (id=?)
+--   SEARCH cars USING INDEX sqlite_autoindex_cars_1 (id=?)
+--   SEARCH brands USING INDEX sqlite_autoindex_brands_1 (id=?)
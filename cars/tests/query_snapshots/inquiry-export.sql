@@ -0,0 +1,10 @@
+-- GET /api/cars/inquiries/export/
+-- 1 statements
+
+-- [1]
+SELECT "inquiries"."id", "inquiries"."created_at", "inquiries"."read_at", "inquiries"."collector_name", "inquiries"."collector_email", "inquiries"."collector_phone", "inquiries"."message", "inquiries"."car_id", "brands"."name", "cars"."model", "cars"."year", "cars"."price" FROM "inquiries" INNER JOIN "cars" ON ("inquiries"."car_id" = "cars"."id") INNER JOIN "brands" ON ("cars"."brand_id" = "brands"."id") WHERE ("cars"."seller_id" = '<uuid>' AND "cars"."brand_id" = '<uuid>') ORDER BY "inquiries"."created_at" DESC;
+-- plan:
+--   SEARCH brands USING INDEX sqlite_autoindex_brands_1 (id=?)
+--   SEARCH cars USING INDEX cars_brand_id_352319d1 (brand_id=?)
+--   SEARCH inquiries USING INDEX inquiry_car_created_idx (car_id=?)
+--   USE TEMP B-TREE FOR ORDER BY
@@ -0,0 +1,10 @@
+-- GET /api/cars/inquiries/
+-- 1 statements
+
+-- [1]
+SELECT "inquiries"."id", "inquiries"."created_at", "inquiries"."updated_at", "inquiries"."car_id", "inquiries"."collector_name", "inquiries"."collector_email", "inquiries"."collector_phone", "inquiries"."message", "inquiries"."read_at", "cars"."id", "cars"."created_at", "cars"."updated_at", "cars"."brand_id", "cars"."seller_id", "cars"."model", "cars"."year", "cars"."price", "cars"."description", "cars"."is_featured", "cars"."status", "cars"."latitude", "cars"."longitude", "cars"."country", "cars"."region", "cars"."geohash", "brands"."id", "brands"."created_at", "brands"."updated_at", "brands"."name", "brands"."logo_url", "brands"."description" FROM "inquiries" INNER JOIN "cars" ON ("inquiries"."car_id" = "cars"."id") INNER JOIN "brands" ON ("cars"."brand_id" = "brands"."id") WHERE "cars"."seller_id" = '<uuid>' ORDER BY "inquiries"."created_at" DESC LIMIT 51;
+-- plan:
+--   SEARCH cars USING INDEX cars_seller_id_6d639014 (seller_id=?)
+--   SEARCH brands USING INDEX sqlite_autoindex_brands_1 (id=?)
+--   SEARCH inquiries USING INDEX inquiry_car_created_idx (car_id=?)
+--   USE TEMP B-TREE FOR ORDER BY
@@ -0,0 +1,10 @@
+-- POST /api/cars/saved-searches/
+-- 2 statements
+
+-- [1]
+SELECT "brands"."id", "brands"."created_at", "brands"."updated_at", "brands"."name", "brands"."logo_url", "brands"."description" FROM "brands" WHERE "brands"."id" = '<uuid>' LIMIT 21;
+-- plan:
+--   SEARCH brands USING INDEX sqlite_autoindex_brands_1 (id=?)
+
+-- [2]
+INSERT INTO "saved_searches" ("id", "created_at", "updated_at", "user_id", "name", "brand_id", "year_min", "year_max", "max_price", "is_active") VALUES ('<uuid>', '<timestamp>', '<timestamp>', '<uuid>', 'Lancias', '<uuid>', 1960, NULL, '150000.00', 1);
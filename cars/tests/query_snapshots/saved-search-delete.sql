@@ -0,0 +1,18 @@
+-- DELETE /api/cars/saved-searches/<id>/
+-- 3 statements
+
+-- [1]
+SELECT "saved_searches"."id", "saved_searches"."created_at", "saved_searches"."updated_at", "saved_searches"."user_id", "saved_searches"."name", "saved_searches"."brand_id", "saved_searches"."year_min", "saved_searches"."year_max", "saved_searches"."max_price", "saved_searches"."is_active" FROM "saved_searches" WHERE ("saved_searches"."user_id" = '<uuid>' AND "saved_searches"."id" = '<uuid>') LIMIT 21;
+-- plan:
+--   SEARCH saved_searches USING INDEX sqlite_autoindex_saved_searches_1 (id=?)
+
+-- [2]
+DELETE FROM "search_alerts" WHERE "search_alerts"."saved_search_id" IN ('<uuid>');
+-- plan:
+--   SEARCH search_alerts USING COVERING INDEX sqlite_autoindex_search_alerts_1 (saved_search_id=?)
+
+-- [3]
+DELETE FROM "saved_searches" WHERE "saved_searches"."id" IN ('<uuid>');
+-- plan:
+--   SEARCH saved_searches USING INDEX sqlite_autoindex_saved_searches_1 (id=?)
+--   SEARCH search_alerts USING COVERING INDEX sqlite_autoindex_search_alerts_1 (saved_search_id=?)
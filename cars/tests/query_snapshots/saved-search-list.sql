@@ -0,0 +1,8 @@
+-- GET /api/cars/saved-searches/
+-- 1 statements
+
+-- [1]
+SELECT "saved_searches"."id", "saved_searches"."created_at", "saved_searches"."updated_at", "saved_searches"."user_id", "saved_searches"."name", "saved_searches"."brand_id", "saved_searches"."year_min", "saved_searches"."year_max", "saved_searches"."max_price", "saved_searches"."is_active" FROM "saved_searches" WHERE "saved_searches"."user_id" = '<uuid>' ORDER BY "saved_searches"."created_at" DESC;
+-- plan:
+--   SEARCH saved_searches USING INDEX saved_searches_user_id_4b45091f (user_id=?)
+--   USE TEMP B-TREE FOR ORDER BY
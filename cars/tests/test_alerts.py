@@ -0,0 +1,176 @@
+"""Tests for saved-search matching and the alert outbox."""
+from __future__ import annotations
+
+import random
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core import mail
+
+from accounts.tests.helpers import create_user
+from cars import alerts, outbox
+from cars.models import Car, SavedSearch, SearchAlert
+from cars.tests.factories import create_brand, create_car, create_saved_search
+from cars.tests.helpers import SeededCatalog
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch):
+    """Give each test its own index so rows from other tests never leak in."""
+    monkeypatch.setattr(alerts, "_index", alerts.SavedSearchIndex())
+
+
+@pytest.mark.django_db
+class TestSavedSearchIndex:
+    """Tests for the inverted index over saved-search predicates."""
+
+    def test_sync_picks_up_changes(self):
+        """sync should add new searches and drop deactivated ones."""
+        user = create_user()
+        brand = create_brand()
+        search = create_saved_search(user, brand=brand)
+        index = alerts.get_index()
+        index.sync()
+
+        search.is_active = False
+        search.save()
+        added = create_saved_search(user, max_price=Decimal("1000"))
+        index.sync()
+
+        assert index.candidates(brand.id, 1960, Decimal("500")) == [added.pk]
+
+    def test_sync_reconciles_deletes(self, monkeypatch):
+        """Deleted searches, cascades included, should leave the index on the next reconcile."""
+        user, other = create_user(), create_user(email="other@example.com")
+        kept = create_saved_search(user)
+        create_saved_search(other)
+        index = alerts.get_index()
+        index.sync()
+
+        other.delete()
+        index.sync()
+        assert len(index) == 2  # Not yet due
+
+        monkeypatch.setattr(alerts, "RECONCILE_INTERVAL", timedelta(0))
+        index.sync()
+        assert index.candidates(create_brand().pk, 1960, Decimal("500")) == [kept.pk]
+        assert len(index) == 1
+
+    def test_match_drops_deleted_candidates(self):
+        """A candidate the table no longer has should be dropped from the index when matched."""
+        search = create_saved_search(create_user())
+        index = alerts.get_index()
+        index.sync()
+        SavedSearch.objects.filter(pk=search.pk).delete()
+
+        alerts.match_activated_cars([create_car().pk])
+
+        assert len(index) == 0
+
+
+@pytest.mark.django_db
+class TestSavedSearchIndexOnCatalog:
+    """Tests for the saved-search index against the seeded catalog."""
+
+    def test_candidates_agree_with_full_scan(self, seeded_catalog: SeededCatalog):
+        """The index should return exactly the searches a full scan matches."""
+        rng = random.Random(0)
+        brands = seeded_catalog.brands
+        index = alerts.get_index()
+        index.sync()
+        searches = list(SavedSearch.objects.filter(is_active=True))
+
+        for _ in range(50):
+            car = Car(brand=rng.choice(brands), year=rng.randint(1935, 2015), price=Decimal(rng.randrange(5_000, 600_000)))
+            expected = {search.pk for search in searches if search.matches(car)}
+            assert set(index.candidates(car.brand_id, car.year, car.price)) == expected
+
+
+@pytest.mark.django_db
+class TestSearchAlertMatching:
+    """Tests for queueing alerts when cars go active."""
+
+    def test_activation_queues_alert(self):
+        """A car going active should queue an alert for each matching search once the outbox is consumed."""
+        collector = create_user()
+        brand = create_brand()
+        matching = create_saved_search(collector, brand=brand, year_min=1960, year_max=1969)
+        create_saved_search(collector, brand=brand, max_price=Decimal("1000"))
+        car = create_car(brand=brand, year=1962, status=Car.Status.DRAFT)
+
+        car.status = Car.Status.ACTIVE
+        car.save()
+        assert not SearchAlert.objects.exists()  # Nothing is matched on the write path
+        outbox.consume_all()
+
+        assert list(SearchAlert.objects.values_list("saved_search_id", "car_id")) == [(matching.pk, car.pk)]
+
+    def test_alert_not_repeated(self):
+        """Saving an active car again, or re-matching it, should not queue another alert."""
+        search = create_saved_search(create_user())
+        car = create_car()
+        outbox.consume_all()
+        car.description = "Updated"
+        car.save()
+        outbox.consume_all()
+
+        alerts.match_activated_cars([car.pk])
+
+        assert list(SearchAlert.objects.values_list("saved_search_id", flat=True)) == [search.pk]
+
+    def test_seller_and_inactive_searches_skipped(self):
+        """Sellers aren't alerted about their own cars, and paused searches are ignored."""
+        seller = create_user(email="seller@example.com")
+        create_saved_search(seller)
+        create_saved_search(create_user(email="paused@example.com"), is_active=False)
+        car = create_car(seller=seller)
+
+        assert alerts.match_activated_cars([car.pk]) == 0
+
+    def test_deleted_search_skipped(self):
+        """A search deleted after the index loaded it should not be alerted."""
+        search = create_saved_search(create_user())
+        alerts.get_index().sync()
+        search.delete()
+
+        assert alerts.match_activated_cars([create_car().pk]) == 0
+
+
+@pytest.mark.django_db
+class TestDeliverAlerts:
+    """Tests for draining the alert outbox."""
+
+    def test_one_email_per_collector(self):
+        """Pending alerts should be grouped into one email per collector and marked sent."""
+        brand = create_brand()
+        collector = create_user(email="collector@example.com")
+        first = create_saved_search(collector, name="Sixties")
+        second = create_saved_search(collector, name="Anything")
+        car = create_car(brand=brand, model="250 GT")
+        alerts.match_activated_cars([car.pk])
+
+        assert alerts.deliver_alerts() == 2
+
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == ["collector@example.com"]
+        assert "Sixties" in mail.outbox[0].body and "Anything" in mail.outbox[0].body
+        assert not SearchAlert.objects.filter(sent_at__isnull=True).exists()
+        assert alerts.deliver_alerts() == 0
+        assert {first.pk, second.pk} == set(SearchAlert.objects.values_list("saved_search_id", flat=True))
+
+    def test_failed_delivery_is_retried(self, monkeypatch):
+        """A delivery error should leave the alerts pending with the attempt recorded."""
+        create_saved_search(create_user())
+        alerts.match_activated_cars([create_car().pk])
+
+        def fail(user, user_alerts):
+            raise ConnectionRefusedError("SMTP down")
+
+        monkeypatch.setattr(alerts, "send_alert_email", fail)
+        alerts.deliver_alerts()
+
+        alert = SearchAlert.objects.get()
+        assert alert.sent_at is None
+        assert alert.attempts == 1
+        assert "SMTP down" in alert.last_error
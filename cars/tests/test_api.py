@@ -1,17 +1,42 @@
 """Tests for the cars API endpoints."""
 from __future__ import annotations
 
+from decimal import Decimal
+
 import pytest
+from django.core.cache import cache
 from rest_framework import status
-from rest_framework.test import APIClient
-
-from cars.models import Brand, Car, CarImage, Inquiry
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from accounts.models import User
+from accounts.tests.helpers import create_user
+from cars import feeds, outbox
+from cars.cache import CacheBusy, car_detail_cache
+from cars.feeds import home_feed_cache
+from cars.models import Brand, Car, CarImage, Inquiry, SavedSearch
 from cars.tests.factories import (
     create_brand,
     create_car,
     create_car_image,
     create_inquiry,
+    create_saved_search,
 )
+from cars.tests.helpers import SeededCatalog
+from cars.throttling import InquiryIPRateThrottle
+from cars.views import INQUIRY_PENDING, InquiryListCreateView
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Reset throttle buckets and cached payloads between tests."""
+    cache.clear()
+    car_detail_cache.clear_local()
+    home_feed_cache.clear_local()
+    yield
+    cache.clear()
+    car_detail_cache.clear_local()
+    home_feed_cache.clear_local()
 
 
 @pytest.mark.django_db
@@ -45,6 +70,38 @@ class TestBrandListAPI:
         response = api_client.get("/api/cars/brands/")
         assert response.status_code == status.HTTP_200_OK
 
+    def test_list_brands_with_stats(self, api_client: APIClient, django_assert_num_queries):
+        """GET /api/cars/brands/?stats=true should embed active-listing stats in one query."""
+        ferrari = create_brand(name="Ferrari")
+        create_brand(name="Porsche")
+        featured = create_car(brand=ferrari, year=1957, price="400000.00", is_featured=True)
+        newest = create_car(brand=ferrari, year=1962, price="900000.00")
+        create_car(brand=ferrari, year=1990, price="5.00", status=Car.Status.SOLD)
+        create_car_image(car=newest, is_primary=True, image_url="https://example.com/newest.jpg")
+        create_car_image(car=featured, is_primary=False, image_url="https://example.com/featured-2.jpg", sort_order=1)
+        create_car_image(car=featured, is_primary=True, image_url="https://example.com/featured.jpg", sort_order=2)
+
+        with django_assert_num_queries(1):
+            response = api_client.get("/api/cars/brands/?stats=true")
+
+        assert response.status_code == status.HTTP_200_OK
+        by_name = {b["name"]: b for b in response.data}
+        assert by_name["Ferrari"]["active_count"] == 2
+        assert by_name["Ferrari"]["min_price"] == "400000.00"
+        assert by_name["Ferrari"]["max_price"] == "900000.00"
+        assert (by_name["Ferrari"]["year_min"], by_name["Ferrari"]["year_max"]) == (1957, 1962)
+        assert by_name["Ferrari"]["representative_image"] == "https://example.com/featured.jpg"
+        assert by_name["Porsche"]["active_count"] == 0
+        assert by_name["Porsche"]["representative_image"] is None
+
+    def test_list_brands_without_stats(self, api_client: APIClient):
+        """GET /api/cars/brands/ should keep the bare brand fields by default."""
+        create_brand()
+
+        response = api_client.get("/api/cars/brands/")
+
+        assert "active_count" not in response.data[0]
+
 
 @pytest.mark.django_db
 class TestBrandDetailAPI:
@@ -131,6 +188,126 @@ class TestCarListAPI:
         response = api_client.get("/api/cars/")
         assert response.status_code == status.HTTP_200_OK
 
+    def test_list_cars_near(self, api_client: APIClient):
+        """GET /api/cars/?near= should return cars within the radius, nearest first."""
+        brand = create_brand()
+        turin = create_car(brand=brand, model="Turin", latitude=45.0703, longitude=7.6869)
+        milan = create_car(brand=brand, model="Milan", latitude=45.4642, longitude=9.19)
+        create_car(brand=brand, model="Rome", latitude=41.9028, longitude=12.4964)
+        create_car(brand=brand, model="Unlocated")
+
+        response = api_client.get("/api/cars/?near=45.1,7.7&radius_km=150")
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        assert [c["id"] for c in results] == [str(turin.id), str(milan.id)]
+        assert results[0]["distance_km"] == pytest.approx(3.5, abs=0.2)
+        assert results[1]["distance_km"] == pytest.approx(122, abs=2)
+
+    def test_list_cars_near_default_radius(self, api_client: APIClient):
+        """GET /api/cars/?near= without radius_km should search 50 km."""
+        brand = create_brand()
+        create_car(brand=brand, latitude=45.0703, longitude=7.6869)
+        create_car(brand=brand, latitude=45.4642, longitude=9.19)
+
+        response = api_client.get("/api/cars/?near=45.1,7.7")
+
+        assert response.data["count"] == 1
+
+    def test_list_cars_near_follows_moved_car(self, api_client: APIClient):
+        """Updating a car's coordinates should move it in radius search."""
+        brand = create_brand()
+        car = create_car(brand=brand, latitude=41.9028, longitude=12.4964)
+        car.latitude, car.longitude = 45.0703, 7.6869
+        car.save(update_fields=["latitude", "longitude"])
+
+        response = api_client.get("/api/cars/?near=45.1,7.7&radius_km=10")
+
+        assert [c["id"] for c in response.data["results"]] == [str(car.id)]
+
+    @pytest.mark.parametrize(
+        "query",
+        ["near=45.1", "near=north,east", "near=91,0", "near=45,7&radius_km=0", "near=45,7&radius_km=5000"],
+    )
+    def test_list_cars_near_invalid(self, api_client: APIClient, query: str):
+        """GET /api/cars/?near= should return 400 for malformed coordinates or radius."""
+        response = api_client.get(f"/api/cars/?{query}")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_list_cars_filter_by_country(self, api_client: APIClient):
+        """GET /api/cars/?country= should filter by ISO country code."""
+        brand = create_brand()
+        italian = create_car(brand=brand, country="IT", region="IT-21")
+        create_car(brand=brand, country="US", region="US-CA")
+
+        response = api_client.get("/api/cars/?country=it")
+
+        assert [c["id"] for c in response.data["results"]] == [str(italian.id)]
+        assert response.data["results"][0]["region"] == "IT-21"
+
+
+@pytest.mark.django_db
+class TestHomeFeedAPI:
+    """Tests for the homepage feed endpoint."""
+
+    def test_home_feed_contents(self, api_client: APIClient):
+        """GET /api/cars/home/ should return featured cars, newest arrivals and brands."""
+        brand = create_brand(name="Ferrari")
+        featured = create_car(brand=brand, model="Featured", is_featured=True)
+        regular = create_car(brand=brand, model="Regular")
+        create_car(brand=brand, model="Draft", is_featured=True, status=Car.Status.DRAFT)
+
+        response = api_client.get("/api/cars/home/")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [c["id"] for c in data["featured"]] == [str(featured.id)]
+        assert [c["id"] for c in data["newest"]] == [str(regular.id), str(featured.id)]
+        assert [b["name"] for b in data["brands"]] == ["Ferrari"]
+
+    def test_home_feed_served_from_snapshot(self, api_client: APIClient, django_assert_num_queries):
+        """GET /api/cars/home/ should not query the database once the snapshot is built."""
+        create_car(is_featured=True)
+        api_client.get("/api/cars/home/")
+
+        with django_assert_num_queries(0):
+            response = api_client.get("/api/cars/home/")
+
+        assert len(response.json()["featured"]) == 1
+
+    def test_home_feed_rebuilt_after_car_change(self, api_client: APIClient, django_assert_num_queries):
+        """GET /api/cars/home/ should serve the snapshot the outbox rebuilt after a car change."""
+        car = create_car(is_featured=True)
+        api_client.get("/api/cars/home/")
+        outbox.consume_all()
+
+        car.is_featured = False
+        car.save()
+        outbox.consume_all()
+
+        with django_assert_num_queries(0):
+            response = api_client.get("/api/cars/home/")
+
+        assert response.json()["featured"] == []
+
+    def test_home_feed_not_recached_stale_after_racing_write(self, api_client: APIClient, monkeypatch):
+        """GET /api/cars/home/ should not keep a snapshot built while the outbox refreshed the feed."""
+        car = create_car(is_featured=True)
+        build_home_feed = feeds.build_home_feed
+
+        def build_racing_write() -> bytes:
+            content = build_home_feed()
+            Car.objects.filter(pk=car.pk).update(is_featured=False)
+            feeds.refresh_home_feed([])  # The write is delivered after our read but before our set
+            return content
+
+        monkeypatch.setattr(feeds, "build_home_feed", build_racing_write)
+        assert len(api_client.get("/api/cars/home/").json()["featured"]) == 1
+        monkeypatch.setattr(feeds, "build_home_feed", build_home_feed)
+
+        assert api_client.get("/api/cars/home/").json()["featured"] == []
+
 
 @pytest.mark.django_db
 class TestCarDetailAPI:
@@ -152,11 +329,12 @@ class TestCarDetailAPI:
         response = api_client.get(f"/api/cars/{car.id}/")
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["id"] == str(car.id)
-        assert response.data["model"] == "250 GTO"
-        assert response.data["year"] == 1962
-        assert response.data["brand"]["name"] == "Ferrari"
-        assert len(response.data["images"]) == 2
+        data = response.json()
+        assert data["id"] == str(car.id)
+        assert data["model"] == "250 GTO"
+        assert data["year"] == 1962
+        assert data["brand"]["name"] == "Ferrari"
+        assert len(data["images"]) == 2
 
     def test_get_car_not_found(self, api_client: APIClient):
         """GET /api/cars/{id}/ should return 404 for non-existent car."""
@@ -174,6 +352,103 @@ class TestCarDetailAPI:
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    def test_car_detail_served_from_cache(self, api_client: APIClient, django_assert_num_queries, settings):
+        """GET /api/cars/{id}/ should only count the view once the payload is cached."""
+        settings.COUNTER_SHARDS = 1
+        car = create_car()
+        api_client.get(f"/api/cars/{car.id}/")
+
+        with django_assert_num_queries(1):
+            response = api_client.get(f"/api/cars/{car.id}/")
+        car_detail_cache.clear_local()
+        with django_assert_num_queries(1):
+            response = api_client.get(f"/api/cars/{car.id}/")
+
+        assert response.json()["id"] == str(car.id)
+
+    def test_car_detail_revalidated_after_image_change(
+        self, api_client: APIClient, django_capture_on_commit_callbacks
+    ):
+        """GET /api/cars/{id}/ should reflect image changes after commit."""
+        car = create_car()
+        api_client.get(f"/api/cars/{car.id}/")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            create_car_image(car=car)
+
+        response = api_client.get(f"/api/cars/{car.id}/")
+
+        assert len(response.json()["images"]) == 1
+
+    def test_car_detail_revalidated_after_brand_rename_only(
+        self, api_client: APIClient, django_capture_on_commit_callbacks, monkeypatch
+    ):
+        """GET /api/cars/{id}/ should reflect a brand rename, while other brand saves leave the cache alone."""
+        car = create_car()
+        api_client.get(f"/api/cars/{car.id}/")
+        brand = Brand.objects.get(pk=car.brand_id)
+        invalidated = []
+        invalidate_many = car_detail_cache.invalidate_many
+        monkeypatch.setattr(
+            car_detail_cache, "invalidate_many", lambda keys: invalidated.append(keys) or invalidate_many(keys)
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            brand.save()
+            brand.save(update_fields=["updated_at"])
+        assert invalidated == []
+
+        with django_capture_on_commit_callbacks(execute=True):
+            brand.name = "Renamed"
+            brand.save(update_fields=["name", "updated_at"])
+
+        assert invalidated == [[car.id]]
+        assert api_client.get(f"/api/cars/{car.id}/").json()["brand"]["name"] == "Renamed"
+
+    def test_car_detail_busy_while_another_worker_rebuilds(self, api_client: APIClient, monkeypatch):
+        """GET /api/cars/{id}/ should return 503 with Retry-After when the detail can't be built yet."""
+        car = create_car()
+
+        def busy(key):
+            raise CacheBusy(key)
+
+        monkeypatch.setattr(car_detail_cache, "get", busy)
+        response = api_client.get(f"/api/cars/{car.id}/")
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response["Retry-After"] == "1"
+
+    def test_car_detail_serves_stale_while_revalidating(
+        self, api_client: APIClient, django_capture_on_commit_callbacks
+    ):
+        """GET /api/cars/{id}/ should serve the stale payload while another request holds the rebuild lock."""
+        car = create_car(model="Old")
+        api_client.get(f"/api/cars/{car.id}/")
+        with django_capture_on_commit_callbacks(execute=True):
+            car.model = "New"
+            car.save()
+
+        cache.add(f"car_detail:lock:{car.id}", 1)
+        assert api_client.get(f"/api/cars/{car.id}/").json()["model"] == "Old"
+
+        cache.delete(f"car_detail:lock:{car.id}")
+        assert api_client.get(f"/api/cars/{car.id}/").json()["model"] == "New"
+
+    def test_car_detail_gone_after_status_change(
+        self, api_client: APIClient, django_capture_on_commit_callbacks
+    ):
+        """GET /api/cars/{id}/ should return 404 once a cached car is no longer active."""
+        car = create_car()
+        api_client.get(f"/api/cars/{car.id}/")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            car.status = Car.Status.SOLD
+            car.save()
+
+        response = api_client.get(f"/api/cars/{car.id}/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
 
 @pytest.mark.django_db
 class TestInquiryCreateAPI:
@@ -295,3 +570,365 @@ class TestInquiryCreateAPI:
         response = api_client.post("/api/cars/inquiries/", data)
 
         assert response.status_code == status.HTTP_201_CREATED
+
+    def test_create_inquiry_duplicate_is_idempotent(self, api_client: APIClient):
+        """POST /api/cars/inquiries/ should not store an identical resubmission."""
+        car = create_car()
+        data = {
+            "car": str(car.id),
+            "collector_name": "John Doe",
+            "collector_email": "john@example.com",
+            "message": "I am very interested in purchasing this beautiful vintage car.",
+        }
+
+        first = api_client.post("/api/cars/inquiries/", data)
+        second = api_client.post("/api/cars/inquiries/", {**data, "collector_email": " JOHN@example.com "})
+
+        assert first.status_code == status.HTTP_201_CREATED
+        assert second.status_code == status.HTTP_200_OK
+        assert second.data["data"]["id"] == first.data["data"]["id"]
+        assert Inquiry.objects.count() == 1
+
+    def test_create_inquiry_invalid_data_not_deduplicated(self, api_client: APIClient):
+        """POST /api/cars/inquiries/ should allow retrying after a validation error."""
+        car = create_car()
+        data = {
+            "car": str(car.id),
+            "collector_name": "",
+            "collector_email": "john@example.com",
+            "message": "I am very interested in purchasing this beautiful vintage car.",
+        }
+
+        first = api_client.post("/api/cars/inquiries/", data)
+        second = api_client.post("/api/cars/inquiries/", {**data, "collector_name": "John Doe"})
+
+        assert first.status_code == status.HTTP_400_BAD_REQUEST
+        assert second.status_code == status.HTTP_201_CREATED
+
+    def test_create_inquiry_rate_limited_per_email(self, api_client: APIClient, django_assert_num_queries):
+        """POST /api/cars/inquiries/ should return 429 without querying once the email bucket is empty."""
+        car = create_car()
+        for i in range(5):
+            response = api_client.post(
+                "/api/cars/inquiries/",
+                {
+                    "car": str(car.id),
+                    "collector_name": "John Doe",
+                    "collector_email": "john@example.com",
+                    "message": f"Inquiry number {i} about this beautiful vintage car.",
+                },
+            )
+            assert response.status_code == status.HTTP_201_CREATED
+
+        with django_assert_num_queries(0):
+            response = api_client.post(
+                "/api/cars/inquiries/",
+                {
+                    "car": str(car.id),
+                    "collector_name": "John Doe",
+                    "collector_email": "john@example.com",
+                    "message": "One more inquiry about this beautiful vintage car.",
+                },
+            )
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert "Retry-After" in response
+        assert Inquiry.objects.count() == 5
+
+    def test_create_inquiry_duplicates_not_charged(self, api_client: APIClient):
+        """POST /api/cars/inquiries/ resubmissions should not use up the email's rate limit."""
+        car = create_car()
+        data = {
+            "car": str(car.id),
+            "collector_name": "John Doe",
+            "collector_email": "john@example.com",
+            "message": "Inquiry number 0 about this beautiful vintage car.",
+        }
+        for _ in range(5):
+            api_client.post("/api/cars/inquiries/", data)
+
+        for i in range(1, 5):
+            response = api_client.post(
+                "/api/cars/inquiries/", {**data, "message": f"Inquiry number {i} about this beautiful vintage car."}
+            )
+            assert response.status_code == status.HTTP_201_CREATED
+
+    def test_create_inquiry_pending_duplicate_conflicts_and_is_charged(
+        self, api_client: APIClient, django_assert_num_queries
+    ):
+        """POST /api/cars/inquiries/ should answer 409 at once for a duplicate still being saved, and rate limit it."""
+        car = create_car()
+        data = {
+            "car": str(car.id),
+            "collector_name": "John Doe",
+            "collector_email": "john@example.com",
+            "message": "I am very interested in purchasing this beautiful vintage car.",
+        }
+        cache.set(InquiryListCreateView.get_dedup_key(data), INQUIRY_PENDING)  # The original is mid-save
+
+        for _ in range(5):
+            with django_assert_num_queries(0):
+                assert api_client.post("/api/cars/inquiries/", data).status_code == status.HTTP_409_CONFLICT
+        response = api_client.post("/api/cars/inquiries/", {**data, "message": "A different question entirely."})
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert not Inquiry.objects.exists()
+
+    def test_inquiry_rate_limit_slides_across_windows(self, monkeypatch):
+        """The IP limit (10/min) should weigh the previous minute, so no burst fits across the boundary."""
+        clock = [60.0 * 16_667]  # The start of a window
+        monkeypatch.setattr("cars.throttling.time.time", lambda: clock[0])
+        request = Request(APIRequestFactory().post("/api/cars/inquiries/"))
+
+        def allowed() -> bool:
+            return InquiryIPRateThrottle().allow_request(request, None)
+
+        assert all(allowed() for _ in range(10))
+        assert not allowed()
+        clock[0] += 60
+        assert not allowed()  # The previous minute still weighs in full
+        clock[0] += 6
+        assert allowed()
+        assert not allowed()
+        throttle = InquiryIPRateThrottle()
+        assert not throttle.allow_request(request, None)
+        assert throttle.wait() == pytest.approx(6)
+
+
+@pytest.mark.django_db
+class TestCarBatchAPI:
+    """Tests for the bulk car detail endpoint."""
+
+    def test_batch_keeps_requested_order_and_reports_missing(self, api_client: APIClient):
+        """GET /api/cars/batch/?ids= should return details in order and list missing ids."""
+        import uuid
+        brand = create_brand()
+        first = create_car(brand=brand, model="First")
+        second = create_car(brand=brand, model="Second")
+        draft = create_car(brand=brand, model="Draft", status=Car.Status.DRAFT)
+        create_car_image(car=second)
+        unknown = uuid.uuid4()
+
+        ids = ",".join(str(pk) for pk in [second.id, unknown, first.id, draft.id])
+        response = api_client.get(f"/api/cars/batch/?ids={ids}")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [c["id"] for c in response.data["results"]] == [str(second.id), str(first.id)]
+        assert len(response.data["results"][0]["images"]) == 1
+        assert response.data["missing"] == [str(unknown), str(draft.id)]
+
+    def test_batch_rejects_too_many_ids(self, api_client: APIClient):
+        """POST /api/cars/batch/ should reject more than 100 ids."""
+        import uuid
+        ids = [str(uuid.uuid4()) for _ in range(101)]
+
+        response = api_client.post("/api/cars/batch/", {"ids": ids}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "ids" in response.data
+
+    def test_batch_rejects_non_object_body(self, api_client: APIClient):
+        """POST /api/cars/batch/ should return 400 when the JSON body is not an object."""
+        import uuid
+        response = api_client.post("/api/cars/batch/", [str(uuid.uuid4())], format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_batch_rejects_invalid_ids(self, api_client: APIClient):
+        """GET /api/cars/batch/ should reject malformed or empty id lists."""
+        assert api_client.get("/api/cars/batch/?ids=not-a-uuid").status_code == status.HTTP_400_BAD_REQUEST
+        assert api_client.get("/api/cars/batch/").status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestCarBatchAPIOnCatalog:
+    """Tests for the bulk car detail endpoint against the seeded catalog."""
+
+    def test_batch_query_count_is_constant(
+        self, api_client: APIClient, django_assert_num_queries, seeded_catalog: SeededCatalog
+    ):
+        """POST /api/cars/batch/ should run one car query plus one image prefetch."""
+        cars = seeded_catalog.active_cars[:20]
+
+        with django_assert_num_queries(2):
+            response = api_client.post(
+                "/api/cars/batch/", {"ids": [str(c.id) for c in cars]}, format="json"
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 20
+        assert all(len(result["images"]) == 2 for result in response.data["results"])
+
+
+@pytest.mark.django_db
+class TestCarPriceHistoryAPI:
+    """Tests for the car price history endpoint."""
+
+    def test_price_history_records_changes(self, api_client: APIClient):
+        """GET /api/cars/{id}/price-history/ should list price changes newest first."""
+        car = create_car(price="100000.00")
+        car = Car.objects.get(pk=car.pk)
+        car.price = Decimal("120000.00")
+        car.save()
+        car.description = "Updated description"
+        car.save()
+
+        response = api_client.get(f"/api/cars/{car.id}/price-history/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 2
+        latest, initial = response.data["results"]
+        assert latest["old_price"] == "100000.00"
+        assert latest["price"] == "120000.00"
+        assert initial["old_price"] is None
+        assert initial["price"] == "100000.00"
+
+    def test_price_history_draft_not_visible(self, api_client: APIClient):
+        """GET /api/cars/{id}/price-history/ should return 404 for draft cars."""
+        car = create_car(status=Car.Status.DRAFT)
+
+        response = api_client.get(f"/api/cars/{car.id}/price-history/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestInquiryInboxAPI:
+    """Tests for the seller inquiry inbox."""
+
+    def test_inbox_requires_authentication(self, api_client: APIClient):
+        """GET /api/cars/inquiries/ should return 401 without credentials."""
+        response = api_client.get("/api/cars/inquiries/")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_inbox_lists_only_sellers_inquiries(self, authenticated_client: tuple[APIClient, User]):
+        """GET /api/cars/inquiries/ should list inquiries on the user's own cars, newest first."""
+        client, user = authenticated_client
+        brand = create_brand()
+        own_car = create_car(brand=brand, model="Own", seller=user)
+        other_car = create_car(brand=brand, model="Other", seller=create_user(email="other@example.com"))
+        older = create_inquiry(car=own_car, collector_name="Older")
+        newer = create_inquiry(car=own_car, collector_name="Newer")
+        create_inquiry(car=other_car)
+
+        response = client.get("/api/cars/inquiries/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [i["id"] for i in response.data["results"]] == [str(newer.id), str(older.id)]
+        assert response.data["results"][0]["car_model"] == "Own"
+        assert response.data["results"][0]["is_read"] is False
+
+    def test_inbox_cursor_pagination(self, authenticated_client: tuple[APIClient, User]):
+        """GET /api/cars/inquiries/?page_size= should page with cursors."""
+        client, user = authenticated_client
+        car = create_car(seller=user)
+        for i in range(3):
+            create_inquiry(car=car, collector_name=f"Collector {i}")
+
+        first = client.get("/api/cars/inquiries/?page_size=2")
+        second = client.get(first.data["next"])
+
+        assert len(first.data["results"]) == 2
+        assert len(second.data["results"]) == 1
+        assert second.data["next"] is None
+
+    def test_inbox_filters(self, authenticated_client: tuple[APIClient, User]):
+        """GET /api/cars/inquiries/ should filter by brand, read state, date and message text."""
+        client, user = authenticated_client
+        ferrari = create_car(brand=create_brand(name="Ferrari"), seller=user)
+        porsche = create_car(brand=create_brand(name="Porsche"), seller=user)
+        match = create_inquiry(car=ferrari, message="Is the matching-numbers engine original?")
+        create_inquiry(car=ferrari, message="Could you send more photos of the interior?")
+        create_inquiry(car=porsche, message="Is the matching-numbers engine original?")
+
+        response = client.get(f"/api/cars/inquiries/?brand={ferrari.brand_id}&q=ENGINE&is_read=false")
+        assert [i["id"] for i in response.data["results"]] == [str(match.id)]
+
+        response = client.get("/api/cars/inquiries/?created_after=2000-01-01&created_before=2000-01-02")
+        assert response.data["results"] == []
+
+        response = client.get("/api/cars/inquiries/?created_after=yesterday")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        for param in ("brand", "car"):
+            response = client.get(f"/api/cars/inquiries/?{param}=nope")
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_mark_inquiry_read(self, authenticated_client: tuple[APIClient, User]):
+        """PATCH /api/cars/inquiries/{id}/ should set and clear the read state."""
+        client, user = authenticated_client
+        inquiry = create_inquiry(car=create_car(seller=user))
+
+        response = client.patch(f"/api/cars/inquiries/{inquiry.id}/", {"is_read": True}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["is_read"] is True
+        inquiry.refresh_from_db()
+        assert inquiry.read_at is not None
+
+        response = client.get("/api/cars/inquiries/?is_read=false")
+        assert response.data["results"] == []
+
+        client.patch(f"/api/cars/inquiries/{inquiry.id}/", {"is_read": False}, format="json")
+        inquiry.refresh_from_db()
+        assert inquiry.read_at is None
+
+    def test_cannot_read_other_sellers_inquiry(self, authenticated_client: tuple[APIClient, User]):
+        """GET /api/cars/inquiries/{id}/ should return 404 for another seller's inquiry."""
+        client, _ = authenticated_client
+        inquiry = create_inquiry(car=create_car(seller=create_user(email="other@example.com")))
+
+        response = client.get(f"/api/cars/inquiries/{inquiry.id}/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestSavedSearchAPI:
+    """Tests for the saved search endpoints."""
+
+    def test_requires_authentication(self, api_client: APIClient):
+        """GET /api/cars/saved-searches/ should require authentication."""
+        response = api_client.get("/api/cars/saved-searches/")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_create_and_list_own_searches(self, api_client: APIClient):
+        """POST /api/cars/saved-searches/ should save a search for the current user only."""
+        user = create_user()
+        create_saved_search(create_user(email="other@example.com"), name="Not mine")
+        brand = create_brand()
+        api_client.force_authenticate(user)
+
+        response = api_client.post(
+            "/api/cars/saved-searches/",
+            {"name": "Sixties Ferraris", "brand": str(brand.id), "year_min": 1960, "year_max": 1969},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert SavedSearch.objects.get(pk=response.data["id"]).user == user
+        listed = api_client.get("/api/cars/saved-searches/").data
+        assert [s["name"] for s in listed] == ["Sixties Ferraris"]
+
+    def test_rejects_inverted_year_range(self, api_client: APIClient):
+        """POST /api/cars/saved-searches/ should reject year_min after year_max."""
+        api_client.force_authenticate(create_user())
+
+        response = api_client.post("/api/cars/saved-searches/", {"year_min": 1970, "year_max": 1960}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "year_max" in response.data
+
+    def test_pause_and_delete(self, api_client: APIClient):
+        """PATCH and DELETE /api/cars/saved-searches/{id}/ should only reach the owner's searches."""
+        user = create_user()
+        search = create_saved_search(user)
+        other = create_saved_search(create_user(email="other@example.com"))
+        api_client.force_authenticate(user)
+
+        response = api_client.patch(f"/api/cars/saved-searches/{search.id}/", {"is_active": False}, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["is_active"] is False
+
+        assert api_client.delete(f"/api/cars/saved-searches/{other.id}/").status_code == status.HTTP_404_NOT_FOUND
+        assert api_client.delete(f"/api/cars/saved-searches/{search.id}/").status_code == status.HTTP_204_NO_CONTENT
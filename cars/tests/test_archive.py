@@ -0,0 +1,140 @@
+"""Tests for data retention and archival."""
+from __future__ import annotations
+
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from accounts.tests.helpers import create_user
+from cars import counters, outbox
+from cars.archive import archive_cars, archive_inquiries, restore_car
+from cars.models import (
+    ArchivedCar,
+    ArchivedInquiry,
+    Car,
+    CarCounter,
+    CarCounterShard,
+    CarImage,
+    CarPriceHistory,
+    Inquiry,
+    SearchAlert,
+)
+from cars.tests.factories import create_brand, create_car, create_car_image, create_inquiry, create_saved_search
+
+
+@pytest.mark.django_db
+class TestArchiveCars:
+    """Tests for moving stale cars to the archive tables and back."""
+
+    def test_archives_only_stale_cars(self):
+        """Archived cars and long-sold cars move; active and recently sold cars stay."""
+        brand = create_brand()
+        archived = create_car(brand=brand, status=Car.Status.ARCHIVED)
+        old_sold = create_car(brand=brand, status=Car.Status.SOLD)
+        Car.objects.filter(pk=old_sold.pk).update(updated_at=timezone.now() - timedelta(days=200))
+        recent_sold = create_car(brand=brand, status=Car.Status.SOLD)
+        active = create_car(brand=brand)
+
+        moved = archive_cars(sold_before=timezone.now() - timedelta(days=90), batch_size=1)
+
+        assert moved == 2
+        assert set(Car.objects.values_list("pk", flat=True)) == {recent_sold.pk, active.pk}
+        assert set(ArchivedCar.objects.values_list("pk", flat=True)) == {archived.pk, old_sold.pk}
+
+    def test_round_trip_restores_related_rows(self):
+        """A restored car gets back its images, price history, inquiries and timestamps."""
+        car = create_car(status=Car.Status.ARCHIVED, price="100.00")
+        car = Car.objects.get(pk=car.pk)
+        car.price = Decimal("90.00")
+        car.save()
+        image = create_car_image(car=car, is_primary=True)
+        inquiry = create_inquiry(car=car)
+        created_at = Car.objects.get(pk=car.pk).created_at
+
+        archive_cars(sold_before=timezone.now())
+
+        assert not Car.objects.filter(pk=car.pk).exists()
+        assert not CarImage.objects.exists()
+        assert not Inquiry.objects.exists()
+        assert ArchivedInquiry.objects.filter(pk=inquiry.pk).exists()
+
+        restore_car(car.pk)
+
+        restored = Car.objects.get(pk=car.pk)
+        assert restored.price == Decimal("90.00")
+        assert abs(restored.created_at - created_at) < timedelta(milliseconds=1)
+        assert list(restored.images.values_list("pk", "is_primary")) == [(image.pk, True)]
+        assert list(restored.price_history.order_by("changed_at").values_list("price", flat=True)) == [
+            Decimal("100.00"),
+            Decimal("90.00"),
+        ]
+        assert Inquiry.objects.filter(pk=inquiry.pk, car=restored).exists()
+        assert not ArchivedCar.objects.exists()
+        assert not ArchivedInquiry.objects.exists()
+
+
+    def test_round_trip_keeps_counts_and_sent_alerts(self):
+        """A restored car keeps its view/inquiry counts and isn't announced again to searches already alerted."""
+        kept = create_saved_search(create_user())
+        deleted = create_saved_search(create_user(email="other@example.com"))
+        car = create_car()
+        outbox.consume_all()
+        SearchAlert.objects.update(sent_at=timezone.now())
+        counters.increment(car.pk, "views", 3)
+        counters.fold_all()
+        counters.increment(car.pk, "views", 2)  # Still in a shard when archived
+        counters.increment(car.pk, "inquiries")
+        Car.objects.filter(pk=car.pk).update(status=Car.Status.ARCHIVED)
+
+        archive_cars(sold_before=timezone.now())
+
+        assert not CarCounter.objects.exists()
+        assert not CarCounterShard.objects.exists()
+        assert not SearchAlert.objects.exists()
+        deleted.delete()
+
+        restored = restore_car(car.pk)
+        restored.status = Car.Status.ACTIVE
+        restored.save()
+        outbox.consume_all()
+
+        assert counters.counts(car.pk, exact=True) == {"views": 5, "inquiries": 1}
+        assert list(SearchAlert.objects.values_list("saved_search_id", "car_id")) == [(kept.pk, car.pk)]
+        assert not SearchAlert.objects.filter(sent_at__isnull=True).exists()
+
+
+@pytest.mark.django_db
+class TestArchiveInquiries:
+    """Tests for archiving aged inquiries."""
+
+    def test_archives_aged_inquiries(self):
+        """Only inquiries older than the cutoff move to the archive."""
+        car = create_car()
+        old = create_inquiry(car=car)
+        Inquiry.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=400))
+        recent = create_inquiry(car=car)
+
+        moved = archive_inquiries(created_before=timezone.now() - timedelta(days=365))
+
+        assert moved == 1
+        assert list(Inquiry.objects.values_list("pk", flat=True)) == [recent.pk]
+        assert ArchivedInquiry.objects.get().pk == old.pk
+
+    def test_commands_round_trip(self):
+        """archive_stale and restore_archive should move rows out and back."""
+        car = create_car(status=Car.Status.ARCHIVED)
+        out = StringIO()
+
+        call_command("archive_stale", "--dry-run", stdout=out)
+        assert "Cars to archive: 1" in out.getvalue()
+
+        call_command("archive_stale", stdout=out)
+        assert not Car.objects.exists()
+
+        call_command("restore_archive", "--car", str(car.pk), stdout=out)
+        assert Car.objects.filter(pk=car.pk).exists()
+        assert CarPriceHistory.objects.filter(car=car).exists()
@@ -0,0 +1,130 @@
+"""Tests for bulk status and featured-flag changes."""
+from __future__ import annotations
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.tests.helpers import create_user
+from cars import alerts, outbox
+from cars.bulk import bulk_update_cars
+from cars.cache import car_detail_cache
+from cars.feeds import home_feed_cache
+from cars.models import Car, CarPriceHistory, ListingEvent, SearchAlert
+from cars.tests.factories import create_brand, create_car, create_cars, create_saved_search
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(monkeypatch):
+    cache.clear()
+    car_detail_cache.clear_local()
+    home_feed_cache.clear_local()
+    monkeypatch.setattr(alerts, "_index", alerts.SavedSearchIndex())
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+class TestBulkUpdateCars:
+    """Tests for bulk_update_cars."""
+
+    def test_one_update_per_batch(self, django_assert_num_queries):
+        """Each batch should be a single UPDATE plus one outbox INSERT, with no per-row saves."""
+        brand = create_brand()
+        cars = create_cars(5, brand=brand)
+        history = CarPriceHistory.objects.count()
+
+        # Per batch: savepoint, SELECT ids, UPDATE, INSERT events, release; 3 batches of 2, 2 and 1
+        with django_assert_num_queries(15):
+            changed = bulk_update_cars([car.pk for car in cars], "archive", batch_size=2)
+
+        assert changed == 5
+        assert ListingEvent.objects.filter(car_id__in=[car.pk for car in cars], data__activated=False).count() == 5
+        assert set(Car.objects.values_list("status", flat=True)) == {Car.Status.ARCHIVED}
+        assert CarPriceHistory.objects.count() == history
+
+    def test_unchanged_rows_not_counted(self):
+        """Cars already in the target state should be left alone."""
+        brand = create_brand()
+        featured = create_car(brand=brand, is_featured=True)
+        plain = create_car(brand=brand)
+
+        assert bulk_update_cars([featured.pk, plain.pk], "feature") == 1
+        featured.refresh_from_db()
+        assert featured.updated_at < Car.objects.get(pk=plain.pk).updated_at
+
+    def test_fan_out_once_per_batch(self, api_client: APIClient, django_capture_on_commit_callbacks):
+        """A committed batch should mark changed details stale; the home feed and activations go through the outbox."""
+        brand = create_brand()
+        active = create_car(brand=brand, model="Active")
+        draft = create_car(brand=brand, model="Draft", status=Car.Status.DRAFT)
+        outbox.consume_all()  # Deliver the creation events before anyone is searching
+        create_saved_search(create_user())
+        api_client.get("/api/cars/home/")
+        api_client.get(f"/api/cars/{active.id}/")
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            bulk_update_cars([active.pk, draft.pk], "activate")
+        with django_capture_on_commit_callbacks(execute=True):
+            bulk_update_cars([active.pk], "unfeature")  # Nothing changes, nothing fans out
+
+        assert len(callbacks) == 1
+        assert cache.get(f"car_detail:dirty:{draft.pk}") is not None
+        assert cache.get(f"car_detail:dirty:{active.pk}") is None  # Already active, so its detail is kept
+        outbox.consume_all()
+        assert list(SearchAlert.objects.values_list("car_id", flat=True)) == [draft.pk]
+        newest = api_client.get("/api/cars/home/").json()["newest"]
+        assert {car["id"] for car in newest} == {str(active.pk), str(draft.pk)}
+
+
+@pytest.mark.django_db
+class TestCarBulkActionAPI:
+    """Tests for the staff bulk action endpoint."""
+
+    def test_requires_staff(self, api_client: APIClient):
+        """POST /api/cars/bulk/ should be limited to staff."""
+        api_client.force_authenticate(create_user())
+
+        response = api_client.post("/api/cars/bulk/", {"ids": [], "action": "archive"}, format="json")
+
+        assert response.status_code == 403
+
+    def test_bulk_feature(self, api_client: APIClient):
+        """POST /api/cars/bulk/ should apply the action and report how many cars changed."""
+        brand = create_brand()
+        cars = create_cars(3, brand=brand)
+        api_client.force_authenticate(create_user(is_staff=True))
+
+        response = api_client.post(
+            "/api/cars/bulk/", {"ids": [str(car.id) for car in cars], "action": "feature"}, format="json"
+        )
+
+        assert response.status_code == 200
+        assert response.data == {"action": "feature", "updated": 3}
+        assert Car.objects.filter(is_featured=True).count() == 3
+
+    def test_rejects_unknown_action(self, api_client: APIClient):
+        """POST /api/cars/bulk/ should return 400 for an unknown action."""
+        api_client.force_authenticate(create_user(is_staff=True))
+
+        response = api_client.post("/api/cars/bulk/", {"ids": [str(create_car().id)], "action": "sell"}, format="json")
+
+        assert response.status_code == 400
+        assert "action" in response.data
+
+
+@pytest.mark.django_db
+def test_admin_archive_action(client):
+    """The CarAdmin "archive" action should archive the selected cars."""
+    car = create_car()
+    client.force_login(create_user(is_staff=True, is_superuser=True))
+
+    response = client.post(
+        reverse("admin:cars_car_changelist"),
+        {"action": "archive_cars", "_selected_action": [str(car.pk)]},
+    )
+
+    assert response.status_code == 302
+    car.refresh_from_db()
+    assert car.status == Car.Status.ARCHIVED
@@ -0,0 +1,172 @@
+"""Tests for the two-tier payload cache."""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from cars.cache import CacheBusy, TieredCache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def slow_builder(calls: list, delay: float = 0.05):
+    def build(key):
+        calls.append(key)
+        time.sleep(delay)
+        return f"payload {key}".encode()
+
+    return build
+
+
+class TestTieredCache:
+    """Tests for TieredCache against the local memory cache."""
+
+    def test_concurrent_misses_build_once(self):
+        """Simultaneous misses for one key should run the builder once and share its result."""
+        calls: list = []
+        tiered = TieredCache("test_single_flight", slow_builder(calls))
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(tiered.get("a"))) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert calls == ["a"]
+        assert results == [b"payload a"] * 20
+        stats = tiered.stats()
+        assert stats["rebuilds"] == 1
+        assert stats["coalesced_waits"] == 19
+        assert stats["hit_ratio"] == 0.95
+
+    def test_slow_build_does_not_block_other_keys(self):
+        """A rebuild in progress for one key should not hold up misses for any other key."""
+        release = threading.Event()
+
+        def build(key):
+            if key == "slow":
+                release.wait(5)
+            return f"payload {key}".encode()
+
+        tiered = TieredCache("test_key_locks", build)
+        slow = threading.Thread(target=tiered.get, args=("slow",))
+        slow.start()
+        try:
+            started = time.monotonic()
+            assert [tiered.get(key) for key in range(100)] == [f"payload {key}".encode() for key in range(100)]
+            assert time.monotonic() - started < 1
+        finally:
+            release.set()
+            slow.join()
+        assert tiered._key_locks == {}
+
+    def test_waits_for_another_process_building(self):
+        """A miss while another process holds the lock should poll for its result instead of building."""
+        calls: list = []
+        tiered = TieredCache("test_wait", slow_builder(calls), poll_interval=0.01)
+        cache.add("test_wait:lock:a", 1)
+        threading.Timer(0.05, lambda: cache.set("test_wait:a", (time.time(), b"from elsewhere"))).start()
+
+        assert tiered.get("a") == b"from elsewhere"
+        assert calls == []
+        assert tiered.stats()["coalesced_waits"] == 1
+
+    def test_busy_when_wait_times_out(self):
+        """A miss should not build under someone else's lock once the wait times out."""
+        calls: list = []
+        tiered = TieredCache("test_timeout", slow_builder(calls, 0), wait_timeout=0.05, poll_interval=0.01)
+        cache.add("test_timeout:lock:a", "other")
+
+        with pytest.raises(CacheBusy):
+            tiered.get("a")
+        assert calls == []
+        assert cache.get("test_timeout:lock:a") == "other"
+        assert tiered.stats()["busy"] == 1
+
+    def test_builds_itself_when_lock_holder_disappears(self):
+        """A miss should take the lock and build once the other builder's lock is gone."""
+        calls: list = []
+        tiered = TieredCache("test_orphan", slow_builder(calls, 0), poll_interval=0.01)
+        cache.add("test_orphan:lock:a", "other")
+        threading.Timer(0.03, cache.delete, ["test_orphan:lock:a"]).start()
+
+        assert tiered.get("a") == b"payload a"
+        assert calls == ["a"]
+        assert cache.get("test_orphan:lock:a") is None
+
+    def test_rebuild_keeps_lock_taken_over_mid_build(self):
+        """A builder whose lock expired mid-build should not release the lock another process took."""
+
+        def build(key):
+            cache.set("test_owner:lock:a", "other")  # Our lock expired and someone else took it
+            return b"payload"
+
+        tiered = TieredCache("test_owner", build)
+
+        assert tiered.get("a") == b"payload"
+        assert cache.get("test_owner:lock:a") == "other"
+
+    def test_local_tier_expires(self):
+        """Entries should be re-read from the shared cache after the local TTL."""
+        calls: list = []
+        tiered = TieredCache("test_ttl", slow_builder(calls, 0), lru_ttl=0)
+        tiered.get("a")
+        time.sleep(0.001)
+        tiered.get("a")
+
+        stats = tiered.stats()
+        assert stats["lru_hits"] == 0
+        assert stats["shared_hits"] == 1
+
+    def test_local_tier_evicts_least_recently_used(self):
+        """The local tier should hold at most lru_size entries."""
+        tiered = TieredCache("test_lru", slow_builder([], 0), lru_size=2)
+        for key in ["a", "b", "a", "c"]:
+            tiered.get(key)
+
+        assert list(tiered._lru) == ["a", "c"]
+
+    def test_missing_object_cached_briefly(self):
+        """A builder returning None should be remembered for missing_for, so 404s don't rebuild every time."""
+        calls: list = []
+
+        def build(key):
+            calls.append(key)
+            return None
+
+        tiered = TieredCache("test_missing", build, missing_for=60)
+
+        assert tiered.get("a") is None
+        assert tiered.get("a") is None
+        assert calls == ["a"]
+        assert cache.get("test_missing:lock:a") is None
+        assert list(tiered._lru) == []
+
+        tiered.invalidate("a")
+        assert tiered.get("a") is None
+        assert calls == ["a", "a"]
+
+
+@pytest.mark.django_db
+def test_metrics_requires_staff(api_client: APIClient) -> None:
+    """GET /api/ops/metrics/ is limited to staff and reports the car detail cache."""
+    user = User.objects.create_user(email="ops@example.com", password="x", is_staff=True)
+
+    assert api_client.get("/api/ops/metrics/").status_code == 401
+
+    api_client.force_authenticate(user)
+    response = api_client.get("/api/ops/metrics/")
+
+    assert response.status_code == 200
+    assert "hit_ratio" in response.data["car_detail_cache"]
+    assert "db_pool" in response.data
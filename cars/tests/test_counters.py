@@ -0,0 +1,142 @@
+"""Tests for the sharded view and inquiry counters."""
+from __future__ import annotations
+
+import pytest
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from cars import counters
+from cars.models import CarCounter, CarCounterShard
+from cars.tests.factories import create_brand, create_car
+
+
+@pytest.mark.django_db
+class TestIncrement:
+    """Tests for counting into shards."""
+
+    def test_increments_spread_over_shards(self, settings):
+        """Increments should land on up to COUNTER_SHARDS rows for the car."""
+        settings.COUNTER_SHARDS = 4
+        car = create_car()
+
+        for _ in range(100):
+            counters.increment(car.pk, "views")
+
+        shards = CarCounterShard.objects.filter(car=car)
+        assert 1 < shards.count() <= 4
+        assert sum(shard.views for shard in shards) == 100
+        assert not CarCounter.objects.exists()
+
+    @pytest.mark.django_db(transaction=True)  # The foreign key is only checked on commit
+    def test_increment_for_deleted_car_is_dropped(self):
+        """An increment for a car that no longer exists should be dropped, not raised."""
+        car = create_car()
+        car_id = car.pk
+        car.delete()
+
+        counters.increment(car_id, "inquiries")
+
+        assert not CarCounterShard.objects.exists()
+
+
+@pytest.mark.django_db
+class TestFold:
+    """Tests for folding shards into the per-car totals."""
+
+    def test_fold_moves_counts_and_zeroes_shards(self):
+        """fold() should add the shard counts to CarCounter and reset the shards."""
+        brand = create_brand()
+        car, other = create_car(brand=brand), create_car(brand=brand, model="Dino")
+        for _ in range(3):
+            counters.increment(car.pk, "views")
+        counters.increment(car.pk, "inquiries")
+        counters.increment(other.pk, "views")
+
+        assert counters.fold() == 2
+        assert counters.fold() == 0
+
+        assert counters.counts(car.pk) == {"views": 3, "inquiries": 1}
+        assert counters.counts(other.pk) == {"views": 1, "inquiries": 0}
+        assert not CarCounterShard.objects.exclude(views=0, inquiries=0).exists()
+
+    def test_fold_adds_to_existing_totals(self):
+        """A second fold should add to, not replace, the totals."""
+        car = create_car()
+        counters.increment(car.pk, "views", 2)
+        counters.fold_all()
+        counters.increment(car.pk, "views", 5)
+        counters.fold_all()
+
+        assert CarCounter.objects.get(car=car).views == 7
+
+    def test_exact_counts_include_unfolded_shards(self):
+        """counts(exact=True) should add what has not been folded yet."""
+        car = create_car()
+        counters.increment(car.pk, "views", 2)
+        counters.fold_all()
+        counters.increment(car.pk, "views")
+
+        assert counters.counts(car.pk)["views"] == 2
+        assert counters.counts(car.pk, exact=True)["views"] == 3
+
+    def test_fold_counters_command(self):
+        """manage.py fold_counters --once should fold every pending shard."""
+        car = create_car()
+        counters.increment(car.pk, "inquiries")
+
+        call_command("fold_counters", "--once", "--batch-size", "1")
+
+        assert counters.counts(car.pk)["inquiries"] == 1
+        assert counters.stats()["pending_cars"] == 0
+
+
+@pytest.mark.django_db
+class TestCountedEndpoints:
+    """Tests for the endpoints that count and publish views and inquiries."""
+
+    def test_car_detail_counts_views(self, api_client: APIClient):
+        """GET /api/cars/{id}/ should count a view per request, cached or not."""
+        car = create_car()
+
+        api_client.get(f"/api/cars/{car.id}/")
+        api_client.get(f"/api/cars/{car.id}/")
+
+        assert counters.counts(car.pk, exact=True)["views"] == 2
+
+    def test_missing_car_is_not_counted(self, api_client: APIClient):
+        """GET /api/cars/{id}/ should not count views for a car that is not listed."""
+        car = create_car(status="draft")
+
+        response = api_client.get(f"/api/cars/{car.id}/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert not CarCounterShard.objects.exists()
+
+    def test_inquiry_create_counts_inquiries(self, api_client: APIClient):
+        """POST /api/cars/inquiries/ should count an inquiry once, even when resubmitted."""
+        car = create_car()
+        data = {
+            "car": str(car.id),
+            "collector_name": "John Doe",
+            "collector_email": "john@example.com",
+            "message": "I am very interested in purchasing this beautiful vintage car.",
+        }
+
+        assert api_client.post("/api/cars/inquiries/", data).status_code == status.HTTP_201_CREATED
+        api_client.post("/api/cars/inquiries/", data)
+
+        assert counters.counts(car.pk, exact=True)["inquiries"] == 1
+
+    def test_car_detail_publishes_folded_counts(self, api_client: APIClient, django_capture_on_commit_callbacks):
+        """GET /api/cars/{id}/ should show the totals as of the last fold."""
+        car = create_car()
+        api_client.get(f"/api/cars/{car.id}/")
+        assert api_client.get(f"/api/cars/{car.id}/").json()["view_count"] == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            counters.fold_all()
+        payload = api_client.get(f"/api/cars/{car.id}/").json()
+
+        assert payload["view_count"] == 2
+        assert payload["inquiry_count"] == 0
@@ -0,0 +1,147 @@
+"""Tests for the streaming inquiry CSV export."""
+from __future__ import annotations
+
+import csv
+import io
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.tests.helpers import create_user
+from cars.exports import inquiry_csv_rows
+from cars.models import Inquiry
+from cars.tests.factories import create_brand, create_car, create_inquiry
+
+URL = "/api/cars/inquiries/export/"
+
+
+def read_csv(response) -> list[dict[str, str]]:
+    body = b"".join(response.streaming_content).decode()
+    return list(csv.DictReader(io.StringIO(body)))
+
+
+@pytest.mark.django_db
+class TestInquiryExportAPI:
+    """Tests for GET /api/cars/inquiries/export/."""
+
+    def test_streams_joined_rows(self, api_client: APIClient):
+        """GET /api/cars/inquiries/export/ should stream CSV joined with car and brand, newest first."""
+        car = create_car(brand=create_brand(name="Lancia"), model="Aurelia", year=1954)
+        older = create_inquiry(car=car, collector_name="First")
+        newer = create_inquiry(car=car, collector_name="Second")
+        api_client.force_authenticate(create_user(is_staff=True))
+
+        response = api_client.get(URL)
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Type"] == "text/csv"
+        assert response["Content-Disposition"].startswith('attachment; filename="inquiries-')
+        rows = read_csv(response)
+        assert [row["inquiry_id"] for row in rows] == [str(newer.pk), str(older.pk)]
+        assert rows[0]["brand"] == "Lancia"
+        assert rows[0]["model"] == "Aurelia"
+        assert rows[0]["year"] == "1954"
+
+    def test_filters_by_brand_and_date(self, api_client: APIClient):
+        """GET /api/cars/inquiries/export/?brand=&created_after= should narrow the export."""
+        lancia = create_car(brand=create_brand(name="Lancia"))
+        jaguar = create_car(brand=create_brand(name="Jaguar"))
+        recent = create_inquiry(car=lancia)
+        stale = create_inquiry(car=lancia)
+        Inquiry.objects.filter(pk=stale.pk).update(created_at=timezone.now() - timedelta(days=30))
+        create_inquiry(car=jaguar)
+        api_client.force_authenticate(create_user(is_staff=True))
+        since = (timezone.now() - timedelta(days=7)).date().isoformat()
+
+        response = api_client.get(URL, {"brand": str(lancia.brand_id), "created_after": since})
+
+        assert [row["inquiry_id"] for row in read_csv(response)] == [str(recent.pk)]
+
+    def test_sellers_export_only_their_cars(self, api_client: APIClient):
+        """GET /api/cars/inquiries/export/ should limit non-staff users to their own listings."""
+        seller = create_user()
+        brand = create_brand()
+        own = create_inquiry(car=create_car(brand=brand, seller=seller))
+        create_inquiry(car=create_car(brand=brand, model="Other"))
+        api_client.force_authenticate(seller)
+
+        assert [row["inquiry_id"] for row in read_csv(api_client.get(URL))] == [str(own.pk)]
+
+    def test_requires_authentication(self, api_client: APIClient):
+        """GET /api/cars/inquiries/export/ should return 401 for anonymous users."""
+        assert api_client.get(URL).status_code == 401
+
+    def test_rejects_bad_dates(self, api_client: APIClient):
+        """GET /api/cars/inquiries/export/ should return 400 for an unparseable date."""
+        api_client.force_authenticate(create_user(is_staff=True))
+
+        assert api_client.get(URL, {"created_before": "soon"}).status_code == 400
+
+    def test_rejects_bad_ids(self, api_client: APIClient):
+        """GET /api/cars/inquiries/export/ should return 400 for a malformed brand or car ID."""
+        api_client.force_authenticate(create_user(is_staff=True))
+
+        assert api_client.get(URL, {"brand": "nope"}).data == {"brand": "Enter a valid brand ID."}
+        assert api_client.get(URL, {"car": "nope"}).status_code == 400
+
+    def test_accepts_text_csv(self, api_client: APIClient):
+        """GET /api/cars/inquiries/export/ should honour `Accept: text/csv`, errors included."""
+        create_inquiry()
+        api_client.force_authenticate(create_user(is_staff=True))
+
+        response = api_client.get(URL, HTTP_ACCEPT="text/csv")
+        assert response.status_code == 200
+        assert len(read_csv(response)) == 1
+
+        error = api_client.get(URL, {"created_before": "soon"}, HTTP_ACCEPT="text/csv")
+        assert error.status_code == 400
+        assert error["Content-Type"] == "text/csv; charset=utf-8"
+        assert error.content.decode().strip() == "created_before,Enter a valid ISO date or datetime."
+
+
+@pytest.mark.django_db
+class TestInquiryCsvRows:
+    """Tests for the row generator."""
+
+    def test_reads_in_chunks(self, django_assert_num_queries):
+        """Rows should come from one chunked cursor, not a list of model instances."""
+        car = create_car()
+        for i in range(3):
+            create_inquiry(car=car, collector_name=f"Collector {i}")
+
+        rows = inquiry_csv_rows(Inquiry.objects.all(), chunk_size=2)
+        header = next(rows)
+        with django_assert_num_queries(1):
+            lines = list(rows)
+
+        assert header.startswith("inquiry_id,created_at")
+        assert len(lines) == 3
+
+    def test_formulas_are_neutralised(self):
+        """Cells that a spreadsheet would run as formulas should be prefixed with a quote."""
+        create_inquiry(collector_name="=HYPERLINK(\"http://evil\")", message="-1+1")
+
+        rows = list(csv.DictReader(io.StringIO("".join(inquiry_csv_rows(Inquiry.objects.all())))))
+
+        assert rows[0]["collector_name"].startswith("'=")
+        assert rows[0]["message"] == "'-1+1"
+
+
+@pytest.mark.django_db
+def test_admin_export_action(client):
+    """The InquiryAdmin export action should stream the selected inquiries."""
+    inquiry = create_inquiry()
+    create_inquiry(car=inquiry.car, collector_name="Not selected")
+    client.force_login(create_user(is_staff=True, is_superuser=True))
+
+    response = client.post(
+        reverse("admin:cars_inquiry_changelist"),
+        {"action": "export_csv", "_selected_action": [str(inquiry.pk)]},
+    )
+
+    assert response.status_code == 200
+    assert [row["inquiry_id"] for row in read_csv(response)] == [str(inquiry.pk)]
@@ -0,0 +1,178 @@
+"""Tests for gallery ordering and the one-primary-image constraint."""
+from __future__ import annotations
+
+import pytest
+from django.db import IntegrityError, transaction
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.tests.helpers import create_user
+from cars.gallery import reorder_gallery
+from cars.models import CarImage, ListingEvent
+from cars.tests.factories import create_car, create_car_image
+
+
+def gallery(car) -> list[tuple[str, bool]]:
+    return list(car.images.values_list("alt_text", "is_primary"))
+
+
+@pytest.fixture
+def car():
+    car = create_car(seller=create_user())
+    for position, name in enumerate(["Front", "Side", "Rear"]):
+        create_car_image(car=car, alt_text=name, sort_order=position, is_primary=position == 0)
+    return car
+
+
+@pytest.mark.django_db
+class TestPrimaryConstraint:
+    """Tests for car_image_one_primary."""
+
+    def test_second_primary_is_rejected(self, car):
+        """The database should refuse a second primary image for the same car."""
+        with pytest.raises(IntegrityError), transaction.atomic():
+            create_car_image(car=car, is_primary=True)
+
+    def test_other_cars_are_unaffected(self, car):
+        """Each car should get its own primary image."""
+        other = create_car(brand=car.brand, model="Other")
+        create_car_image(car=other, is_primary=True)
+
+        assert CarImage.objects.filter(is_primary=True).count() == 2
+
+
+@pytest.mark.django_db
+class TestReorderGallery:
+    """Tests for reorder_gallery."""
+
+    def test_reorders_and_moves_primary(self, car, django_assert_num_queries):
+        """The new order and primary should be written in one transaction, with one event per image."""
+        front, side, rear = car.images.all()
+        before = ListingEvent.objects.count()
+
+        # Savepoint, lock and read, clear the old primary, reorder, events, release
+        with django_assert_num_queries(6):
+            reorder_gallery(car, [rear.pk, front.pk, side.pk], primary_id=rear.pk)
+
+        assert gallery(car) == [("Rear", True), ("Front", False), ("Side", False)]
+        assert ListingEvent.objects.count() == before + 3
+
+    def test_keeps_primary_when_not_given(self, car):
+        """Reordering alone should leave the primary image as it was."""
+        front, side, rear = car.images.all()
+
+        reorder_gallery(car, [side.pk, rear.pk, front.pk])
+
+        assert gallery(car) == [("Side", False), ("Rear", False), ("Front", True)]
+
+    def test_requires_every_image(self, car):
+        """A list that misses or adds images should be rejected without writing."""
+        front, side, rear = car.images.all()
+        stranger = create_car_image(car=create_car(brand=car.brand, model="Other"))
+
+        with pytest.raises(ValueError):
+            reorder_gallery(car, [rear.pk, front.pk])
+        with pytest.raises(ValueError):
+            reorder_gallery(car, [rear.pk, front.pk, stranger.pk])
+        with pytest.raises(ValueError):
+            reorder_gallery(car, [rear.pk, front.pk, side.pk], primary_id=stranger.pk)
+
+        assert gallery(car) == [("Front", True), ("Side", False), ("Rear", False)]
+
+
+@pytest.mark.django_db
+class TestCarGalleryOrderAPI:
+    """Tests for POST /api/cars/{id}/images/order/."""
+
+    def url(self, car) -> str:
+        return f"/api/cars/{car.pk}/images/order/"
+
+    def test_seller_reorders(self, api_client: APIClient, car, django_capture_on_commit_callbacks):
+        """POST /api/cars/{id}/images/order/ should return the gallery in its new order."""
+        front, side, rear = car.images.all()
+        api_client.force_authenticate(car.seller)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(
+                self.url(car),
+                {"images": [str(side.pk), str(front.pk), str(rear.pk)], "primary": str(side.pk)},
+                format="json",
+            )
+
+        assert response.status_code == 200
+        assert [(image["alt_text"], image["sort_order"], image["is_primary"]) for image in response.data] == [
+            ("Side", 0, True),
+            ("Front", 1, False),
+            ("Rear", 2, False),
+        ]
+        assert api_client.get(f"/api/cars/{car.pk}/").json()["images"][0]["alt_text"] == "Side"
+
+    def test_rejects_incomplete_order(self, api_client: APIClient, car):
+        """POST /api/cars/{id}/images/order/ should return 400 unless every image is listed once."""
+        front, side, _ = car.images.all()
+        api_client.force_authenticate(car.seller)
+
+        for images in ([front.pk, side.pk], [front.pk, front.pk]):
+            response = api_client.post(self.url(car), {"images": [str(pk) for pk in images]}, format="json")
+            assert response.status_code == 400
+
+    def test_other_sellers_get_404(self, api_client: APIClient, car):
+        """POST /api/cars/{id}/images/order/ should hide cars the user doesn't sell."""
+        api_client.force_authenticate(create_user(email="other@example.com"))
+
+        ids = [str(pk) for pk in car.images.values_list("pk", flat=True)]
+        assert api_client.post(self.url(car), {"images": ids}, format="json").status_code == 404
+
+    def test_requires_authentication(self, api_client: APIClient, car):
+        """POST /api/cars/{id}/images/order/ should return 401 for anonymous users."""
+        assert api_client.post(self.url(car), {"images": []}, format="json").status_code == 401
+
+
+@pytest.mark.django_db
+def test_admin_inline_moves_primary(client, car, settings):
+    """The car admin should move the primary flag between images in one save."""
+    # The change form is redisplayed on error; render it without a collected manifest
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    }
+    client.force_login(create_user(email="staff@example.com", is_staff=True, is_superuser=True))
+    images = list(car.images.all())
+    data = {
+        "brand": str(car.brand_id),
+        "model": car.model,
+        "year": car.year,
+        "price": str(car.price),
+        "seller": str(car.seller_id),
+        "description": car.description,
+        "status": car.status,
+        "country": "",
+        "region": "",
+        "latitude": "",
+        "longitude": "",
+        "images-TOTAL_FORMS": len(images),
+        "images-INITIAL_FORMS": len(images),
+        "images-MIN_NUM_FORMS": 0,
+        "images-MAX_NUM_FORMS": 1000,
+    }
+    for index, image in enumerate(images):
+        data.update(
+            {
+                f"images-{index}-id": str(image.pk),
+                f"images-{index}-car": str(car.pk),
+                f"images-{index}-image_url": image.image_url,
+                f"images-{index}-alt_text": image.alt_text,
+                f"images-{index}-sort_order": image.sort_order,
+            }
+        )
+    data["images-2-is_primary"] = "on"  # Rear takes over from Front
+
+    response = client.post(reverse("admin:cars_car_change", args=[car.pk]), data)
+
+    assert response.status_code == 302
+    assert gallery(car) == [("Front", False), ("Side", False), ("Rear", True)]
+
+    data["images-1-is_primary"] = "on"
+    response = client.post(reverse("admin:cars_car_change", args=[car.pk]), data)
+    assert response.status_code == 200  # Two primaries: redisplayed with an error
+    assert "Only one image can be primary." in response.content.decode()
@@ -0,0 +1,49 @@
+"""Tests for the geohash helpers behind radius search."""
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from cars import geo
+
+
+class TestGeohash:
+    """Tests for encoding and range covers."""
+
+    def test_encode_known_value(self):
+        """encode should match the reference geohash implementation."""
+        assert geo.encode(57.64911, 10.40744) == "u4pruydqq"
+        assert geo.encode(-33.8688, 151.2093, precision=5) == "r3gx2"
+
+    def test_successor(self):
+        """successor should give the first string past every string with the prefix."""
+        assert geo.successor("u4pr") == "u4ps"
+        assert geo.successor("u4pz") == "u4q"
+        assert geo.successor("zz") == "~"
+
+    @pytest.mark.parametrize(
+        "latitude, longitude, radius_km",
+        [(45.07, 7.68, 25), (51.5, -0.12, 5), (0.0, 179.99, 50), (-89.9, 10.0, 100), (35.0, -120.0, 900)],
+    )
+    def test_cover_contains_every_point_in_radius(self, latitude, longitude, radius_km):
+        """Every point inside the radius should fall in one of the covering ranges."""
+        ranges = geo.cover(latitude, longitude, radius_km)
+        assert len(ranges) <= geo.MAX_COVER_CELLS
+
+        rng = random.Random(0)
+        dlat = radius_km / geo.KM_PER_DEGREE_LAT
+        for _ in range(500):
+            point_lat = max(min(latitude + rng.uniform(-dlat, dlat), 90.0), -90.0)
+            point_lng = (longitude + rng.uniform(-2, 2) * dlat + 180) % 360 - 180
+            if haversine_km(latitude, longitude, point_lat, point_lng) > radius_km:
+                continue
+            geohash = geo.encode(point_lat, point_lng)
+            assert any(low <= geohash < high for low, high in ranges), (point_lat, point_lng)
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = math.sin((phi2 - phi1) / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lng2 - lng1) / 2) ** 2
+    return 2 * geo.EARTH_RADIUS_KM * math.asin(math.sqrt(a))
@@ -0,0 +1,106 @@
+"""Tests for the price and year histogram endpoint."""
+from __future__ import annotations
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from cars.bulk import bulk_update_cars
+from cars.models import Car
+from cars.tests.factories import create_brand, create_car, create_cars
+
+URL = "/api/cars/stats/histogram/"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+class TestCarHistogramAPI:
+    """Tests for GET /api/cars/stats/histogram/."""
+
+    def test_price_buckets(self, api_client: APIClient):
+        """GET /api/cars/stats/histogram/ should count active cars in equal-width price buckets."""
+        brand = create_brand()
+        create_cars(5, brand=brand, price=lambda i: ["100.00", "150.00", "240.00", "300.00", "500.00"][i])
+        create_car(brand=brand, price="120.00", status=Car.Status.DRAFT)
+
+        response = api_client.get(URL, {"field": "price", "bins": 4})
+
+        assert response.status_code == 200
+        assert response.data["count"] == 5
+        assert (response.data["min"], response.data["max"]) == ("100.00", "500.00")
+        assert [(b["lower"], b["upper"], b["count"]) for b in response.data["buckets"]] == [
+            ("100.00", "200.00", 2),
+            ("200.00", "300.00", 1),
+            ("300.00", "400.00", 1),
+            ("400.00", "500.00", 1),
+        ]
+
+    def test_single_bucket_when_all_prices_match(self, api_client: APIClient):
+        """GET /api/cars/stats/histogram/ should return one bucket when every car has the same price."""
+        create_cars(3, price="100.00")
+
+        response = api_client.get(URL, {"field": "price", "bins": 4})
+
+        assert [(b["lower"], b["upper"], b["count"]) for b in response.data["buckets"]] == [("100.00", "100.00", 3)]
+
+    def test_year_buckets_are_whole_years(self, api_client: APIClient):
+        """GET /api/cars/stats/histogram/?field=year should use whole-year buckets."""
+        create_cars(4, year=lambda i: [1950, 1951, 1955, 1959][i])
+
+        response = api_client.get(URL, {"field": "year", "bins": 3})
+
+        assert [(b["lower"], b["upper"], b["count"]) for b in response.data["buckets"]] == [
+            (1950, 1953, 2),
+            (1954, 1957, 1),
+            (1958, 1961, 1),
+        ]
+
+    def test_honours_list_filters(self, api_client: APIClient):
+        """GET /api/cars/stats/histogram/?brand=&featured= should cover the same cars as the list."""
+        lancia = create_brand(name="Lancia")
+        create_cars(3, brand=lancia, is_featured=lambda i: i == 0)
+        create_cars(2, brand=create_brand(name="Jaguar"), is_featured=True)
+
+        response = api_client.get(URL, {"brand": str(lancia.pk), "featured": "true"})
+
+        assert response.data["count"] == 1
+        assert sum(bucket["count"] for bucket in response.data["buckets"]) == 1
+
+    def test_empty_catalog(self, api_client: APIClient):
+        """GET /api/cars/stats/histogram/ should return no buckets when nothing matches."""
+        response = api_client.get(URL)
+
+        assert response.status_code == 200
+        assert response.data == {"field": "price", "count": 0, "min": None, "max": None, "buckets": []}
+
+    @pytest.mark.parametrize(
+        "params",
+        [{"field": "mileage"}, {"bins": "0"}, {"bins": "101"}, {"bins": "many"}, {"brand": "not-a-uuid"}],
+    )
+    def test_rejects_bad_parameters(self, api_client: APIClient, params):
+        """GET /api/cars/stats/histogram/ should return 400 for bad parameters."""
+        assert api_client.get(URL, params).status_code == 400
+
+    def test_cached_until_a_car_changes(
+        self, api_client: APIClient, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        """Repeat requests should be served from the cache until a car is written."""
+        car = create_car(price="100.00")
+        api_client.get(URL)
+
+        with django_assert_num_queries(0):
+            assert api_client.get(URL).data["count"] == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            create_car(brand=car.brand, price="200.00")
+        assert api_client.get(URL).data["count"] == 2
+
+        with django_capture_on_commit_callbacks(execute=True):
+            bulk_update_cars([car.pk], "archive")
+        assert api_client.get(URL).data["count"] == 1
@@ -0,0 +1,98 @@
+"""Tests that public catalog queries only touch the active-car indexes."""
+from __future__ import annotations
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from cars.models import Car, Inquiry
+from cars.tests.factories import create_brand, create_car, create_inquiry
+
+
+def car_query_plans(api_client: APIClient, url: str) -> list[str]:
+    """Run a request and return the SQLite query plan of each statement reading the cars table."""
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(url)
+    assert response.status_code == 200
+
+    plans = []
+    for query in queries.captured_queries:
+        if 'FROM "cars"' not in query["sql"]:
+            continue
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {query['sql']}")
+            plans.append(" | ".join(row[-1] for row in cursor.fetchall()))
+    return plans
+
+
+@pytest.mark.django_db
+class TestActiveCarIndexes:
+    """Tests for the partial-index storage strategy on Car."""
+
+    @pytest.fixture(autouse=True)
+    def require_sqlite(self):
+        if connection.vendor != "sqlite":
+            pytest.skip("Plan assertions are written against SQLite's EXPLAIN QUERY PLAN")
+
+    def test_list_queries_use_active_indexes(self, api_client: APIClient):
+        """CarListView and its filters should read through partial indexes on status='active'."""
+        brand = create_brand()
+        create_car(brand=brand, is_featured=True)
+
+        for url, index in [
+            ("/api/cars/", "car_active_created_idx"),
+            (f"/api/cars/?brand={brand.id}", "car_active_brand_idx"),
+            ("/api/cars/?featured=true", "car_active_featured_idx"),
+            ("/api/cars/?near=45.07,7.68&radius_km=25", "car_geohash_idx"),
+        ]:
+            plans = car_query_plans(api_client, url)
+            assert plans, url
+            assert all(index in plan for plan in plans), (url, plans)
+
+    def test_detail_query_uses_primary_key(self, api_client: APIClient):
+        """CarDetailView should look the car up by primary key, not scan."""
+        car = create_car()
+
+        plans = car_query_plans(api_client, f"/api/cars/{car.id}/")
+
+        assert plans
+        assert all("SEARCH cars USING INDEX" in plan for plan in plans), plans
+
+    def test_status_transitions_move_rows(self, api_client: APIClient):
+        """Cars leave and re-enter the active set as their status changes."""
+        car = create_car()
+
+        car.status = Car.Status.SOLD
+        car.save()
+        assert api_client.get("/api/cars/").data["count"] == 0
+        assert api_client.get(f"/api/cars/{car.id}/").status_code == 404
+
+        car.status = Car.Status.ACTIVE
+        car.save()
+        assert api_client.get("/api/cars/").data["count"] == 1
+
+
+@pytest.mark.django_db
+class TestInquiryMessageSearchIndex:
+    """Tests that message searches can use the trigram index (PostgreSQL only)."""
+
+    @pytest.fixture(autouse=True)
+    def require_postgresql(self):
+        if connection.vendor != "postgresql":
+            pytest.skip("The trigram index only exists on PostgreSQL")
+
+    def test_icontains_uses_trigram_index(self):
+        """message__icontains, as used by the inbox and admin search, should read inquiry_message_trgm_idx."""
+        car = create_car()
+        for n in range(20):
+            create_inquiry(car=car, message=f"Question {n} about the brakes")
+        search = Inquiry.objects.filter(message__icontains="brakes").order_by().values("id")
+        sql, params = search.query.sql_with_params()
+
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute(f"EXPLAIN {sql}", params)
+            plan = " | ".join(row[0] for row in cursor.fetchall())
+
+        assert "inquiry_message_trgm_idx" in plan, plan
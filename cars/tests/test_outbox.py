@@ -0,0 +1,227 @@
+"""Tests for the listing event outbox."""
+from __future__ import annotations
+
+import pytest
+from django.core.management import call_command
+from django.db import transaction
+
+from cars import outbox
+from cars.models import Car, ListingEvent, OutboxCheckpoint, OutboxDeadLetter
+from cars.tests.factories import create_brand, create_car, create_car_image
+
+
+@pytest.fixture(autouse=True)
+def handlers(monkeypatch, settings):
+    """Run each test against its own handler registry."""
+    registry: dict[str, outbox.Handler] = {}
+    monkeypatch.setattr(outbox, "_handlers", registry)
+    settings.OUTBOX_RETRY_SECONDS = 0
+    return registry
+
+
+def collecting(name: str, topics=None) -> list[list[ListingEvent]]:
+    """Register a handler that records the batches it receives."""
+    batches: list[list[ListingEvent]] = []
+    outbox.register(name, batches.append, topics)
+    return batches
+
+
+@pytest.mark.django_db
+class TestRecording:
+    """Tests for writing events alongside catalog changes."""
+
+    def test_events_roll_back_with_the_write(self):
+        """A write that rolls back should leave no event behind."""
+        brand = create_brand()
+        before = ListingEvent.objects.count()
+
+        with pytest.raises(RuntimeError), transaction.atomic():
+            create_car(brand=brand)
+            raise RuntimeError
+
+        assert ListingEvent.objects.count() == before
+
+    def test_car_events_flag_activation(self):
+        """Car events should say whether the save made the car active."""
+        car = create_car(status=Car.Status.DRAFT)
+        car.status = Car.Status.ACTIVE
+        car.save()
+        car.description = "Repainted"
+        car.save()
+
+        events = list(ListingEvent.objects.filter(topic="car", object_id=car.pk))
+        assert [event.data["activated"] for event in events] == [False, True, False]
+        assert events[0].data["created"] is True
+
+    def test_deletes_and_images_carry_the_car(self):
+        """Image and delete events should point at the affected car."""
+        image = create_car_image()
+        car_id = image.car_id
+        image.delete()
+        car = Car.objects.get(pk=car_id)
+        car.delete()
+
+        assert list(ListingEvent.objects.exclude(topic="brand").values_list("topic", "action", "car_id")) == [
+            ("car", "saved", car_id),
+            ("car_image", "saved", car_id),
+            ("car_image", "deleted", car_id),
+            ("car", "deleted", car_id),
+        ]
+
+
+@pytest.mark.django_db
+class TestConsume:
+    """Tests for delivering events to handlers."""
+
+    def test_batches_in_order_and_checkpoint(self):
+        """Events should arrive in id order, in batches, and not be delivered twice."""
+        batches = collecting("all")
+        brand = create_brand()
+        create_car(brand=brand, model="One")
+        create_car(brand=brand, model="Two")
+        handler = outbox.handlers()[0]
+        ids = list(ListingEvent.objects.values_list("id", flat=True))
+
+        assert outbox.consume(handler, batch_size=2) == 2
+        assert outbox.consume(handler, batch_size=2) == 1
+        assert outbox.consume(handler, batch_size=2) == 0
+
+        assert [[event.id for event in batch] for batch in batches] == [ids[:2], ids[2:]]
+        assert OutboxCheckpoint.objects.get(name="all").last_event_id == ids[-1]
+
+    def test_topic_filter_still_advances(self):
+        """A handler should only see its topics, but move past the others."""
+        brands = collecting("brands", topics=["brand"])
+        create_car(brand=create_brand())
+
+        outbox.consume_all()
+
+        assert [[event.topic for event in batch] for batch in brands] == [["brand"]]
+        assert OutboxCheckpoint.objects.get(name="brands").last_event_id == ListingEvent.objects.latest("id").id
+
+    def test_failing_handler_retries_from_checkpoint(self):
+        """A handler that raises should keep its place without holding up the others."""
+        calls = []
+
+        def flaky(events):
+            calls.append(len(events))
+            if len(calls) == 1:
+                raise ConnectionError("index down")
+
+        outbox.register("flaky", flaky)
+        healthy = collecting("healthy")
+        create_brand()
+
+        assert outbox.consume_all() == 1  # Only the healthy handler advanced
+        assert outbox.consume_all() == 1  # The retry succeeds
+
+        assert calls == [1, 1]
+        assert len(healthy) == 1
+
+    def test_poison_event_is_isolated_and_dead_lettered(self, settings):
+        """A batch that fails should be retried one event at a time, and a bad event skipped after the limit."""
+        settings.OUTBOX_MAX_ATTEMPTS = 3
+        brand = create_brand()
+        events = [outbox.record("brand", "saved", brand.pk, n=n) for n in range(4)]
+        delivered = []
+
+        def picky(batch):
+            if any(event.data.get("n") == 1 for event in batch):
+                raise ValueError("cannot index")
+            delivered.extend(event.id for event in batch)
+
+        outbox.register("picky", picky)
+        for _ in range(10):
+            outbox.consume_all()
+
+        poison = events[1]
+        assert delivered == list(ListingEvent.objects.exclude(pk=poison.pk).values_list("id", flat=True))
+        letter = OutboxDeadLetter.objects.get()
+        assert (letter.handler, letter.event_id, letter.attempts) == ("picky", poison.id, 3)
+        assert letter.error == "ValueError: cannot index"
+        checkpoint = OutboxCheckpoint.objects.get(name="picky")
+        assert (checkpoint.failures, checkpoint.isolate) == (0, 0)
+        assert outbox.stats()["handlers"]["picky"]["dead_letters"] == 1
+
+    def test_failing_handler_backs_off(self, settings):
+        """After a failure the handler should not be retried before OUTBOX_RETRY_SECONDS."""
+        settings.OUTBOX_RETRY_SECONDS = 60
+        calls = []
+
+        def down(events):
+            calls.append(len(events))
+            raise ConnectionError("index down")
+
+        outbox.register("down", down)
+        create_brand()
+        outbox.consume_all()
+        outbox.consume_all()
+
+        assert calls == [1]
+        assert OutboxCheckpoint.objects.get(name="down").failures == 1
+        assert not OutboxDeadLetter.objects.exists()
+
+    def test_delivers_in_transaction_order(self, monkeypatch):
+        """Events should go out in (txid, id) order, only from transactions below the horizon."""
+        batches = collecting("all")
+        brand = create_brand()
+        outbox.consume_all()
+        late_commit, early_commit, running = (
+            outbox.record("brand", "saved", brand.pk),
+            outbox.record("brand", "saved", brand.pk),
+            outbox.record("brand", "saved", brand.pk),
+        )
+        # The first id went to a transaction that started after the second one's
+        ListingEvent.objects.filter(pk=late_commit.pk).update(txid=20)
+        ListingEvent.objects.filter(pk=early_commit.pk).update(txid=10)
+        ListingEvent.objects.filter(pk=running.pk).update(txid=30)
+        monkeypatch.setattr(outbox, "horizon", lambda: 30)  # Transaction 30 is still running
+
+        outbox.consume_all()
+        monkeypatch.setattr(outbox, "horizon", lambda: 31)
+        outbox.consume_all()
+
+        assert [[event.id for event in batch] for batch in batches[1:]] == [
+            [early_commit.id, late_commit.id],
+            [running.id],
+        ]
+        checkpoint = OutboxCheckpoint.objects.get(name="all")
+        assert (checkpoint.last_txid, checkpoint.last_event_id) == (30, running.id)
+
+    def test_prune_keeps_undelivered_events(self):
+        """prune should only delete events every handler has processed."""
+        collecting("first")
+        collecting("second")
+        create_brand()
+        outbox.consume(outbox.handlers()[0])
+
+        assert outbox.prune() == 0  # "second" has never run
+        outbox.consume(outbox.handlers()[1])
+        assert outbox.prune() == 1
+        assert not ListingEvent.objects.exists()
+
+    def test_stats_report_lag(self):
+        """stats should report each handler's checkpoint and how far behind it is."""
+        collecting("idle")
+        create_brand()
+
+        stats = outbox.stats()
+        assert stats["handlers"]["idle"] == {
+            "checkpoint": 0,
+            "lag": ListingEvent.objects.count(),
+            "failures": 0,
+            "dead_letters": 0,
+        }
+        outbox.consume_all()
+        assert outbox.stats()["handlers"]["idle"]["lag"] == 0
+
+    def test_command_drains_and_prunes(self):
+        """consume_outbox --once should deliver everything pending and prune it."""
+        batches = collecting("all")
+        create_car(brand=create_brand())
+
+        call_command("consume_outbox", "--once")
+
+        assert sum(len(batch) for batch in batches) == 2
+        assert not ListingEvent.objects.exists()
+
@@ -0,0 +1,145 @@
+"""Query snapshots for the cars endpoints, recorded against the seeded catalog."""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from accounts.tests.helpers import create_user
+from cars.cache import car_detail_cache
+from cars.feeds import home_feed_cache
+from cars.tests.helpers import SeededCatalog
+
+Url = Callable[[SeededCatalog], str]
+
+# name, method, url, who is logged in, request body
+ENDPOINTS: list[tuple[str, str, Url, str | None, Callable[[SeededCatalog], dict] | None]] = [
+    ("brand-list", "get", lambda c: "/api/cars/brands/", None, None),
+    ("brand-list-stats", "get", lambda c: "/api/cars/brands/?stats=true", None, None),
+    ("brand-detail", "get", lambda c: f"/api/cars/brands/{c.brands[0].pk}/", None, None),
+    ("car-list", "get", lambda c: "/api/cars/", None, None),
+    ("car-list-brand", "get", lambda c: f"/api/cars/?brand={c.brands[0].pk}", None, None),
+    ("car-list-featured", "get", lambda c: "/api/cars/?featured=true", None, None),
+    ("car-list-near", "get", lambda c: "/api/cars/?near=45.0,11.1&radius_km=100", None, None),
+    ("car-detail", "get", lambda c: f"/api/cars/{c.active_cars[0].pk}/", None, None),
+    (
+        "car-gallery-order",
+        "post",
+        lambda c: f"/api/cars/{c.cars[0].pk}/images/order/",
+        "seller",
+        lambda c: {"images": [str(pk) for pk in c.cars[0].images.order_by("-sort_order").values_list("pk", flat=True)]},
+    ),
+    ("car-price-history", "get", lambda c: f"/api/cars/{c.cars[0].pk}/price-history/", None, None),
+    ("car-histogram", "get", lambda c: f"/api/cars/stats/histogram/?brand={c.brands[0].pk}&bins=10", None, None),
+    ("home-feed", "get", lambda c: "/api/cars/home/", None, None),
+    (
+        "car-batch",
+        "get",
+        lambda c: "/api/cars/batch/?ids=" + ",".join(str(car.pk) for car in c.active_cars[:10]),
+        None,
+        None,
+    ),
+    (
+        "car-bulk-action",
+        "post",
+        lambda c: "/api/cars/bulk/",
+        "staff",
+        lambda c: {"ids": [str(car.pk) for car in c.cars[:10]], "action": "feature"},
+    ),
+    (
+        "inquiry-create",
+        "post",
+        lambda c: "/api/cars/inquiries/",
+        None,
+        lambda c: {
+            "car": str(c.active_cars[0].pk),
+            "collector_name": "Jane Doe",
+            "collector_email": "jane@example.com",
+            "message": "I would like to arrange a viewing of this car.",
+        },
+    ),
+    ("inquiry-list", "get", lambda c: "/api/cars/inquiries/", "seller", None),
+    ("inquiry-export", "get", lambda c: f"/api/cars/inquiries/export/?brand={c.brands[0].pk}", "seller", None),
+    ("inquiry-detail", "get", lambda c: f"/api/cars/inquiries/{c.cars[0].inquiries.first().pk}/", "seller", None),
+    (
+        "inquiry-update",
+        "patch",
+        lambda c: f"/api/cars/inquiries/{c.cars[0].inquiries.first().pk}/",
+        "seller",
+        lambda c: {"is_read": True},
+    ),
+    ("saved-search-list", "get", lambda c: "/api/cars/saved-searches/", "collector", None),
+    (
+        "saved-search-create",
+        "post",
+        lambda c: "/api/cars/saved-searches/",
+        "collector",
+        lambda c: {"name": "Lancias", "brand": str(c.brands[3].pk), "year_min": 1960, "max_price": "150000"},
+    ),
+    (
+        "saved-search-detail",
+        "get",
+        lambda c: f"/api/cars/saved-searches/{c.saved_searches[0].pk}/",
+        "collector",
+        None,
+    ),
+    (
+        "saved-search-delete",
+        "delete",
+        lambda c: f"/api/cars/saved-searches/{c.saved_searches[0].pk}/",
+        "collector",
+        None,
+    ),
+]
+
+
+@pytest.fixture(autouse=True)
+def single_counter_shard(settings):
+    """Counter increments pick a random shard; pin it so the SQL is stable."""
+    settings.COUNTER_SHARDS = 1
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Record the cold path: no cached payloads or throttle buckets."""
+    cache.clear()
+    car_detail_cache.clear_local()
+    home_feed_cache.clear_local()
+    yield
+    cache.clear()
+    car_detail_cache.clear_local()
+    home_feed_cache.clear_local()
+
+
+@pytest.mark.django_db
+class TestCarQuerySnapshots:
+    """Each endpoint's SQL and plans should match its reviewed snapshot."""
+
+    @pytest.mark.parametrize("name, method, url, user, body", ENDPOINTS, ids=[e[0] for e in ENDPOINTS])
+    def test_endpoint_queries(
+        self,
+        api_client: APIClient,
+        seeded_catalog: SeededCatalog,
+        query_snapshot,
+        name: str,
+        method: str,
+        url: Url,
+        user: str | None,
+        body: Callable[[SeededCatalog], dict[str, Any]] | None,
+    ):
+        """Requests should run exactly the snapshotted statements with the snapshotted plans."""
+        if user == "staff":
+            api_client.force_authenticate(create_user(email="staff@example.com", is_staff=True))
+        elif user is not None:
+            api_client.force_authenticate(getattr(seeded_catalog, user))
+        path = url(seeded_catalog)
+        data = body(seeded_catalog) if body else None
+
+        with query_snapshot(name, f"{method.upper()} {path.split('?')[0]}"):
+            response = getattr(api_client, method)(path, data, format="json")
+            if response.streaming:
+                b"".join(response.streaming_content)  # Streamed exports query as the body is read
+
+        assert response.status_code < 300, response.content
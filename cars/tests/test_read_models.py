@@ -0,0 +1,68 @@
+"""Tests for the compact catalog read model."""
+from __future__ import annotations
+
+import pytest
+from rest_framework.test import APIClient
+
+from cars.models import Car
+from cars.read_models import car_detail_rows, car_list_rows
+from cars.tests.factories import create_brand, create_car_image, create_cars
+
+
+@pytest.mark.django_db
+class TestCarRows:
+    """Tests for loading list and detail rows."""
+
+    def test_list_rows_share_brands_and_skip_description(self):
+        """List rows should keep queryset order, share one BrandRow per brand and carry no description."""
+        brand = create_brand()
+        create_cars(3, brand=brand)
+
+        rows = car_list_rows(Car.objects.order_by("model"))
+
+        assert [row.model for row in rows] == ["Car 0", "Car 1", "Car 2"]
+        assert rows[0].brand is rows[2].brand
+        assert not hasattr(rows[0], "description")
+        assert not hasattr(rows[0], "__dict__")
+
+    def test_primary_image_falls_back_to_first(self):
+        """primary_image should be the primary image, else the first by sort_order, else None."""
+        with_primary, without_primary, bare = create_cars(3, brand=create_brand())
+        create_car_image(car=with_primary, image_url="https://example.com/side.jpg", sort_order=0)
+        create_car_image(car=with_primary, image_url="https://example.com/front.jpg", is_primary=True, sort_order=1)
+        create_car_image(car=without_primary, image_url="https://example.com/b.jpg", sort_order=2)
+        create_car_image(car=without_primary, image_url="https://example.com/a.jpg", sort_order=1)
+
+        rows = {row.id: row.primary_image for row in car_list_rows(Car.objects.all())}
+
+        assert rows == {
+            with_primary.pk: "https://example.com/front.jpg",
+            without_primary.pk: "https://example.com/a.jpg",
+            bare.pk: None,
+        }
+
+    def test_detail_rows_group_images_in_order(self, django_assert_num_queries):
+        """Detail rows should load all images in one query, in gallery order."""
+        first, second = create_cars(2, brand=create_brand())
+        create_car_image(car=first, alt_text="Rear", sort_order=2)
+        create_car_image(car=first, alt_text="Front", sort_order=1)
+
+        with django_assert_num_queries(2):
+            rows = car_detail_rows(Car.objects.order_by("model"))
+
+        assert [image.alt_text for image in rows[0].images] == ["Front", "Rear"]
+        assert rows[1].images == []
+
+
+@pytest.mark.django_db
+def test_car_list_queries_do_not_grow_with_page(api_client: APIClient, django_assert_num_queries):
+    """GET /api/cars/ should run a count and one page query, primary images included, however many cars are listed."""
+    for car in create_cars(20, brand=create_brand()):
+        create_car_image(car=car)
+
+    with django_assert_num_queries(2):
+        response = api_client.get("/api/cars/")
+
+    assert len(response.data["results"]) == 20
+    assert all(car["primary_image"] for car in response.data["results"])
+
@@ -0,0 +1,95 @@
+"""Tests for market reports and their management commands."""
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from cars.models import Car
+from cars.reports import price_indices
+from cars.tests.factories import create_brand, create_car
+
+
+@pytest.mark.django_db
+class TestPriceIndices:
+    """Tests for brand- and decade-level price indices."""
+
+    def test_price_indices_by_brand(self):
+        """Each brand's first period should be the index base (100)."""
+        ferrari = create_brand(name="Ferrari")
+        porsche = create_brand(name="Porsche")
+        create_car(brand=ferrari, price="100.00")
+        create_car(brand=ferrari, price="300.00")
+        create_car(brand=porsche, price="50.00")
+
+        rows = price_indices(by="brand", period="year")
+
+        assert [(r["group"], r["average_price"], r["cars"], r["index"]) for r in rows] == [
+            ("Ferrari", Decimal("200.00"), 2, Decimal("100.00")),
+            ("Porsche", Decimal("50.00"), 1, Decimal("100.00")),
+        ]
+
+    def test_price_indices_by_decade(self):
+        """Cars should be grouped by the decade of their model year."""
+        brand = create_brand()
+        create_car(brand=brand, year=1962, price="100.00")
+        create_car(brand=brand, year=1968, price="200.00")
+        create_car(brand=brand, year=1973, price="400.00")
+
+        rows = price_indices(by="decade", period="year")
+
+        assert [(r["group"], r["average_price"]) for r in rows] == [
+            (1960, Decimal("150.00")),
+            (1970, Decimal("400.00")),
+        ]
+
+    def test_price_indices_count_each_car_once(self):
+        """A car repriced within a period should count once, at its last price in that period."""
+        brand = create_brand()
+        repriced = Car.objects.get(pk=create_car(brand=brand, price="100.00").pk)
+        create_car(brand=brand, price="300.00")
+        for price in ("110.00", "120.00", "100.00"):
+            repriced.price = Decimal(price)
+            repriced.save()
+
+        rows = price_indices(by="brand", period="year")
+
+        assert [(r["average_price"], r["cars"]) for r in rows] == [(Decimal("200.00"), 2)]
+
+    def test_price_change_recorded_against_history_when_loaded_price_unknown(self):
+        """Saving a car whose price was deferred should compare with the last recorded price, not log a fake change."""
+        car = create_car(price="100.00")
+        deferred = Car.objects.defer("price").get(pk=car.pk)
+        deferred.price = Decimal("100.00")
+        deferred.save()
+        deferred = Car.objects.defer("price").get(pk=car.pk)
+        deferred.price = Decimal("120.00")
+        deferred.save()
+
+        assert list(car.price_history.order_by("id").values_list("old_price", "price")) == [
+            (None, Decimal("100.00")),
+            (Decimal("100.00"), Decimal("120.00")),
+        ]
+
+    def test_price_indices_rejects_unknown_grouping(self):
+        """Unknown groupings should raise ValueError."""
+        with pytest.raises(ValueError):
+            price_indices(by="colour")
+
+    def test_price_indices_command_json(self):
+        """The price_indices command should emit JSON rows."""
+        car = create_car(price="100.00")
+        car = Car.objects.get(pk=car.pk)
+        car.price = Decimal("150.00")
+        car.save()
+        out = StringIO()
+
+        call_command("price_indices", "--period", "year", "--json", stdout=out)
+
+        rows = json.loads(out.getvalue())
+        assert len(rows) == 1
+        assert rows[0]["cars"] == 1
+        assert rows[0]["average_price"] == "150.00"
@@ -0,0 +1,174 @@
+"""Tests for the sitemap and product feed shards."""
+from __future__ import annotations
+
+import gzip
+import re
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from cars import seo
+from cars.models import Brand, Car, CarImage
+from cars.tests.factories import create_brand, create_car, create_car_image, create_cars
+
+
+@pytest.fixture
+def seo_root(settings, tmp_path):
+    settings.SEO_ROOT = tmp_path
+    settings.SITE_URL = "https://cars.example.com"
+    return tmp_path
+
+
+def urls(root, number: int) -> list[str]:
+    with gzip.open(root / f"sitemap-{number:05d}.xml.gz", "rt") as handle:
+        return re.findall(r"<loc>(.*?)</loc>", handle.read())
+
+
+def feed(root, number: int) -> str:
+    with gzip.open(root / f"products-{number:05d}.xml.gz", "rt") as handle:
+        return handle.read()
+
+
+def settle():
+    """Backdate every row so only changes made after this count for the next run."""
+    past = timezone.now() - timedelta(days=1)
+    for model in (Brand, Car, CarImage):
+        model.objects.update(updated_at=past)
+
+
+@pytest.mark.django_db
+class TestSeoGenerator:
+    """Tests for building and refreshing the shards."""
+
+    def test_full_build_writes_sitemap_feed_and_index(self, seo_root):
+        """A full build should list active cars in both files and index the sitemap shards."""
+        car = create_car(brand=create_brand(name="Lancia"), model="Aurelia", year=1954, price="180000.00")
+        create_car_image(car=car, image_url="https://example.com/aurelia.jpg", is_primary=True)
+        create_car(brand=car.brand, model="Flaminia", status=Car.Status.DRAFT)
+
+        summary = seo.SeoGenerator().generate(full=True)
+
+        assert summary == {"full": True, "shards": 1, "rewritten": 1, "urls": 1}
+        assert urls(seo_root, 1) == [f"https://cars.example.com/car/{car.pk}"]
+        products = feed(seo_root, 1)
+        assert "<g:title>1954 Lancia Aurelia</g:title>" in products
+        assert "<g:price>180000.00 USD</g:price>" in products
+        assert "<g:image_link>https://example.com/aurelia.jpg</g:image_link>" in products
+        index = (seo_root / "sitemap.xml").read_text()
+        assert "/static/seo/sitemap-00001.xml.gz</loc>" in index
+
+    def test_shards_split_at_the_limit(self, seo_root, monkeypatch):
+        """Shards should hold at most SITEMAP_LIMIT URLs each."""
+        monkeypatch.setattr(seo, "SITEMAP_LIMIT", 2)
+        create_cars(5)
+
+        summary = seo.SeoGenerator().generate(full=True)
+
+        assert summary["shards"] == 3
+        assert [len(urls(seo_root, number)) for number in (1, 2, 3)] == [2, 2, 1]
+        assert len((seo_root / "sitemap.xml").read_text().split("<sitemap>")) == 4
+
+    def test_incremental_run_rewrites_only_changed_shards(self, seo_root, monkeypatch):
+        """An incremental run should rewrite just the shard holding the changed car."""
+        monkeypatch.setattr(seo, "SITEMAP_LIMIT", 2)
+        create_cars(5, brand=create_brand())
+        seo.SeoGenerator().generate(full=True)
+        settle()
+        first = Car.objects.order_by("created_at", "id").first()
+        first.status = Car.Status.SOLD
+        first.save()
+
+        summary = seo.SeoGenerator().generate()
+
+        assert summary == {"full": False, "shards": 3, "rewritten": 1, "urls": 4}
+        assert f"https://cars.example.com/car/{first.pk}" not in urls(seo_root, 1)
+
+    def test_new_cars_spill_into_new_shards(self, seo_root, monkeypatch):
+        """New cars should fill the last shard and open new ones past the limit."""
+        monkeypatch.setattr(seo, "SITEMAP_LIMIT", 2)
+        brand = create_brand()
+        create_cars(3, brand=brand)
+        seo.SeoGenerator().generate(full=True)
+        settle()
+        create_cars(2, brand=brand, model=lambda i: f"Late {i}")
+
+        summary = seo.SeoGenerator().generate()
+
+        assert summary == {"full": False, "shards": 3, "rewritten": 2, "urls": 5}
+        assert len(urls(seo_root, 3)) == 1
+
+    def test_brand_changes_refresh_their_cars(self, seo_root, monkeypatch):
+        """Renaming a brand should rewrite the shards that list its cars."""
+        monkeypatch.setattr(seo, "SITEMAP_LIMIT", 2)
+        lancia = create_brand(name="Lancia")
+        create_cars(2, brand=lancia)
+        create_cars(2, brand=create_brand(name="Jaguar"))
+        seo.SeoGenerator().generate(full=True)
+        settle()
+        lancia.name = "Lancia Automobiles"
+        lancia.save()
+
+        summary = seo.SeoGenerator().generate()
+
+        assert summary["rewritten"] == 1
+        assert "<g:brand>Lancia Automobiles</g:brand>" in feed(seo_root, 1)
+
+    def test_overflowing_shard_triggers_rebuild(self, seo_root, monkeypatch):
+        """A closed shard that grows past the limit should fall back to a full rebuild."""
+        monkeypatch.setattr(seo, "SITEMAP_LIMIT", 2)
+        brand = create_brand()
+        create_cars(1, brand=brand, status=Car.Status.DRAFT)
+        create_cars(3, brand=brand, model=lambda i: f"Active {i}")
+        seo.SeoGenerator().generate(full=True)
+        settle()
+        Car.objects.filter(status=Car.Status.DRAFT).update(status=Car.Status.ACTIVE, updated_at=timezone.now())
+
+        summary = seo.SeoGenerator().generate()
+
+        assert summary == {"full": True, "shards": 2, "rewritten": 2, "urls": 4}
+
+    def test_command(self, seo_root):
+        """generate_seo_files should build the shards and report them."""
+        create_car()
+
+        call_command("generate_seo_files", "--full")
+
+        assert (seo_root / "state.json").exists()
+        assert len(urls(seo_root, 1)) == 1
+
+
+@pytest.mark.django_db
+class TestSeoFileView:
+    """Tests for serving the shards."""
+
+    def test_serves_rewritten_files(self, seo_root, client, settings):
+        """GET /static/seo/... should serve the current file, including ones written after startup."""
+        response = client.get(f"{settings.SEO_URL}sitemap.xml")
+        assert response.status_code == 404
+
+        create_car()
+        seo.SeoGenerator().generate(full=True)
+        response = client.get(f"{settings.SEO_URL}sitemap-00001.xml.gz")
+
+        assert response.status_code == 200
+        assert response["Cache-Control"] == f"max-age={settings.SEO_MAX_AGE}, public"
+        assert b"".join(response.streaming_content) == (seo_root / "sitemap-00001.xml.gz").read_bytes()
+
+    def test_serves_only_generated_files(self, seo_root, client, settings):
+        """GET /static/seo/... should 404 for anything but the index and shards, such as the state file."""
+        create_car()
+        seo.SeoGenerator().generate(full=True)
+
+        assert client.get(f"{settings.SEO_URL}sitemap.xml").status_code == 200
+        for name in ["state.json", ".sitemap.xml.tmp", "../seo/sitemap.xml", "sitemap-1.xml.gz"]:
+            assert client.get(f"{settings.SEO_URL}{name}").status_code == 404, name
+
+    def test_served_by_api_profile(self, seo_root, client, settings):
+        """The API-only URLconf should serve the shards too."""
+        settings.ROOT_URLCONF = "config.urls_api"
+        create_car()
+        seo.SeoGenerator().generate(full=True)
+
+        assert client.get(f"{settings.SEO_URL}products-00001.xml.gz").status_code == 200
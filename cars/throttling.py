@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import hashlib
+import time
+
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class SlidingWindowThrottle(SimpleRateThrottle):
+    """
+    Sliding-window throttle kept in the shared cache.
+
+    Requests are counted per fixed window of `duration` with `cache.incr`,
+    which is atomic on every shared backend, so concurrent workers can't
+    both take the last slot (the stock SimpleRateThrottle does an unguarded
+    read-modify-write of a history list). A request is allowed while the
+    current count plus the previous window's count, weighted by how much of
+    that window still overlaps the last `duration`, stays within
+    `num_requests`. Unlike a plain fixed window there is no boundary to
+    burst across, and nothing on the request path waits for a lock.
+    """
+
+    def allow_request(self, request, view) -> bool:
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = time.time()
+        window, offset = divmod(self.now, self.duration)
+        self.elapsed = offset / self.duration
+        current_key = f"{self.key}:{int(window)}"
+        # Each counter is read for its own window and weighed during the next one.
+        self.cache.add(current_key, 0, timeout=self.duration * 2)
+        try:
+            count = self.cache.incr(current_key)
+        except ValueError:  # Evicted between add and incr
+            self.cache.set(current_key, 1, timeout=self.duration * 2)
+            count = 1
+        self.previous = self.cache.get(f"{self.key}:{int(window) - 1}", 0)
+        self.count = count - 1
+        if self.previous * (self.duration - offset) / self.duration + count <= self.num_requests:
+            return True
+        # Rejected requests don't use up the limit
+        try:
+            self.cache.decr(current_key)
+        except ValueError:
+            pass
+        return False
+
+    def wait(self) -> float:
+        """Seconds until one more request fits in the window."""
+        spare = self.num_requests - 1 - self.count
+        if spare >= 0:
+            # Room in this window once enough of the previous one has slid out
+            return max(1 - spare / self.previous - self.elapsed, 0) * self.duration
+        # This window is full: wait for the next, then for this one's weight to fall
+        return (1 - self.elapsed + max(1 - (self.num_requests - 1) / self.count, 0)) * self.duration
+
+
+class InquiryIPRateThrottle(SlidingWindowThrottle):
+    """Limits inquiry submissions per client IP."""
+
+    scope = "inquiry_ip"
+
+    def get_cache_key(self, request, view) -> str | None:
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+
+class InquiryEmailRateThrottle(SlidingWindowThrottle):
+    """Limits inquiry submissions per collector email."""
+
+    scope = "inquiry_email"
+
+    def get_cache_key(self, request, view) -> str | None:
+        email = str(request.data.get("collector_email", "")).strip().lower()
+        if not email:
+            return None
+        ident = hashlib.sha256(email.encode()).hexdigest()
+        return self.cache_format % {"scope": self.scope, "ident": ident}
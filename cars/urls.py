@@ -5,9 +5,19 @@ from django.urls import path
 from .views import (
     BrandDetailView,
     BrandListView,
+    CarBatchView,
+    CarBulkActionView,
     CarDetailView,
+    CarGalleryOrderView,
+    CarHistogramView,
     CarListView,
-    InquiryCreateView,
+    CarPriceHistoryView,
+    HomeFeedView,
+    InquiryDetailView,
+    InquiryExportView,
+    InquiryListCreateView,
+    SavedSearchDetailView,
+    SavedSearchListCreateView,
 )
 
 app_name = "cars"
@@ -19,8 +29,20 @@ urlpatterns = [
     
     # Cars
     path("", CarListView.as_view(), name="car-list"),
+    path("home/", HomeFeedView.as_view(), name="home-feed"),
+    path("batch/", CarBatchView.as_view(), name="car-batch"),
+    path("bulk/", CarBulkActionView.as_view(), name="car-bulk-action"),
+    path("stats/histogram/", CarHistogramView.as_view(), name="car-histogram"),
     path("<uuid:pk>/", CarDetailView.as_view(), name="car-detail"),
+    path("<uuid:pk>/images/order/", CarGalleryOrderView.as_view(), name="car-gallery-order"),
+    path("<uuid:pk>/price-history/", CarPriceHistoryView.as_view(), name="car-price-history"),
     
     # Inquiries
-    path("inquiries/", InquiryCreateView.as_view(), name="inquiry-create"),
+    path("inquiries/", InquiryListCreateView.as_view(), name="inquiry-list"),
+    path("inquiries/export/", InquiryExportView.as_view(), name="inquiry-export"),
+    path("inquiries/<uuid:pk>/", InquiryDetailView.as_view(), name="inquiry-detail"),
+
+    # Saved searches
+    path("saved-searches/", SavedSearchListCreateView.as_view(), name="saved-search-list"),
+    path("saved-searches/<uuid:pk>/", SavedSearchDetailView.as_view(), name="saved-search-detail"),
 ]
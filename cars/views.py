@@ -1,22 +1,84 @@
 from __future__ import annotations
 
+import hashlib
+import uuid
+from datetime import datetime, time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max, Min, OuterRef, Q, Subquery
+from django.http import Http404, HttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework import generics, status
-from rest_framework.permissions import AllowAny
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
-from .models import Brand, Car, Inquiry
+from . import counters, geo, histograms
+from .bulk import bulk_update_cars
+from .cache import CacheBusy, car_detail_cache
+from .exports import CSVRenderer, inquiry_csv_response
+from .feeds import get_home_feed
+from .gallery import reorder_gallery
+from .models import Brand, Car, CarImage, CarPriceHistory, Inquiry, SavedSearch
+from .pagination import InquiryCursorPagination
+from .read_models import CarListPage, car_detail_rows
 from .serializers import (
     BrandSerializer,
+    BrandStatsSerializer,
+    CarBatchRequestSerializer,
+    CarBulkActionSerializer,
     CarDetailSerializer,
+    CarImageSerializer,
     CarListSerializer,
+    CarPriceHistorySerializer,
+    GalleryOrderSerializer,
     InquiryCreateSerializer,
+    InquiryInboxSerializer,
+    SavedSearchSerializer,
 )
+from .throttling import InquiryEmailRateThrottle, InquiryIPRateThrottle
+
+INQUIRY_PENDING = "pending"
+DEFAULT_RADIUS_KM = 50.0
+MAX_RADIUS_KM = 1000.0
+
+
+def brand_stats_queryset():
+    """
+    Brands annotated with active-listing stats, in one grouped query. The
+    representative image is the primary image of the brand's featured,
+    then newest, active car.
+    """
+    active = Q(cars__status=Car.Status.ACTIVE)
+    image = (
+        CarImage.objects.filter(car__brand=OuterRef("pk"), car__status=Car.Status.ACTIVE)
+        .order_by("-car__is_featured", "-car__created_at", "-is_primary", "sort_order")
+        .values("image_url")[:1]
+    )
+    return Brand.objects.annotate(
+        active_count=Count("cars", filter=active),
+        min_price=Min("cars__price", filter=active),
+        max_price=Max("cars__price", filter=active),
+        year_min=Min("cars__year", filter=active),
+        year_max=Max("cars__year", filter=active),
+        representative_image=Subquery(image),
+    )
 
 
 class BrandListView(generics.ListAPIView):
     """
     GET /api/cars/brands/
     List all car brands.
+
+    Query parameters:
+    - stats: Include active-car count, price range, year span and a
+      representative image per brand (true/false)
     """
 
     queryset = Brand.objects.all()
@@ -24,6 +86,15 @@ class BrandListView(generics.ListAPIView):
     permission_classes = [AllowAny]
     pagination_class = None  # Return all brands without pagination
 
+    def include_stats(self) -> bool:
+        return self.request.query_params.get("stats", "").lower() in ("true", "1", "yes")
+
+    def get_queryset(self):
+        return brand_stats_queryset() if self.include_stats() else super().get_queryset()
+
+    def get_serializer_class(self):
+        return BrandStatsSerializer if self.include_stats() else BrandSerializer
+
 
 class BrandDetailView(generics.RetrieveAPIView):
     """
@@ -36,6 +107,61 @@ class BrandDetailView(generics.RetrieveAPIView):
     permission_classes = [AllowAny]
 
 
+def parse_near(value: str) -> tuple[float, float]:
+    """Parse a "lat,lng" query parameter, raising a 400 on bad input."""
+    try:
+        latitude, longitude = (float(part) for part in value.split(","))
+    except ValueError:
+        raise ValidationError({"near": 'Enter coordinates as "lat,lng".'}) from None
+    if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+        raise ValidationError({"near": "Coordinates are out of range."})
+    return latitude, longitude
+
+
+def parse_radius(value: str | None) -> float:
+    if value is None:
+        return DEFAULT_RADIUS_KM
+    try:
+        radius_km = float(value)
+    except ValueError:
+        raise ValidationError({"radius_km": "Enter a number."}) from None
+    if not 0 < radius_km <= MAX_RADIUS_KM:
+        raise ValidationError({"radius_km": f"Must be greater than 0 and at most {MAX_RADIUS_KM:g}."})
+    return radius_km
+
+
+def parse_uuid(name: str, value: str, label: str) -> uuid.UUID:
+    """Parse an ID query parameter, raising a 400 on bad input."""
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        raise ValidationError({name: f"Enter a valid {label} ID."}) from None
+
+
+def listing_filters(params) -> dict[str, Any]:
+    """The brand and featured filters shared by the car list and its histograms, as filter() kwargs."""
+    filters: dict[str, Any] = {}
+    brand_id = params.get("brand")
+    if brand_id:
+        filters["brand_id"] = parse_uuid("brand", brand_id, "brand")
+    featured = params.get("featured")
+    if featured is not None:
+        filters["is_featured"] = featured.lower() in ("true", "1", "yes")
+    return filters
+
+
+def parse_bins(value: str | None) -> int:
+    if value is None:
+        return histograms.DEFAULT_BINS
+    try:
+        bins = int(value)
+    except ValueError:
+        raise ValidationError({"bins": "Enter a whole number."}) from None
+    if not 1 <= bins <= histograms.MAX_BINS:
+        raise ValidationError({"bins": f"Must be between 1 and {histograms.MAX_BINS}."})
+    return bins
+
+
 class CarListView(generics.ListAPIView):
     """
     GET /api/cars/
@@ -44,56 +170,428 @@ class CarListView(generics.ListAPIView):
     Query parameters:
     - brand: Filter by brand ID
     - featured: Filter by featured status (true/false)
+    - country / region: Filter by ISO country (US) or region (US-CA) code
+    - near: "lat,lng"; only cars within radius_km (default 50), nearest first
+    - radius_km: Search radius for near, up to 1000
     """
 
     serializer_class = CarListSerializer
     permission_classes = [AllowAny]
 
     def get_queryset(self):
-        queryset = Car.objects.filter(status=Car.Status.ACTIVE).select_related("brand").prefetch_related("images")
-        
-        # Filter by brand
-        brand_id = self.request.query_params.get("brand")
-        if brand_id:
-            queryset = queryset.filter(brand_id=brand_id)
-        
-        # Filter by featured
-        featured = self.request.query_params.get("featured")
-        if featured is not None:
-            is_featured = featured.lower() in ("true", "1", "yes")
-            queryset = queryset.filter(is_featured=is_featured)
+        # Filter by brand and featured
+        queryset = Car.objects.filter(status=Car.Status.ACTIVE, **listing_filters(self.request.query_params))
+
+        country = self.request.query_params.get("country")
+        if country:
+            queryset = queryset.filter(country=country.upper())
+        region = self.request.query_params.get("region")
+        if region:
+            queryset = queryset.filter(region=region.upper())
+
+        near = self.request.query_params.get("near")
+        if near:
+            latitude, longitude = parse_near(near)
+            radius_km = parse_radius(self.request.query_params.get("radius_km"))
+            queryset = geo.within_radius(queryset, latitude, longitude, radius_km)
         
         return queryset
 
+    def paginate_queryset(self, queryset):
+        # Pages are read as compact rows (see cars.read_models), not model instances
+        return super().paginate_queryset(CarListPage(queryset))
+
+
+class CarHistogramView(APIView):
+    """
+    GET /api/cars/stats/histogram/
+    Distribution of active cars over price or year, for the browse page
+    slider. Counted in SQL and cached per filter combination (see
+    cars.histograms).
+
+    Query parameters:
+    - field: price (default) or year
+    - bins: Number of equal-width buckets, 1-100 (default 20)
+    - brand / featured: Same filters as the car list
+    """
+
+    permission_classes = [AllowAny]
+
+    def get(self, request, *args, **kwargs):
+        params = request.query_params
+        field = params.get("field", "price")
+        if field not in histograms.FIELDS:
+            raise ValidationError({"field": f"Choose one of: {', '.join(histograms.FIELDS)}."})
+        bins = parse_bins(params.get("bins"))
+        filters = listing_filters(params)
+        queryset = Car.objects.filter(status=Car.Status.ACTIVE, **filters)
+        return Response(histograms.get_histogram(queryset, field, bins, filters))
+
+
+def cache_busy_response() -> Response:
+    """503 for a cached payload that another worker is still building."""
+    return Response(
+        {"detail": "This resource is being rebuilt; try again shortly."},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "1"},
+    )
+
+
+class HomeFeedView(APIView):
+    """
+    GET /api/cars/home/
+    Featured cars, newest arrivals and brands for the homepage.
+
+    Served from a prerendered snapshot in at most one cache read; the
+    outbox rebuilds the snapshot after a Car, CarImage or Brand changes.
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request, *args, **kwargs):
+        try:
+            content = get_home_feed()
+        except CacheBusy:
+            return cache_busy_response()
+        return HttpResponse(content, content_type="application/json")
+
 
 class CarDetailView(generics.RetrieveAPIView):
     """
     GET /api/cars/{id}/
     Get a specific car by ID.
+
+    Served from the two-tier car detail cache (see cars.cache). Each view
+    is counted in a sharded counter (see cars.counters); the view_count in
+    the payload is the last folded total. Returns 503 if another worker is
+    still building a detail that has no cached copy yet.
     """
 
-    queryset = Car.objects.filter(status=Car.Status.ACTIVE).select_related("brand").prefetch_related("images")
+    queryset = Car.objects.filter(status=Car.Status.ACTIVE)
     serializer_class = CarDetailSerializer
     permission_classes = [AllowAny]
 
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            content = car_detail_cache.get(self.kwargs["pk"])
+        except CacheBusy:
+            return cache_busy_response()
+        if content is None:
+            raise Http404
+        counters.increment(self.kwargs["pk"], "views")
+        return HttpResponse(content, content_type="application/json")
+
 
-class InquiryCreateView(generics.CreateAPIView):
+class CarBatchView(APIView):
     """
-    POST /api/cars/inquiries/
-    Create a new inquiry (contact form submission).
+    GET /api/cars/batch/?ids=<id>,<id>,...
+    POST /api/cars/batch/ {"ids": [...]}
+    Get full details for up to 100 active cars in one request.
+
+    Results keep the requested order; ids that don't match an active car
+    are listed under "missing".
     """
 
-    queryset = Inquiry.objects.all()
-    serializer_class = InquiryCreateSerializer
     permission_classes = [AllowAny]
 
-    def create(self, request, *args, **kwargs):
-        serializer = self.get_serializer(data=request.data)
+    def get(self, request, *args, **kwargs):
+        raw = request.query_params.get("ids", "")
+        ids = [value.strip() for value in raw.split(",") if value.strip()]
+        return self.batch_response(ids)
+
+    def post(self, request, *args, **kwargs):
+        if not isinstance(request.data, dict):
+            raise ValidationError({"non_field_errors": ['Expected an object like {"ids": [...]}.']})
+        return self.batch_response(request.data.get("ids"))
+
+    def batch_response(self, ids) -> Response:
+        serializer = CarBatchRequestSerializer(data={"ids": ids})
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+
+        cars = {row.id: row for row in car_detail_rows(Car.objects.filter(status=Car.Status.ACTIVE, pk__in=ids))}
+        found = [cars[pk] for pk in ids if pk in cars]
+        return Response(
+            {
+                "results": CarDetailSerializer(found, many=True).data,
+                "missing": [str(pk) for pk in ids if pk not in cars],
+            }
+        )
+
+
+class CarBulkActionView(APIView):
+    """
+    POST /api/cars/bulk/ {"ids": [...], "action": "activate|archive|feature|unfeature"}
+    Change status or the featured flag on many cars at once (staff only).
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, *args, **kwargs):
+        serializer = CarBulkActionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        action = serializer.validated_data["action"]
+        changed = bulk_update_cars(serializer.validated_data["ids"], action)
+        return Response({"action": action, "updated": changed})
+
+
+class CarGalleryOrderView(APIView):
+    """
+    POST /api/cars/{id}/images/order/ {"images": [...], "primary": "<image id>"}
+    Reorder a car's gallery and optionally change its primary image, in
+    one transaction (see cars.gallery). "images" lists every image of the
+    car in the new order. Staff can reorder any car, sellers their own.
+    Returns the gallery in its new order.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        cars = Car.objects.all() if request.user.is_staff else Car.objects.filter(seller=request.user)
+        car = get_object_or_404(cars, pk=self.kwargs["pk"])
+        serializer = GalleryOrderSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
+        try:
+            reorder_gallery(car, serializer.validated_data["images"], serializer.validated_data.get("primary"))
+        except ValueError as error:
+            raise ValidationError({"images": [str(error)]}) from None
+        return Response(CarImageSerializer(car.images.all(), many=True).data)
+
+
+class CarPriceHistoryView(generics.ListAPIView):
+    """
+    GET /api/cars/{id}/price-history/
+    List price changes for an active car, newest first.
+    """
+
+    serializer_class = CarPriceHistorySerializer
+    permission_classes = [AllowAny]
+
+    def get_queryset(self):
+        car = get_object_or_404(Car.objects.filter(status=Car.Status.ACTIVE), pk=self.kwargs["pk"])
+        return CarPriceHistory.objects.filter(car=car).order_by("-changed_at")
+
+
+def inbox_queryset(user):
+    """Inquiries visible to a user: all for staff, otherwise those on cars they sell."""
+    queryset = Inquiry.objects.select_related("car__brand")
+    if user.is_staff:
+        return queryset
+    return queryset.filter(car__seller=user)
+
+
+def inbox_filters(params) -> dict[str, Any]:
+    """The car, brand and created_at filters shared by the inbox and its export, as filter() kwargs."""
+    filters: dict[str, Any] = {}
+    car_id = params.get("car")
+    if car_id:
+        filters["car_id"] = parse_uuid("car", car_id, "car")
+    brand_id = params.get("brand")
+    if brand_id:
+        filters["car__brand_id"] = parse_uuid("brand", brand_id, "brand")
+    created_after = params.get("created_after")
+    if created_after:
+        filters["created_at__gte"] = parse_date_bound("created_after", created_after)
+    created_before = params.get("created_before")
+    if created_before:
+        filters["created_at__lt"] = parse_date_bound("created_before", created_before)
+    return filters
+
+
+def parse_date_bound(name: str, value: str) -> datetime:
+    """Parse an ISO date or datetime query parameter, raising a 400 on bad input."""
+    parsed = parse_datetime(value)
+    if parsed is None:
+        day = parse_date(value)
+        if day is None:
+            raise ValidationError({name: "Enter a valid ISO date or datetime."})
+        parsed = datetime.combine(day, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+class InquiryListCreateView(generics.ListCreateAPIView):
+    """
+    GET /api/cars/inquiries/
+    Seller inbox (authenticated). Staff see every inquiry; other users see
+    inquiries for cars they sell. Keyset-paginated, newest first.
+
+    Query parameters:
+    - car: Filter by car ID
+    - brand: Filter by brand ID
+    - created_after / created_before: ISO date or datetime bounds
+    - is_read: Filter by read state (true/false)
+    - q: Search message text (trigram-indexed on PostgreSQL)
+
+    POST /api/cars/inquiries/
+    Create a new inquiry (contact form submission). Public.
+
+    Submissions are rate limited per IP and per collector email. An
+    identical (car, email, message) resubmitted within
+    INQUIRY_DEDUP_SECONDS returns 200 with the original inquiry instead
+    of creating a duplicate, without counting against the rate limits. A
+    resubmission that arrives while the original is still being saved is
+    rate limited like a new one and gets 409 straight away. Rejected
+    requests never touch the database.
+    """
+
+    pagination_class = InquiryCursorPagination
+
+    def get_authenticators(self):
+        # Public form: skip authentication so throttled requests stay off the DB
+        if self.request.method == "POST":
+            return []
+        return super().get_authenticators()
+
+    def get_permissions(self):
+        if self.request.method == "POST":
+            return [AllowAny()]
+        return [IsAuthenticated()]
+
+    def get_throttles(self):
+        if self.request.method == "POST":
+            return [InquiryIPRateThrottle(), InquiryEmailRateThrottle()]
+        return super().get_throttles()
+
+    def check_throttles(self, request):
+        # Duplicates of a saved inquiry are answered from the dedup cache in
+        # create(); don't charge them. Duplicates of one still pending are.
+        if request.method == "POST" and cache.get(self.get_dedup_key(request.data)) not in (None, INQUIRY_PENDING):
+            return
+        super().check_throttles(request)
+
+    def get_serializer_class(self):
+        if self.request.method == "POST":
+            return InquiryCreateSerializer
+        return InquiryInboxSerializer
+
+    def get_queryset(self):
+        if self.request.method == "POST":
+            return Inquiry.objects.all()
+
+        params = self.request.query_params
+        queryset = inbox_queryset(self.request.user).filter(**inbox_filters(params))
+
+        is_read = params.get("is_read")
+        if is_read is not None:
+            queryset = queryset.filter(read_at__isnull=is_read.lower() not in ("true", "1", "yes"))
+
+        search = params.get("q", "").strip()
+        if search:
+            queryset = queryset.filter(message__icontains=search)
+
+        return queryset
+
+    def perform_create(self, serializer):
+        inquiry = serializer.save()
+        counters.increment(inquiry.car_id, "inquiries")
+
+    def create(self, request, *args, **kwargs):
+        dedup_key = self.get_dedup_key(request.data)
+        while not cache.add(dedup_key, INQUIRY_PENDING, timeout=settings.INQUIRY_DEDUP_SECONDS):
+            previous = cache.get(dedup_key)
+            if previous is None:
+                continue  # The original failed and released the key; submit this one instead
+            if previous == INQUIRY_PENDING:
+                return Response({"message": "Inquiry submission in progress"}, status=status.HTTP_409_CONFLICT)
+            return Response(
+                {"message": "Inquiry already submitted", "data": previous},
+                status=status.HTTP_200_OK,
+            )
+
+        try:
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            self.perform_create(serializer)
+        except Exception:
+            cache.delete(dedup_key)
+            raise
+
+        cache.set(dedup_key, serializer.data, timeout=settings.INQUIRY_DEDUP_SECONDS)
         headers = self.get_success_headers(serializer.data)
         return Response(
             {"message": "Inquiry submitted successfully", "data": serializer.data},
             status=status.HTTP_201_CREATED,
             headers=headers,
         )
+
+    @staticmethod
+    def get_dedup_key(data) -> str:
+        """Content hash of the normalized (car, collector_email, message) triple."""
+        parts = (
+            str(data.get("car", "")).strip(),
+            str(data.get("collector_email", "")).strip().lower(),
+            str(data.get("message", "")).strip(),
+        )
+        digest = hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+        return f"inquiry_dedup_{digest}"
+
+
+class InquiryExportView(APIView):
+    """
+    GET /api/cars/inquiries/export/
+    Stream inbox inquiries as CSV, joined with car and brand. Staff export
+    every inquiry; other users export those on cars they sell.
+
+    Query parameters:
+    - car: Filter by car ID
+    - brand: Filter by brand ID
+    - created_after / created_before: ISO date or datetime bounds
+    """
+
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [JSONRenderer, CSVRenderer]  # CSVRenderer so `Accept: text/csv` negotiates
+
+    def get(self, request, *args, **kwargs):
+        queryset = inbox_queryset(request.user).filter(**inbox_filters(request.query_params))
+        return inquiry_csv_response(queryset)
+
+
+class InquiryDetailView(generics.RetrieveUpdateAPIView):
+    """
+    GET /api/cars/inquiries/{id}/
+    PATCH /api/cars/inquiries/{id}/
+    Read an inquiry from the inbox or set its read state ({"is_read": true}).
+    """
+
+    serializer_class = InquiryInboxSerializer
+    permission_classes = [IsAuthenticated]
+    http_method_names = ["get", "patch", "head", "options"]
+
+    def get_queryset(self):
+        return inbox_queryset(self.request.user)
+
+
+class SavedSearchListCreateView(generics.ListCreateAPIView):
+    """
+    GET /api/cars/saved-searches/
+    POST /api/cars/saved-searches/
+    The current user's saved searches. New active cars matching one are
+    emailed to the user by the `send_search_alerts` worker.
+    """
+
+    serializer_class = SavedSearchSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = None
+
+    def get_queryset(self):
+        return SavedSearch.objects.filter(user=self.request.user)
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+
+
+class SavedSearchDetailView(generics.RetrieveUpdateDestroyAPIView):
+    """
+    GET/PATCH/DELETE /api/cars/saved-searches/{id}/
+    Manage one of the current user's saved searches.
+    """
+
+    serializer_class = SavedSearchSerializer
+    permission_classes = [IsAuthenticated]
+    http_method_names = ["get", "patch", "delete", "head", "options"]
+
+    def get_queryset(self):
+        return SavedSearch.objects.filter(user=self.request.user)
@@ -14,6 +14,14 @@ BASE_URL = os.getenv("BASE_URL", "http://localhost:8000")
 # TODO: update this
 ALLOWED_HOSTS = ["*"]
 
+# Runtime profile:
+# - "full": admin, sessions, static files and the complete middleware stack.
+# - "api": JSON API workers only; no admin, sessions, messages, CSRF or
+#   WhiteNoise, and a URLconf without /admin/.
+APP_PROFILE = os.getenv("APP_PROFILE", "full")
+if APP_PROFILE not in ("full", "api"):
+    raise ValueError(f"Unknown APP_PROFILE: {APP_PROFILE}")
+
 # =============================================================================
 # Applications
 # =============================================================================
@@ -26,13 +34,26 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     "corsheaders",
     "rest_framework",
-    "rest_framework_simplejwt",
+    # rest_framework_simplejwt is deliberately not an installed app: it has no
+    # models we use, and loading it at startup imports django.test. JWT auth
+    # is imported on first use through REST_FRAMEWORK below.
     # Local apps
     "shared",
     "accounts",
     "cars",
 ]
 
+# Apps only the full (admin) profile needs
+FULL_PROFILE_APPS = [
+    "django.contrib.admin",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+]
+
+if APP_PROFILE == "api":
+    INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in FULL_PROFILE_APPS]
+
 # Custom User Model
 AUTH_USER_MODEL = "accounts.User"
 
@@ -51,10 +72,38 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Middleware only the full (admin) profile needs. DRF views are CSRF-exempt
+# and authenticate with JWT, so API workers skip sessions, CSRF and messages.
+FULL_PROFILE_MIDDLEWARE = [
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+]
+
+if APP_PROFILE == "api":
+    MIDDLEWARE = [mw for mw in MIDDLEWARE if mw not in FULL_PROFILE_MIDDLEWARE]
+
+# Opt-in request profiling (shared.profiling). When disabled the middleware
+# isn't installed at all. With it enabled, PROFILING_SAMPLE_RATE of requests
+# are profiled, plus any request with a signed X-Profile-Token header
+# (`manage.py profiling_token`).
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_DIR = Path(os.getenv("PROFILING_DIR", str(BASE_DIR / "profiles")))
+PROFILING_MAX_PER_VIEW = int(os.getenv("PROFILING_MAX_PER_VIEW", "50"))
+PROFILING_TOKEN_MAX_AGE = int(os.getenv("PROFILING_TOKEN_MAX_AGE", "3600"))
+
+if PROFILING_ENABLED:
+    # Outermost, so the profile covers the whole middleware stack
+    MIDDLEWARE = ["shared.profiling.ProfilingMiddleware", *MIDDLEWARE]
+
 # =============================================================================
 # URL & Template Configuration
 # =============================================================================
-ROOT_URLCONF = "config.urls"
+ROOT_URLCONF = "config.urls_api" if APP_PROFILE == "api" else "config.urls"
 
 TEMPLATES = [
     {
@@ -72,16 +121,21 @@ TEMPLATES = [
     },
 ]
 
+if APP_PROFILE == "api":
+    TEMPLATES[0]["OPTIONS"]["context_processors"].remove(
+        "django.contrib.messages.context_processors.messages"
+    )
+
 WSGI_APPLICATION = "config.wsgi.application"
 
 # =============================================================================
 # Database
 # =============================================================================
-import dj_database_url
-
 DATABASE_URL = os.getenv("DATABASE_URL")
 
 if DATABASE_URL:
+    import dj_database_url
+
     DATABASES = {
         "default": dj_database_url.config(
             default=DATABASE_URL,
@@ -98,20 +152,57 @@ else:
         }
     }
 
-# Set search_path for per-app Neon schemas.
-# This runs after each connection is established, which works with
-# Neon's connection pooler (PgBouncer) — unlike passing search_path
-# via the connection string's options parameter.
+# In-process connection pool (DB_POOL=true). Each worker keeps warmed
+# connections with search_path already applied and hands them to requests,
+# instead of reconnecting every CONN_MAX_AGE seconds. Django closes the
+# connection after each request, which returns it to the pool.
+DB_POOL = os.getenv("DB_POOL", "false").lower() == "true"
+POOLED_ENGINES = {
+    "django.db.backends.postgresql": "shared.db_backends.postgresql",
+    "django.db.backends.sqlite3": "shared.db_backends.sqlite3",
+}
+
+if DB_POOL:
+    DATABASES["default"].update(
+        {
+            "ENGINE": POOLED_ENGINES[DATABASES["default"]["ENGINE"]],
+            "CONN_MAX_AGE": 0,
+            "CONN_HEALTH_CHECKS": False,
+            "POOL": {
+                "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+                "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+                "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+                "health_check_after": float(os.getenv("DB_POOL_HEALTH_CHECK_AFTER", "30")),
+                "max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", "3600")),
+            },
+        }
+    )
+
+# Per-app Neon schema. The search_path hook is connected in
+# shared.apps.SharedConfig.ready() rather than here, so importing settings
+# has no side effects. Pooled connections apply it once when opened.
 DATABASE_SCHEMA = os.getenv("DATABASE_SCHEMA")
-if DATABASE_SCHEMA and DATABASE_URL:
-    from django.db.backends.signals import connection_created
 
-    def set_search_path(sender, connection, **kwargs):
-        if connection.vendor == "postgresql":
-            with connection.cursor() as cursor:
-                cursor.execute("SET search_path TO %s, public", [DATABASE_SCHEMA])
+# =============================================================================
+# Cache
+# =============================================================================
+# Throttling and deduplication need a cache shared by all workers in
+# production. Without REDIS_URL each process falls back to local memory.
+REDIS_URL = os.getenv("REDIS_URL")
 
-    connection_created.connect(set_search_path)
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
 
 # =============================================================================
 # Password Validation
@@ -147,6 +238,15 @@ STORAGES = {
     },
 }
 
+# Sitemap and product feed shards (cars.seo), regenerated by `generate_seo_files`
+# and served from SEO_URL by cars.seo.seo_file in both profiles. SEO_ROOT stays
+# outside STATIC_ROOT, which WhiteNoise indexes once at startup. SITE_URL is
+# the public origin of the frontend the listing URLs point at.
+SITE_URL = os.getenv("SITE_URL", BASE_URL)
+SEO_ROOT = Path(os.getenv("SEO_ROOT", str(BASE_DIR / "seo")))
+SEO_URL = STATIC_URL + "seo/"
+SEO_MAX_AGE = int(os.getenv("SEO_MAX_AGE", "3600"))
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 APPEND_SLASH = True
@@ -165,8 +265,39 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
+    "DEFAULT_RENDERER_CLASSES": (
+        ["rest_framework.renderers.JSONRenderer"]
+        if APP_PROFILE == "api"
+        else ["rest_framework.renderers.JSONRenderer", "rest_framework.renderers.BrowsableAPIRenderer"]
+    ),
+    "DEFAULT_THROTTLE_RATES": {
+        "inquiry_ip": os.getenv("INQUIRY_IP_RATE", "10/min"),
+        "inquiry_email": os.getenv("INQUIRY_EMAIL_RATE", "5/hour"),
+    },
 }
 
+# Window in which identical inquiries are treated as duplicates
+INQUIRY_DEDUP_SECONDS = int(os.getenv("INQUIRY_DEDUP_SECONDS", "600"))
+
+# Listing event outbox (cars.outbox): after a failure a handler is retried
+# one event at a time, OUTBOX_RETRY_SECONDS later and doubling per failure
+# (at most 5 minutes). An event that fails OUTBOX_MAX_ATTEMPTS times in a
+# row is dead-lettered and skipped.
+OUTBOX_RETRY_SECONDS = float(os.getenv("OUTBOX_RETRY_SECONDS", "1"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "8"))
+
+# Counter rows per car for view and inquiry counts (cars.counters); more
+# shards mean less lock contention on popular cars and more rows to fold.
+COUNTER_SHARDS = int(os.getenv("COUNTER_SHARDS", "8"))
+
+# =============================================================================
+# Email (saved-search alerts)
+# =============================================================================
+EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend")
+EMAIL_HOST = os.getenv("EMAIL_HOST", "localhost")
+EMAIL_PORT = int(os.getenv("EMAIL_PORT", "25"))
+DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "alerts@localhost")
+
 # =============================================================================
 # JWT Configuration
 # =============================================================================
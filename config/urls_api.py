@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import re
+
+from django.conf import settings
+from django.urls import include, path, re_path
+
+from cars.seo import seo_file
+
+urlpatterns = [
+    path("api/accounts/", include("accounts.urls")),
+    path("api/cars/", include("cars.urls")),
+    path("api/ops/", include("shared.urls")),
+    re_path(
+        rf"^{re.escape(settings.SEO_URL.lstrip('/'))}(?P<name>sitemap\.xml|(?:sitemap|products)-\d{{5}}\.xml\.gz)$",
+        seo_file,
+        name="seo-file",
+    ),
+]
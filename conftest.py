@@ -0,0 +1,7 @@
+"""Fixture plugins shared by every app's tests."""
+
+pytest_plugins = [
+    "shared.tests.helpers",
+    "accounts.tests.helpers",
+    "cars.tests.helpers",
+]
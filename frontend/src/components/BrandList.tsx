@@ -8,10 +8,10 @@
  */
 
 import { cn } from '@/lib/utils'
-import type { Brand } from '@/types/cars'
+import type { Brand, BrandWithStats } from '@/types/cars'
 
 export interface BrandListProps {
-  brands: Brand[]
+  brands: Array<Brand | BrandWithStats>
   selectedBrandId?: string
   onBrandClick?: (brandId: string | undefined) => void
   className?: string
@@ -65,6 +65,9 @@ export function BrandList({
             />
           )}
           <span className="font-medium">{brand.name}</span>
+          {'active_count' in brand && (
+            <span className="text-xs text-[var(--color-muted)]">{brand.active_count}</span>
+          )}
         </button>
       ))}
     </div>
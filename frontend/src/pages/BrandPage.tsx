@@ -13,14 +13,13 @@ import { BrandList } from '@/components/BrandList'
 import { CarGrid } from '@/components/CarGrid'
 import { activeApi } from '@/services/carsApi'
 import { ArrowLeft } from 'lucide-react'
-import type { Brand, CarListItem } from '@/types/cars'
+import type { BrandWithStats, CarListItem } from '@/types/cars'
 
 export function BrandPage() {
   const { brandId } = useParams<{ brandId: string }>()
   const navigate = useNavigate()
-  const [brands, setBrands] = React.useState<Brand[]>([])
+  const [brands, setBrands] = React.useState<BrandWithStats[]>([])
   const [cars, setCars] = React.useState<CarListItem[]>([])
-  const [currentBrand, setCurrentBrand] = React.useState<Brand | null>(null)
   const [isLoadingBrands, setIsLoadingBrands] = React.useState(true)
   const [isLoadingCars, setIsLoadingCars] = React.useState(true)
 
@@ -30,7 +29,7 @@ export function BrandPage() {
   React.useEffect(() => {
     const fetchBrands = async () => {
       try {
-        const data = await activeApi.getBrands()
+        const data = await activeApi.getBrandsWithStats()
         setBrands(data)
       } catch (error) {
         console.error('Failed to fetch brands:', error)
@@ -49,14 +48,9 @@ export function BrandPage() {
         if (isAllBrands) {
           const data = await activeApi.getCars()
           setCars(data)
-          setCurrentBrand(null)
         } else {
-          const [carsData, brandData] = await Promise.all([
-            activeApi.getCars({ brand: brandId }),
-            activeApi.getBrand(brandId!),
-          ])
-          setCars(carsData)
-          setCurrentBrand(brandData)
+          const data = await activeApi.getCars({ brand: brandId })
+          setCars(data)
         }
       } catch (error) {
         console.error('Failed to fetch cars:', error)
@@ -67,6 +61,9 @@ export function BrandPage() {
     fetchCars()
   }, [brandId, isAllBrands])
 
+  // Brand details come from the stats list, so no separate brand request
+  const currentBrand = isAllBrands ? null : brands.find((b) => b.id === brandId) ?? null
+
   const handleBrandClick = (id: string | undefined) => {
     if (id) {
       navigate(`/brand/${id}`)
@@ -24,12 +24,9 @@ export function HomePage() {
   React.useEffect(() => {
     const fetchData = async () => {
       try {
-        const [brandsData, carsData] = await Promise.all([
-          activeApi.getBrands(),
-          activeApi.getCars({ featured: true }),
-        ])
-        setBrands(brandsData)
-        setFeaturedCars(carsData)
+        const feed = await activeApi.getHomeFeed()
+        setBrands(feed.brands)
+        setFeaturedCars(feed.featured)
       } catch (error) {
         console.error('Failed to fetch data:', error)
       } finally {
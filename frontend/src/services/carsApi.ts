@@ -10,7 +10,7 @@
  */
 
 import { api, PaginatedResponse } from './api'
-import type { Brand, Car, CarListItem, InquiryForm, InquiryCreateResponse, CarFilters } from '@/types/cars'
+import type { Brand, BrandWithStats, Car, CarListItem, HomeFeed, InquiryForm, InquiryCreateResponse, CarFilters } from '@/types/cars'
 
 export const carsApi = {
   /**
@@ -21,6 +21,14 @@ export const carsApi = {
     return response.data
   },
 
+  /**
+   * Get all brands with active-listing stats (count, price range, years, image)
+   */
+  getBrandsWithStats: async (): Promise<BrandWithStats[]> => {
+    const response = await api.get<BrandWithStats[]>('/api/cars/brands/', { params: { stats: true } })
+    return response.data
+  },
+
   /**
    * Get a single brand by ID
    */
@@ -44,6 +52,14 @@ export const carsApi = {
     return response.data.results
   },
 
+  /**
+   * Get featured cars, newest arrivals and brands for the homepage in one request
+   */
+  getHomeFeed: async (): Promise<HomeFeed> => {
+    const response = await api.get<HomeFeed>('/api/cars/home/')
+    return response.data
+  },
+
   /**
    * Get a single car by ID with full details
    */
@@ -197,6 +213,24 @@ export const mockCarsApi = {
     return mockBrands
   },
 
+  getBrandsWithStats: async (): Promise<BrandWithStats[]> => {
+    await new Promise(resolve => setTimeout(resolve, 300))
+    return mockBrands.map(brand => {
+      const cars = mockCars.filter(c => c.brand.id === brand.id && c.status === 'active')
+      const prices = cars.map(c => Number(c.price))
+      const years = cars.map(c => c.year)
+      return {
+        ...brand,
+        active_count: cars.length,
+        min_price: cars.length ? Math.min(...prices).toFixed(2) : null,
+        max_price: cars.length ? Math.max(...prices).toFixed(2) : null,
+        year_min: cars.length ? Math.min(...years) : null,
+        year_max: cars.length ? Math.max(...years) : null,
+        representative_image: cars.find(c => c.is_featured)?.primary_image ?? cars[0]?.primary_image ?? null,
+      }
+    })
+  },
+
   getBrand: async (id: string): Promise<Brand> => {
     await new Promise(resolve => setTimeout(resolve, 200))
     const brand = mockBrands.find(b => b.id === id)
@@ -216,6 +250,15 @@ export const mockCarsApi = {
     return cars
   },
 
+  getHomeFeed: async (): Promise<HomeFeed> => {
+    await new Promise(resolve => setTimeout(resolve, 300))
+    return {
+      featured: mockCars.filter(c => c.is_featured),
+      newest: [...mockCars].sort((a, b) => b.created_at.localeCompare(a.created_at)).slice(0, 8),
+      brands: mockBrands,
+    }
+  },
+
   getCar: async (id: string): Promise<Car> => {
     await new Promise(resolve => setTimeout(resolve, 200))
     const car = mockCarDetails[id]
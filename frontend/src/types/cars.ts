@@ -13,6 +13,15 @@ export interface Brand {
   updated_at: string
 }
 
+export interface BrandWithStats extends Brand {
+  active_count: number
+  min_price: string | null
+  max_price: string | null
+  year_min: number | null
+  year_max: number | null
+  representative_image: string | null
+}
+
 export interface CarImage {
   id: string
   image_url: string
@@ -32,6 +41,9 @@ export interface CarListItem {
   is_featured: boolean
   status: CarStatus
   primary_image: string | null
+  country: string
+  region: string
+  distance_km: number | null
   created_at: string
 }
 
@@ -45,10 +57,20 @@ export interface Car {
   is_featured: boolean
   status: CarStatus
   images: CarImage[]
+  latitude: number | null
+  longitude: number | null
+  country: string
+  region: string
   created_at: string
   updated_at: string
 }
 
+export interface HomeFeed {
+  featured: CarListItem[]
+  newest: CarListItem[]
+  brands: Brand[]
+}
+
 export interface InquiryForm {
   car: string
   collector_name: string
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class SharedConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "shared"
+
+    def ready(self) -> None:
+        from shared import metrics
+        from shared.db_pool import pool_stats
+
+        metrics.register("db_pool", pool_stats)
+
+        if settings.DATABASE_SCHEMA and settings.DATABASE_URL and not settings.DB_POOL:
+            from django.db.backends.signals import connection_created
+
+            from shared.db import set_search_path
+
+            connection_created.connect(set_search_path, dispatch_uid="shared.set_search_path")
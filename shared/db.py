@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.conf import settings
+
+
+def set_search_path(sender: Any, connection: Any, **kwargs: Any) -> None:
+    """
+    Set search_path for per-app Neon schemas.
+
+    This runs after each connection is established, which works with
+    Neon's connection pooler (PgBouncer) — unlike passing search_path
+    via the connection string's options parameter.
+    """
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SET search_path TO %s, public", [settings.DATABASE_SCHEMA])
@@ -0,0 +1 @@
+"""Database backends that draw connections from shared.db_pool."""
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any
+
+from shared.db_pool import ConnectionPool, get_pool
+
+
+class PooledDatabaseWrapperMixin:
+    """
+    Mixin for Django DatabaseWrapper classes that checks connections out of
+    an in-process pool on connect() and returns them on close().
+
+    Pool options come from the database's "POOL" settings dict (see
+    shared.db_pool.ConnectionPool for the accepted keys).
+    """
+
+    alias: str
+    settings_dict: dict[str, Any]
+    connection: Any
+    in_atomic_block: bool
+    errors_occurred: bool
+
+    def get_pool(self) -> ConnectionPool:
+        return get_pool(self.alias, str(self.settings_dict["NAME"]), self.settings_dict.get("POOL", {}))
+
+    def get_new_connection(self, conn_params: dict[str, Any]) -> Any:
+        open_connection = super().get_new_connection  # type: ignore[misc]
+
+        def factory() -> Any:
+            return self.prepare_pooled_connection(open_connection(conn_params))
+
+        return self.get_pool().acquire(factory)
+
+    def prepare_pooled_connection(self, connection: Any) -> Any:
+        """One-time setup for a newly opened physical connection."""
+        return connection
+
+    def _close(self) -> None:
+        if self.connection is None:
+            return
+        # A connection closed mid-transaction or after an unrecoverable
+        # error is not safe to hand to the next request.
+        discard = self.in_atomic_block or (self.errors_occurred and not self.is_usable())
+        self.get_pool().release(self.connection, discard=discard)
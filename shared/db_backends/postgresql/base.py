@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.conf import settings
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgreSQLDatabaseWrapper
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+
+from shared.db_backends.pooled import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, PostgreSQLDatabaseWrapper):
+    """Pooled PostgreSQL backend with search_path applied once per connection."""
+
+    def get_new_connection(self, conn_params: dict[str, Any]) -> Any:
+        # The stock backend sets isolation_level while opening a connection;
+        # reused pooled connections skip that, so set it here for both paths.
+        isolation_level = self.settings_dict["OPTIONS"].get("isolation_level")
+        self.isolation_level = (
+            IsolationLevel.READ_COMMITTED if isolation_level is None else IsolationLevel(isolation_level)
+        )
+        return super().get_new_connection(conn_params)
+
+    def prepare_pooled_connection(self, connection: Any) -> Any:
+        if settings.DATABASE_SCHEMA:
+            with connection.cursor() as cursor:
+                cursor.execute("SET search_path TO %s, public", [settings.DATABASE_SCHEMA])
+            connection.commit()
+        return connection
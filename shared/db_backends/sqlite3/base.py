@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from django.db.backends.sqlite3.base import DatabaseWrapper as SQLiteDatabaseWrapper
+
+from shared.db_backends.pooled import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, SQLiteDatabaseWrapper):
+    """Pooled SQLite backend, used for local development and tests of the pool."""
@@ -0,0 +1,211 @@
+"""
+In-process database connection pool.
+
+Used by the pooled backends in shared.db_backends. Each worker process
+keeps up to `max_size` open DB-API connections per database alias and
+hands them to Django's connection wrapper on connect() instead of
+opening a new socket. Per-connection setup (search_path, isolation
+level, adapters) happens once when a physical connection is created.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes available within the timeout."""
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB-API connections.
+
+    Idle connections that sat unused for longer than `health_check_after`
+    seconds are pinged before reuse; connections older than
+    `max_lifetime` seconds are replaced.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any] | None = None,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 10.0,
+        health_check_after: float = 30.0,
+        max_lifetime: float = 3600.0,
+        ping: Callable[[Any], None] | None = None,
+    ) -> None:
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(f"Invalid pool size: min={min_size}, max={max_size}")
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_after = health_check_after
+        self.max_lifetime = max_lifetime
+        self.ping = ping or _ping
+        self._idle: deque[tuple[Any, float, float]] = deque()  # (conn, created_at, released_at)
+        self._created_at: dict[int, float] = {}
+        self._size = 0
+        self._warmed = False
+        self._condition = threading.Condition()
+        self._stats = {
+            "connections_created": 0,
+            "connections_reused": 0,
+            "connections_discarded": 0,
+            "health_checks": 0,
+            "waits": 0,
+            "timeouts": 0,
+        }
+
+    def acquire(self, factory: Callable[[], Any] | None = None) -> Any:
+        """
+        Check out a connection, opening or waiting for one if none is idle.
+
+        `factory` overrides the pool's factory for any connection opened
+        by this call.
+        """
+        factory = factory or self.factory
+        if not self._warmed:
+            self.warm(factory)
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            while True:
+                while self._idle:
+                    conn, created_at, released_at = self._idle.pop()
+                    if self._is_healthy(conn, created_at, released_at):
+                        self._stats["connections_reused"] += 1
+                        return conn
+                    self._discard(conn)
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise PoolTimeout(f"No connection available within {self.timeout}s (max_size={self.max_size})")
+                self._stats["waits"] += 1
+                self._condition.wait(remaining)
+        return self._create(factory)
+
+    def release(self, conn: Any, discard: bool = False) -> None:
+        """Return a connection to the pool, or close it if `discard` is set."""
+        with self._condition:
+            if discard or self._created_at.get(id(conn)) is None:
+                self._discard(conn)
+            else:
+                try:
+                    # Never hand out a connection with a transaction in progress.
+                    conn.rollback()
+                except Exception:
+                    self._discard(conn)
+                else:
+                    self._idle.append((conn, self._created_at[id(conn)], time.monotonic()))
+            self._condition.notify()
+
+    def warm(self, factory: Callable[[], Any] | None = None) -> None:
+        """Open connections until `min_size` are idle or checked out."""
+        with self._condition:
+            self._warmed = True
+            missing = max(self.min_size - self._size, 0)
+            self._size += missing
+        for _ in range(missing):
+            conn = self._create(factory or self.factory)
+            self.release(conn)
+
+    def close_all(self) -> None:
+        """Close every idle connection. Checked-out connections close on release."""
+        with self._condition:
+            while self._idle:
+                conn, _, _ = self._idle.pop()
+                self._discard(conn)
+            self._created_at.clear()
+            self._warmed = False
+
+    def stats(self) -> dict[str, int]:
+        with self._condition:
+            return {
+                **self._stats,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+            }
+
+    def _create(self, factory: Callable[[], Any]) -> Any:
+        try:
+            conn = factory()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._created_at[id(conn)] = time.monotonic()
+            self._stats["connections_created"] += 1
+        return conn
+
+    def _is_healthy(self, conn: Any, created_at: float, released_at: float) -> bool:
+        now = time.monotonic()
+        if now - created_at > self.max_lifetime:
+            return False
+        if now - released_at < self.health_check_after:
+            return True
+        self._stats["health_checks"] += 1
+        try:
+            self.ping(conn)
+        except Exception:
+            return False
+        return True
+
+    def _discard(self, conn: Any) -> None:
+        """Close a connection and free its slot. Caller holds the lock."""
+        self._created_at.pop(id(conn), None)
+        self._size -= 1
+        self._stats["connections_discarded"] += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def _ping(conn: Any) -> None:
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+    finally:
+        cursor.close()
+    conn.rollback()
+
+
+_pools: dict[tuple[str, str, int], ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias: str, name: str, options: dict[str, Any]) -> ConnectionPool:
+    """
+    Return the pool for a database alias and name in this process.
+
+    Pools are keyed by PID so a pool created before a fork (e.g. with
+    gunicorn --preload) is never shared with child workers, and by
+    database name so switching to a test database gets fresh connections.
+    """
+    key = (alias, name, os.getpid())
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(**options)
+        return pool
+
+
+def pool_stats() -> dict[str, dict[str, int]]:
+    """Stats for every pool in this process, keyed by database alias."""
+    pid = os.getpid()
+    with _pools_lock:
+        return {alias: pool.stats() for (alias, _, owner), pool in _pools.items() if owner == pid}
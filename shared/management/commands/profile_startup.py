@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# What a gunicorn worker does on boot: import the WSGI module, which runs
+# django.setup() and builds the handler (middleware chain included).
+BOOT_SNIPPET = "import config.wsgi"
+
+
+class Command(BaseCommand):
+    help = "Report per-module import time and wall-clock boot time for a fresh worker."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("--runs", type=int, default=5, help="Cold boots to time (default: 5).")
+        parser.add_argument("--top", type=int, default=25, help="Modules to list (default: 25).")
+        parser.add_argument(
+            "--sort",
+            choices=["self", "cumulative"],
+            default="self",
+            help="Rank modules by their own import time or including children.",
+        )
+        parser.add_argument("--prefix", help="Only list modules starting with this prefix (e.g. 'cars').")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "config.settings")}
+
+        modules = self.profile_imports(env)
+        packages: dict[str, int] = defaultdict(int)
+        for name, (self_us, _) in modules.items():
+            packages[name.split(".")[0]] += self_us
+
+        rank = 0 if options["sort"] == "self" else 1
+        listed = [
+            (name, timings)
+            for name, timings in modules.items()
+            if not options["prefix"] or name.startswith(options["prefix"])
+        ]
+        listed.sort(key=lambda item: item[1][rank], reverse=True)
+
+        self.stdout.write(f"{'self ms':>9} {'cumul ms':>9}  module")
+        for name, (self_us, cumulative_us) in listed[: options["top"]]:
+            self.stdout.write(f"{self_us / 1000:>9.1f} {cumulative_us / 1000:>9.1f}  {name}")
+
+        self.stdout.write("")
+        self.stdout.write(f"{'self ms':>9}  top-level package")
+        for name, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[: options["top"]]:
+            self.stdout.write(f"{self_us / 1000:>9.1f}  {name}")
+
+        timings = self.time_boots(env, options["runs"])
+        self.stdout.write("")
+        self.stdout.write(
+            f"Worker boot over {len(timings)} runs: "
+            f"min {min(timings):.0f} ms, median {statistics.median(timings):.0f} ms, max {max(timings):.0f} ms"
+        )
+
+    def profile_imports(self, env: dict[str, str]) -> dict[str, tuple[int, int]]:
+        """Run one cold boot under -X importtime and return {module: (self_us, cumulative_us)}."""
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", BOOT_SNIPPET],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            raise CommandError(f"Boot failed:\n{result.stderr[-2000:]}")
+
+        modules: dict[str, tuple[int, int]] = {}
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            self_us, cumulative_us, name = line.removeprefix("import time:").split("|", 2)
+            modules[name.strip()] = (int(self_us), int(cumulative_us))
+        return modules
+
+    def time_boots(self, env: dict[str, str], runs: int) -> list[float]:
+        """Wall-clock milliseconds for `runs` fresh interpreter boots."""
+        timings = []
+        for _ in range(max(runs, 1)):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, "-c", BOOT_SNIPPET], cwd=settings.BASE_DIR, env=env, check=True)
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings
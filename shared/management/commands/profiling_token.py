@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from shared.profiling import make_token
+
+
+class Command(BaseCommand):
+    help = "Print a signed X-Profile-Token header value that forces a request to be profiled."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if not settings.PROFILING_ENABLED:
+            self.stderr.write("PROFILING_ENABLED is off; the token will be ignored until it is enabled.")
+        self.stdout.write(make_token())
+        self.stderr.write(f"Valid for {settings.PROFILING_TOKEN_MAX_AGE}s. Send as: X-Profile-Token: <token>")
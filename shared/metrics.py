@@ -0,0 +1,20 @@
+"""
+Process-local metrics registry for the ops endpoints.
+
+Apps register a zero-argument callable returning a JSON-serialisable
+dict; GET /api/ops/metrics/ reports all of them for the worker process
+serving the request.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+_providers: dict[str, Callable[[], dict[str, Any]]] = {}
+
+
+def register(name: str, provider: Callable[[], dict[str, Any]]) -> None:
+    _providers[name] = provider
+
+
+def collect() -> dict[str, dict[str, Any]]:
+    return {name: provider() for name, provider in _providers.items()}
@@ -0,0 +1,134 @@
+"""
+Opt-in request profiling.
+
+ProfilingMiddleware runs a sampled fraction of requests, plus any request
+carrying a valid signed X-Profile-Token header, under cProfile and writes
+the stats to PROFILING_DIR/<url name>/<file>.prof. It is only added to
+MIDDLEWARE when PROFILING_ENABLED is set, so a disabled profiler costs
+nothing. Profiles are listed and downloaded through /api/ops/profiles/.
+
+Only one profiler can be active per process (from Python 3.12, enabling a
+second raises ValueError), so a request that would be profiled while
+another one is, or while some other tool holds the profiler, is served
+without profiling.
+"""
+from __future__ import annotations
+
+import cProfile
+import random
+import re
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core import signing
+from django.http import HttpRequest, HttpResponse
+
+TOKEN_HEADER = "HTTP_X_PROFILE_TOKEN"
+TOKEN_SALT = "shared.profiling"
+TOKEN_VALUE = "profile"
+NAME_RE = re.compile(r"^[\w.-]+$")
+FILE_RE = re.compile(r"^(?P<started>\d+)-(?P<duration>\d+)ms-[0-9a-f]{8}\.prof$")
+
+_profiler_lock = threading.Lock()
+
+
+def make_token() -> str:
+    """Signed value for the X-Profile-Token header, valid for PROFILING_TOKEN_MAX_AGE seconds."""
+    return signing.TimestampSigner(salt=TOKEN_SALT).sign(TOKEN_VALUE)
+
+
+def token_is_valid(token: str) -> bool:
+    try:
+        value = signing.TimestampSigner(salt=TOKEN_SALT).unsign(token, max_age=settings.PROFILING_TOKEN_MAX_AGE)
+    except signing.BadSignature:
+        return False
+    return value == TOKEN_VALUE
+
+
+class ProfilingMiddleware:
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not self.should_profile(request) or not _profiler_lock.acquire(blocking=False):
+            return self.get_response(request)
+
+        try:
+            profiler = cProfile.Profile()
+            started = time.time()
+            try:
+                profiler.enable()
+            except ValueError:  # Another profiling tool is already active
+                return self.get_response(request)
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+        finally:
+            _profiler_lock.release()
+        duration_ms = round((time.time() - started) * 1000)
+
+        match = request.resolver_match
+        url_name = (match.view_name if match else None) or "unresolved"
+        profile_id = save_profile(profiler, url_name.replace(":", "."), started, duration_ms)
+        response["X-Profile-Id"] = profile_id
+        return response
+
+    def should_profile(self, request: HttpRequest) -> bool:
+        token = request.META.get(TOKEN_HEADER)
+        if token:
+            return token_is_valid(token)
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+
+def profile_dir() -> Path:
+    return Path(settings.PROFILING_DIR)
+
+
+def save_profile(profiler: cProfile.Profile, url_name: str, started: float, duration_ms: int) -> str:
+    """Write the stats and prune the oldest files for this URL name. Returns the profile id."""
+    directory = profile_dir() / url_name
+    directory.mkdir(parents=True, exist_ok=True)
+    filename = f"{int(started * 1000)}-{duration_ms}ms-{uuid.uuid4().hex[:8]}.prof"
+    profiler.dump_stats(directory / filename)
+
+    existing = sorted(directory.glob("*.prof"))
+    for old in existing[: max(len(existing) - settings.PROFILING_MAX_PER_VIEW, 0)]:
+        old.unlink(missing_ok=True)
+    return f"{url_name}/{filename}"
+
+
+def list_profiles(url_name: str | None = None) -> list[dict[str, Any]]:
+    """Stored profiles, newest first."""
+    root = profile_dir()
+    if not root.is_dir():
+        return []
+    profiles = []
+    for path in root.glob(f"{url_name or '*'}/*.prof"):
+        match = FILE_RE.match(path.name)
+        if not match:
+            continue
+        profiles.append(
+            {
+                "id": f"{path.parent.name}/{path.name}",
+                "url_name": path.parent.name,
+                "started_at": int(match["started"]) / 1000,
+                "duration_ms": int(match["duration"]),
+                "size": path.stat().st_size,
+            }
+        )
+    profiles.sort(key=lambda profile: profile["started_at"], reverse=True)
+    return profiles
+
+
+def resolve_profile(url_name: str, filename: str) -> Path | None:
+    """Path to a stored profile, or None if the names are invalid or the file doesn't exist."""
+    if not NAME_RE.match(url_name) or not FILE_RE.match(filename):
+        return None
+    path = profile_dir() / url_name / filename
+    return path if path.is_file() else None
@@ -5,11 +5,57 @@ App-specific helpers belong in their respective app's tests/ directory.
 """
 from __future__ import annotations
 
+from functools import partial
+from typing import Callable
+
 import pytest
+from django.db import connection
+from django.test import override_settings
 from rest_framework.test import APIClient
 
+from shared.tests.query_snapshots import UPDATE_OPTION, QuerySnapshot
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        UPDATE_OPTION,
+        action="store_true",
+        help="Rewrite query snapshot files instead of comparing against them.",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_settings():
+    """
+    Session-wide settings for speed and worker isolation.
+
+    MD5 hashing keeps create_user() cheap. Each process gets a private
+    in-memory cache: with Redis, parallel workers would share keys, and
+    one worker's cache.clear() would wipe another's throttles mid-test.
+    """
+    with override_settings(
+        PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"],
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    ):
+        yield
+
 
 @pytest.fixture
 def api_client() -> APIClient:
     """Return an unauthenticated API client."""
     return APIClient()
+
+
+@pytest.fixture
+def query_snapshot(request: pytest.FixtureRequest) -> Callable[..., QuerySnapshot]:
+    """
+    Return a QuerySnapshot factory bound to the test's app:
+    `with query_snapshot("car-list", "GET /api/cars/"): ...`
+    """
+    if connection.vendor != "sqlite":
+        pytest.skip("Query snapshots are recorded against SQLite")
+    return partial(
+        QuerySnapshot,
+        directory=request.path.parent / "query_snapshots",
+        update=request.config.getoption(UPDATE_OPTION),
+    )
@@ -0,0 +1,112 @@
+"""
+Query snapshots for endpoint tests.
+
+A snapshot is a text file holding every SQL statement a request ran, in
+order, with SQLite's EXPLAIN QUERY PLAN under each read or write. Ids,
+timestamps and savepoint names are masked so the file only changes when
+the query shape does. Files live in `<app>/tests/query_snapshots/` and
+are reviewed like code; rewrite them with
+`pytest --update-query-snapshots` after an intended change.
+"""
+from __future__ import annotations
+
+import difflib
+import re
+from pathlib import Path
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+UPDATE_OPTION = "--update-query-snapshots"
+
+_MASKS = [
+    (re.compile(r"'[0-9a-f]{32}'|'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'"), "'<uuid>'"),
+    (re.compile(r'"s\d+_x\d+"'), '"<savepoint>"'),
+    (re.compile(r"'\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(\.\d+)?([+-]\d{2}:\d{2})?'"), "'<timestamp>'"),
+]
+_PATH_UUID = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+_EXPLAINED = ("SELECT", "WITH", "UPDATE", "DELETE")
+_INDEX = re.compile(r"USING (?:COVERING )?INDEX (\w+)")
+_SCAN = re.compile(r"^--\s+SCAN (\w+)$", re.MULTILINE)  # Full scan; index scans say USING
+
+
+def normalize(sql: str) -> str:
+    for pattern, placeholder in _MASKS:
+        sql = pattern.sub(placeholder, sql)
+    return sql
+
+
+def explain(sql: str) -> list[str]:
+    """SQLite's plan for a statement, one line per step, indented by depth."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+        rows = cursor.fetchall()
+    depth = {0: -1}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node_id] + detail)
+    return lines
+
+
+def render(label: str, queries: list[str]) -> str:
+    parts = [f"-- {label}", f"-- {len(queries)} statements"]
+    for number, sql in enumerate(queries, 1):
+        parts += ["", f"-- [{number}]", normalize(sql) + ";"]
+        if sql.lstrip().upper().startswith(_EXPLAINED):
+            parts += ["-- plan:", *(f"--   {line}" for line in explain(sql))]
+    return "\n".join(parts) + "\n"
+
+
+class QuerySnapshot:
+    """
+    Capture the statements run inside the block and compare them with the
+    stored snapshot. Any difference fails the test; lost indexes, new table
+    scans and a higher statement count are called out above the diff.
+    """
+
+    def __init__(self, name: str, label: str, directory: Path, update: bool = False) -> None:
+        self.path = directory / f"{name}.sql"
+        self.label = _PATH_UUID.sub("<id>", label)
+        self.update = update
+        self._capture = CaptureQueriesContext(connection)
+
+    def __enter__(self) -> QuerySnapshot:
+        self._capture.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._capture.__exit__(exc_type, exc, tb)
+        if exc_type is not None:
+            return
+        actual = render(self.label, [query["sql"] for query in self._capture.captured_queries])
+        if self.update:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(actual)
+            return
+        if not self.path.exists():
+            pytest.fail(f"No query snapshot at {self.path}; run pytest {UPDATE_OPTION} to record it")
+        expected = self.path.read_text()
+        if actual != expected:
+            pytest.fail(self._describe(expected, actual), pytrace=False)
+
+    def _describe(self, expected: str, actual: str) -> str:
+        problems = []
+        before, after = len(self._statements(expected)), len(self._statements(actual))
+        if after > before:
+            problems.append(f"{after - before} statement(s) added ({before} -> {after})")
+        for index in sorted(set(_INDEX.findall(expected)) - set(_INDEX.findall(actual))):
+            problems.append(f"index no longer used: {index}")
+        for table in sorted(set(_SCAN.findall(actual)) - set(_SCAN.findall(expected))):
+            problems.append(f"new full scan of {table}")
+        diff = difflib.unified_diff(
+            expected.splitlines(), actual.splitlines(), str(self.path), "actual", lineterm=""
+        )
+        hint = f"If the change is intended, run pytest {UPDATE_OPTION} and commit the snapshot."
+        header = f"Query snapshot {self.path.name} changed ({self.label})"
+        return "\n".join([header, *problems, "", *diff, "", hint])
+
+    @staticmethod
+    def _statements(text: str) -> list[str]:
+        return re.findall(r"^-- \[\d+\]$", text, re.MULTILINE)
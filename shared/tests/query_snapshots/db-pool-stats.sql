@@ -0,0 +1,2 @@
+-- GET /api/ops/db-pool/
+-- 0 statements
@@ -0,0 +1,35 @@
+-- GET /api/ops/metrics/
+-- 6 statements
+
+-- [1]
+SELECT MAX("listing_events"."id") AS "head" FROM "listing_events";
+-- plan:
+--   SEARCH listing_events
+
+-- [2]
+SELECT "outbox_checkpoints"."name", "outbox_checkpoints"."last_txid", "outbox_checkpoints"."last_event_id", "outbox_checkpoints"."failures" FROM "outbox_checkpoints";
+-- plan:
+--   SCAN outbox_checkpoints
+
+-- [3]
+SELECT "outbox_dead_letters"."handler", COUNT("outbox_dead_letters"."id") AS "count" FROM "outbox_dead_letters" GROUP BY "outbox_dead_letters"."handler";
+-- plan:
+--   SCAN outbox_dead_letters
+--   USE TEMP B-TREE FOR GROUP BY
+
+-- [4]
+SELECT COUNT(*) AS "__count" FROM "listing_events" WHERE ("listing_events"."txid" > 0 OR ("listing_events"."id" > 0 AND "listing_events"."txid" = 0));
+-- plan:
+--   SEARCH listing_events USING COVERING INDEX listing_event_delivery_idx (txid>?)
+
+-- [5]
+SELECT COUNT(*) AS "__count" FROM "listing_events" WHERE ("listing_events"."txid" > 0 OR ("listing_events"."id" > 0 AND "listing_events"."txid" = 0));
+-- plan:
+--   SEARCH listing_events USING COVERING INDEX listing_event_delivery_idx (txid>?)
+
+-- [6]
+SELECT COUNT(*) FROM (SELECT DISTINCT "car_counter_shards"."car_id" AS "col1" FROM "car_counter_shards" WHERE ("car_counter_shards"."views" > 0 OR "car_counter_shards"."inquiries" > 0)) subquery;
+-- plan:
+--   CO-ROUTINE subquery
+--     SCAN car_counter_shards USING INDEX sqlite_autoindex_car_counter_shards_1
+--   SCAN subquery
@@ -0,0 +1,100 @@
+"""Tests for the in-process database connection pool."""
+from __future__ import annotations
+
+import sqlite3
+import threading
+
+import pytest
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from shared.db_pool import ConnectionPool, PoolTimeout
+
+
+def sqlite_factory() -> sqlite3.Connection:
+    return sqlite3.connect(":memory:", check_same_thread=False)
+
+
+class TestConnectionPool:
+    """Tests for ConnectionPool against SQLite connections."""
+
+    def test_warms_min_size_and_reuses_connections(self):
+        """The first acquire should open min_size connections; later ones reuse them."""
+        pool = ConnectionPool(sqlite_factory, min_size=2, max_size=4)
+
+        first = pool.acquire()
+        pool.release(first)
+        second = pool.acquire()
+
+        assert second is first
+        stats = pool.stats()
+        assert stats["connections_created"] == 2
+        assert stats["connections_reused"] == 2
+        assert stats["size"] == 2
+        assert stats["in_use"] == 1
+
+    def test_waits_then_times_out_at_max_size(self):
+        """Acquire should raise PoolTimeout when max_size connections are checked out."""
+        pool = ConnectionPool(sqlite_factory, min_size=0, max_size=1, timeout=0.05)
+        pool.acquire()
+
+        with pytest.raises(PoolTimeout):
+            pool.acquire()
+
+        assert pool.stats()["timeouts"] == 1
+
+    def test_waiting_acquire_gets_released_connection(self):
+        """A blocked acquire should receive a connection released by another thread."""
+        pool = ConnectionPool(sqlite_factory, min_size=0, max_size=1, timeout=2)
+        held = pool.acquire()
+        timer = threading.Timer(0.05, pool.release, args=[held])
+        timer.start()
+
+        assert pool.acquire() is held
+        timer.join()
+        assert pool.stats()["waits"] >= 1
+
+    def test_unhealthy_idle_connection_is_replaced(self):
+        """Idle connections that fail the ping should be discarded and replaced."""
+        pool = ConnectionPool(sqlite_factory, min_size=0, max_size=2, health_check_after=0)
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.close()  # Simulate the server dropping the connection
+
+        replacement = pool.acquire()
+
+        assert replacement is not conn
+        replacement.execute("SELECT 1")
+        stats = pool.stats()
+        assert stats["health_checks"] == 1
+        assert stats["connections_discarded"] == 1
+        assert stats["size"] == 1
+
+    def test_discarded_release_frees_slot(self):
+        """Releasing with discard=True should close the connection and free its slot."""
+        pool = ConnectionPool(sqlite_factory, min_size=0, max_size=1)
+        conn = pool.acquire()
+
+        pool.release(conn, discard=True)
+
+        assert pool.stats()["size"] == 0
+        assert pool.acquire() is not conn
+
+    def test_invalid_sizes_rejected(self):
+        """min_size larger than max_size should be rejected."""
+        with pytest.raises(ValueError):
+            ConnectionPool(sqlite_factory, min_size=3, max_size=2)
+
+
+@pytest.mark.django_db
+def test_pool_stats_requires_staff(api_client: APIClient) -> None:
+    """GET /api/ops/db-pool/ is limited to staff users."""
+    user = User.objects.create_user(email="ops@example.com", password="x", is_staff=True)
+
+    assert api_client.get("/api/ops/db-pool/").status_code == 401
+
+    api_client.force_authenticate(user)
+    response = api_client.get("/api/ops/db-pool/")
+
+    assert response.status_code == 200
+    assert isinstance(response.data, dict)
@@ -0,0 +1,126 @@
+"""Tests for opt-in request profiling."""
+from __future__ import annotations
+
+import cProfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from shared.profiling import ProfilingMiddleware, make_token
+
+
+@pytest.fixture
+def profiling(settings, tmp_path):
+    settings.PROFILING_DIR = tmp_path
+    settings.PROFILING_SAMPLE_RATE = 0
+    settings.MIDDLEWARE = ["shared.profiling.ProfilingMiddleware", *settings.MIDDLEWARE]
+    return tmp_path
+
+
+@pytest.fixture
+def staff_client() -> APIClient:
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user(email="ops@example.com", password="x", is_staff=True))
+    return client
+
+
+@pytest.mark.django_db
+class TestProfilingMiddleware:
+    """Tests for sampling and signed-header profiling."""
+
+    def test_unsampled_request_not_profiled(self, api_client: APIClient, profiling):
+        """Requests outside the sample and without a token should not be profiled."""
+        response = api_client.get("/api/cars/")
+
+        assert "X-Profile-Id" not in response
+        assert list(profiling.iterdir()) == []
+
+    def test_signed_header_forces_profile(self, api_client: APIClient, profiling):
+        """A valid X-Profile-Token should store a profile under the URL name."""
+        response = api_client.get("/api/cars/", HTTP_X_PROFILE_TOKEN=make_token())
+
+        url_name, filename = response["X-Profile-Id"].split("/")
+        assert url_name == "cars.car-list"
+        assert (profiling / url_name / filename).is_file()
+
+    def test_bad_token_ignored(self, api_client: APIClient, profiling):
+        """A tampered token should not trigger profiling."""
+        response = api_client.get("/api/cars/", HTTP_X_PROFILE_TOKEN=make_token() + "x")
+
+        assert "X-Profile-Id" not in response
+
+    def test_sample_rate(self, api_client: APIClient, profiling, settings):
+        """PROFILING_SAMPLE_RATE=1 should profile every request."""
+        settings.PROFILING_SAMPLE_RATE = 1
+
+        assert "X-Profile-Id" in api_client.get("/api/cars/")
+
+    def test_keeps_newest_per_view(self, api_client: APIClient, profiling, settings):
+        """Only PROFILING_MAX_PER_VIEW profiles should be kept per URL name."""
+        settings.PROFILING_MAX_PER_VIEW = 2
+        for _ in range(4):
+            api_client.get("/api/cars/", HTTP_X_PROFILE_TOKEN=make_token())
+
+        assert len(list((profiling / "cars.car-list").iterdir())) == 2
+
+    def test_concurrent_requests_profile_one_at_a_time(self, profiling):
+        """Of two overlapping profiled requests, one should be profiled and both should be served."""
+        inside = threading.Barrier(2, timeout=5)
+
+        def view(request):
+            inside.wait()  # Both requests are in flight together
+            return HttpResponse("ok")
+
+        middleware = ProfilingMiddleware(view)
+        requests = [RequestFactory().get("/", HTTP_X_PROFILE_TOKEN=make_token()) for _ in range(2)]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            responses = list(pool.map(middleware, requests))
+
+        assert [response.status_code for response in responses] == [200, 200]
+        assert sum("X-Profile-Id" in response for response in responses) == 1
+
+    def test_active_profiler_elsewhere(self, api_client: APIClient, profiling, monkeypatch):
+        """If another profiling tool is active, the request should be served unprofiled."""
+
+        def enable(self):
+            raise ValueError("Another profiling tool is already active")
+
+        monkeypatch.setattr(cProfile.Profile, "enable", enable)
+        response = api_client.get("/api/cars/", HTTP_X_PROFILE_TOKEN=make_token())
+
+        assert response.status_code == 200
+        assert "X-Profile-Id" not in response
+
+
+@pytest.mark.django_db
+class TestProfileAPI:
+    """Tests for listing and downloading stored profiles."""
+
+    def test_requires_staff(self, api_client: APIClient, profiling):
+        """GET /api/ops/profiles/ is limited to staff users."""
+        assert api_client.get("/api/ops/profiles/").status_code == 401
+
+    def test_list_and_download(self, api_client: APIClient, staff_client: APIClient, profiling):
+        """GET /api/ops/profiles/ should list profiles that can then be downloaded or read as text."""
+        profile_id = api_client.get("/api/cars/", HTTP_X_PROFILE_TOKEN=make_token())["X-Profile-Id"]
+
+        listed = staff_client.get("/api/ops/profiles/", {"url_name": "cars.car-list"}).data
+        assert [p["id"] for p in listed] == [profile_id]
+
+        download = staff_client.get(f"/api/ops/profiles/{profile_id}/")
+        assert download.status_code == 200
+        assert b"".join(download.streaming_content)
+
+        text = staff_client.get(f"/api/ops/profiles/{profile_id}/", {"output": "text"})
+        assert "cumulative" in text.content.decode()
+
+    def test_download_rejects_unknown_names(self, staff_client: APIClient, profiling):
+        """GET /api/ops/profiles/{url_name}/{filename}/ should 404 for anything that isn't a stored profile."""
+        response = staff_client.get("/api/ops/profiles/cars.car-list/..%2F..%2Fsettings.py/")
+
+        assert response.status_code == 404
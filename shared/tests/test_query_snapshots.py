@@ -0,0 +1,25 @@
+"""Query snapshots for the ops endpoints."""
+from __future__ import annotations
+
+import pytest
+from rest_framework.test import APIClient
+
+from accounts.tests.helpers import create_user
+
+
+@pytest.mark.django_db
+class TestOpsQuerySnapshots:
+    """Each endpoint's SQL and plans should match its reviewed snapshot."""
+
+    @pytest.mark.parametrize(
+        "name, path",
+        [("ops-metrics", "/api/ops/metrics/"), ("db-pool-stats", "/api/ops/db-pool/")],
+    )
+    def test_endpoint_queries(self, api_client: APIClient, query_snapshot, name: str, path: str):
+        """Requests should run exactly the snapshotted statements with the snapshotted plans."""
+        api_client.force_authenticate(create_user(email="staff@example.com", is_staff=True))
+
+        with query_snapshot(name, f"GET {path}"):
+            response = api_client.get(path)
+
+        assert response.status_code == 200
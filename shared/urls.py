@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from django.urls import path
+
+from shared.views import DatabasePoolStatsView, MetricsView, ProfileDownloadView, ProfileListView
+
+urlpatterns = [
+    path("db-pool/", DatabasePoolStatsView.as_view(), name="db-pool-stats"),
+    path("metrics/", MetricsView.as_view(), name="ops-metrics"),
+    path("profiles/", ProfileListView.as_view(), name="profile-list"),
+    path("profiles/<str:url_name>/<str:filename>/", ProfileDownloadView.as_view(), name="profile-download"),
+]
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import io
+import pstats
+
+from django.http import FileResponse, Http404, HttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from shared import metrics, profiling
+from shared.db_pool import pool_stats
+
+
+class DatabasePoolStatsView(APIView):
+    """
+    GET /api/ops/db-pool/
+    Connection pool stats for the worker process serving the request (staff only).
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Request) -> Response:
+        return Response(pool_stats())
+
+
+class MetricsView(APIView):
+    """
+    GET /api/ops/metrics/
+    Registered metrics (cache hit ratios etc.) for the worker process serving the request (staff only).
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Request) -> Response:
+        return Response(metrics.collect())
+
+
+class ProfileListView(APIView):
+    """
+    GET /api/ops/profiles/?url_name=<name>
+    Request profiles stored on this host, newest first (staff only).
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Request) -> Response:
+        url_name = request.query_params.get("url_name")
+        if url_name and not profiling.NAME_RE.match(url_name):
+            return Response([])
+        return Response(profiling.list_profiles(url_name))
+
+
+class ProfileDownloadView(APIView):
+    """
+    GET /api/ops/profiles/{url_name}/{filename}/
+    Download a stored .prof file, or ?output=text for the top functions by
+    cumulative time (staff only).
+    """
+
+    permission_classes = [IsAdminUser]
+    TEXT_LIMIT = 50
+
+    def get(self, request: Request, url_name: str, filename: str) -> HttpResponse:
+        path = profiling.resolve_profile(url_name, filename)
+        if path is None:
+            raise Http404
+        if request.query_params.get("output") == "text":
+            output = io.StringIO()
+            pstats.Stats(str(path), stream=output).sort_stats("cumulative").print_stats(self.TEXT_LIMIT)
+            return HttpResponse(output.getvalue(), content_type="text/plain")
+        return FileResponse(path.open("rb"), as_attachment=True, filename=f"{url_name}-{filename}")